@@ -35,7 +35,7 @@ from autoastro.hyper import hyper_data
 from autolens import simulator
 from autolens import masked
 from autolens.lens.plane import Plane
-from autolens.lens.ray_tracing import Tracer
+from autolens.lens.ray_tracing import Tracer, TracerBatch, TracerTemplate
 from autolens import util
 from autolens.fit.fit import fit
 from autolens.fit.fit import PositionsFit as fit_positions
@@ -5,6 +5,14 @@ class RayTracingException(af.exc.FitException):
     pass
 
 
+class TracerBatchException(Exception):
+    pass
+
+
+class CompiledPlaneException(Exception):
+    pass
+
+
 class PlottingException(Exception):
     pass
 
@@ -19,3 +27,7 @@ class PixelizationException(af.exc.FitException):
 
 class SettingsException(Exception):
     pass
+
+
+class LikelihoodBoundException(af.exc.FitException):
+    pass
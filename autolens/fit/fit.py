@@ -1,11 +1,18 @@
 import numpy as np
 
 from autoarray.fit import fit as aa_fit
+from autoarray.util import fit_util
 from autoastro.galaxy import galaxy as g
 from autolens.masked import masked_dataset as md
 
 
-def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=None):
+def fit(
+    masked_dataset,
+    tracer,
+    hyper_image_sky=None,
+    hyper_background_noise=None,
+    record_galaxy_images=False,
+):
 
     if isinstance(masked_dataset, md.MaskedImaging):
         return ImagingFit(
@@ -13,6 +20,7 @@ def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=Non
             tracer=tracer,
             hyper_image_sky=hyper_image_sky,
             hyper_background_noise=hyper_background_noise,
+            record_galaxy_images=record_galaxy_images,
         )
     elif isinstance(masked_dataset, md.MaskedInterferometer):
         return InterferometerFit(
@@ -24,17 +32,30 @@ def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=Non
 
 class ImagingFit(aa_fit.ImagingFit):
     def __init__(
-        self, masked_imaging, tracer, hyper_image_sky=None, hyper_background_noise=None
+        self,
+        masked_imaging,
+        tracer,
+        hyper_image_sky=None,
+        hyper_background_noise=None,
+        record_galaxy_images=False,
     ):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
 
+        If *record_galaxy_images* is *True*, the blurred profile image is computed galaxy-by-galaxy and the \
+        unblurred and blurred images of every galaxy and plane are recorded, such that *galaxy_model_image_dict* \
+        and *model_images_of_planes* are lookups rather than tracing, evaluating and convolving every galaxy \
+        again. This costs one convolution per galaxy instead of one in total, so it is used for the fits of \
+        results and visualization rather than likelihood evaluations.
+
         Parameters
         -----------
         tracer : ray_tracing.Tracer
             The tracer, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        record_galaxy_images : bool
+            Whether the images of every galaxy and plane are recorded when the blurred profile image is computed.
         """
 
         self.masked_dataset = masked_imaging
@@ -50,11 +71,24 @@ class ImagingFit(aa_fit.ImagingFit):
             hyper_background_noise=hyper_background_noise,
         )
 
-        self.blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
+        self.profile_images_of_planes_and_galaxies = None
+        self.blurred_profile_images_of_planes_and_galaxies = None
+        self.profile_images_of_planes = None
+        self.blurred_profile_images_of_planes = None
+
+        if record_galaxy_images:
+            self.record_galaxy_images_of_tracer(
+                tracer=tracer, masked_imaging=masked_imaging
+            )
+            self.blurred_profile_image = summed_array_from_arrays_and_mask(
+                arrays=self.blurred_profile_images_of_planes, mask=masked_imaging.mask
+            )
+        else:
+            self.blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+            )
 
         self.profile_subtracted_image = image - self.blurred_profile_image
 
@@ -86,6 +120,52 @@ class ImagingFit(aa_fit.ImagingFit):
             inversion=inversion,
         )
 
+    def record_galaxy_images_of_tracer(self, tracer, masked_imaging):
+        """Compute and record the unblurred and blurred profile images of every galaxy and plane of the tracer, \
+        where every galaxy is evaluated once and the images of every plane are the sums of its galaxies' images \
+        (the PSF convolution being linear).
+
+        The blurred images do not use the tracer's *FixedGalaxyBlurredImagesCache*, as every galaxy's blurred \
+        image is required."""
+
+        grid = masked_imaging.grid
+
+        self.profile_images_of_planes_and_galaxies, blurring_images_of_planes_and_galaxies = tracer.profile_images_of_planes_and_galaxies_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=masked_imaging.blurring_grid
+        )
+
+        self.blurred_profile_images_of_planes_and_galaxies = [
+            [
+                masked_imaging.convolver.convolved_image_from_image_and_blurring_image(
+                    image=profile_image, blurring_image=blurring_image
+                )
+                for profile_image, blurring_image in zip(
+                    profile_images_of_galaxies, blurring_images_of_galaxies
+                )
+            ]
+            for profile_images_of_galaxies, blurring_images_of_galaxies in zip(
+                self.profile_images_of_planes_and_galaxies,
+                blurring_images_of_planes_and_galaxies,
+            )
+        ]
+
+        self.profile_images_of_planes = [
+            grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=sum(
+                    map(np.asarray, profile_images_of_galaxies),
+                    np.zeros(grid.sub_shape_1d),
+                )
+            )
+            for profile_images_of_galaxies in self.profile_images_of_planes_and_galaxies
+        ]
+
+        self.blurred_profile_images_of_planes = [
+            summed_array_from_arrays_and_mask(
+                arrays=blurred_profile_images_of_galaxies, mask=masked_imaging.mask
+            )
+            for blurred_profile_images_of_galaxies in self.blurred_profile_images_of_planes_and_galaxies
+        ]
+
     @property
     def grid(self):
         return self.masked_imaging.grid
@@ -95,11 +175,23 @@ class ImagingFit(aa_fit.ImagingFit):
         """
         A dictionary associating galaxies with their corresponding model images
         """
-        galaxy_model_image_dict = self.tracer.galaxy_blurred_profile_image_dict_from_grid_and_convolver(
-            grid=self.grid,
-            convolver=self.masked_imaging.convolver,
-            blurring_grid=self.masked_imaging.blurring_grid,
-        )
+        if self.blurred_profile_images_of_planes_and_galaxies is not None:
+            galaxy_model_image_dict = {
+                galaxy: blurred_profile_image
+                for plane, blurred_profile_images_of_galaxies in zip(
+                    self.tracer.planes,
+                    self.blurred_profile_images_of_planes_and_galaxies,
+                )
+                for galaxy, blurred_profile_image in zip(
+                    plane.galaxies, blurred_profile_images_of_galaxies
+                )
+            }
+        else:
+            galaxy_model_image_dict = self.tracer.galaxy_blurred_profile_image_dict_from_grid_and_convolver(
+                grid=self.grid,
+                convolver=self.masked_imaging.convolver,
+                blurring_grid=self.masked_imaging.blurring_grid,
+            )
 
         # TODO : Extend to multiple inversioons across Planes
 
@@ -118,17 +210,23 @@ class ImagingFit(aa_fit.ImagingFit):
     @property
     def model_images_of_planes(self):
 
-        model_images_of_planes = self.tracer.blurred_profile_images_of_planes_from_grid_and_psf(
-            grid=self.grid,
-            psf=self.masked_imaging.psf,
-            blurring_grid=self.masked_imaging.blurring_grid,
-        )
+        if self.blurred_profile_images_of_planes is not None:
+            model_images_of_planes = list(self.blurred_profile_images_of_planes)
+        else:
+            model_images_of_planes = self.tracer.blurred_profile_images_of_planes_from_grid_and_psf(
+                grid=self.grid,
+                psf=self.masked_imaging.psf,
+                blurring_grid=self.masked_imaging.blurring_grid,
+            )
+
+        # The recorded images are not modified in-place, as they are shared by every call.
 
         for plane_index in self.tracer.plane_indexes_with_pixelizations:
 
-            model_images_of_planes[
-                plane_index
-            ] += self.inversion.mapped_reconstructed_image
+            model_images_of_planes[plane_index] = (
+                model_images_of_planes[plane_index]
+                + self.inversion.mapped_reconstructed_image
+            )
 
         return model_images_of_planes
 
@@ -290,11 +388,53 @@ class InterferometerFit(aa_fit.InterferometerFit):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+def squared_maximum_separations_from_position_sets(position_sets):
+    """The square of the maximum separation of every set of (y,x) coordinates in a list of sets, which may have \
+    different numbers of coordinates.
+
+    The sets are padded with NaNs to the length of the longest set and stacked into a single ndarray, such that \
+    the squared separations of every pair of coordinates in every set are computed in one vectorized operation \
+    rather than a loop over coordinates. Square roots are not taken, such that thresholds can be compared to their \
+    square.
+
+    Parameters
+    ----------
+    position_sets : [ndarray]
+        The sets of (y,x) coordinates, each of shape (total_positions, 2).
+    """
+
+    set_lengths = np.array([position_set.shape[0] for position_set in position_sets])
+
+    padded_position_sets = np.full((len(position_sets), np.max(set_lengths), 2), np.nan)
+
+    set_indexes = np.repeat(np.arange(len(position_sets)), set_lengths)
+    position_indexes = np.arange(np.sum(set_lengths)) - np.repeat(
+        np.cumsum(set_lengths) - set_lengths, set_lengths
+    )
+
+    padded_position_sets[set_indexes, position_indexes] = np.concatenate(position_sets)
+
+    separations = (
+        padded_position_sets[:, :, np.newaxis, :]
+        - padded_position_sets[:, np.newaxis, :, :]
+    )
+
+    return np.nanmax(
+        np.einsum("ijkl,ijkl->ijk", separations, separations).reshape(
+            len(position_sets), -1
+        ),
+        axis=1,
+    )
+
+
 class PositionsFit:
     def __init__(self, positions, tracer, noise_map):
         """A lens position fitter, which takes a set of positions (e.g. from a plane in the tracer) and computes \
         their maximum separation, such that points which tracer closer to one another have a higher likelihood.
 
+        The positions are only traced to the source-plane and the separations of every set are computed in one \
+        vectorized operation (see *squared_maximum_separations_from_position_sets*).
+
         Parameters
         -----------
         positions : [[]]
@@ -308,34 +448,66 @@ class PositionsFit:
         )[-1]
         self.noise_map = noise_map
 
+    @property
+    def source_plane_position_sets(self):
+        return [
+            np.asarray(position_set, dtype="float").reshape(-1, 2)
+            for position_set in self.source_plane_positions
+        ]
+
+    @property
+    def squared_maximum_separations(self):
+        return squared_maximum_separations_from_position_sets(
+            position_sets=self.source_plane_position_sets
+        )
+
     def maximum_separation_within_threshold(self, threshold):
-        return max(self.maximum_separations) <= threshold
+        """Whether the maximum separation of every set of source-plane positions is within a threshold.
+
+        The sets are checked one at a time against the square of the threshold, returning as soon as one set is \
+        not within it, which is the case for most lens models rejected by a positions threshold."""
+
+        squared_threshold = threshold ** 2
+
+        for position_set in self.source_plane_position_sets:
+            if (
+                squared_maximum_separations_from_position_sets(
+                    position_sets=[position_set]
+                )[0]
+                > squared_threshold
+            ):
+                return False
+
+        return True
 
     @property
     def maximum_separations(self):
-        return [
-            self.max_separation_of_grid(grid=position_list)
-            for position_list in self.source_plane_positions.list_in_1d
-        ]
+        return list(np.sqrt(self.squared_maximum_separations))
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.sub_shape_1d))
-        for i in range(grid.sub_shape_1d):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        return np.sqrt(
+            squared_maximum_separations_from_position_sets(
+                position_sets=[np.asarray(grid).reshape(-1, 2)]
+            )[0]
+        )
 
     @property
     def chi_squared_map(self):
-        return np.square(np.divide(self.maximum_separations, self.noise_map))
+        return np.divide(self.squared_maximum_separations, np.square(self.noise_map))
 
     @property
     def figure_of_merit(self):
         return -0.5 * sum(self.chi_squared_map)
 
 
+def summed_array_from_arrays_and_mask(arrays, mask):
+    """Sum a list of 1D masked arrays, returning an array of zeros if the list is empty."""
+    return mask.mapping.array_stored_1d_from_array_1d(
+        array_1d=sum(map(np.asarray, arrays), np.zeros(mask.pixels_in_mask))
+    )
+
+
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
     if hyper_image_sky is not None:
@@ -359,3 +531,118 @@ def hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
         noise_map = noise_map + hyper_noise_map
 
     return noise_map
+
+
+def figure_of_merit_from_masked_imaging_and_tracer(
+    masked_imaging, tracer, hyper_image_sky=None, hyper_background_noise=None
+):
+    """Compute the figure of merit of a tracer's fit to a masked imaging dataset (its likelihood, or evidence if it \
+    has an inversion), which is the same as the *figure_of_merit* of its *ImagingFit*.
+
+    Only the figure of merit is required by the likelihood evaluations of a non-linear search, thus the image, \
+    noise-map and model image are reduced to the chi-squared and noise normalization in one pass over their 1D \
+    arrays, without creating the residual, normalized residual and chi-squared maps or an *ImagingFit*, which are \
+    only created for the visualization and results of a phase.
+
+    Parameters
+    -----------
+    masked_imaging : MaskedImaging
+        The masked imaging dataset that is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer, which describes the ray-tracing and strong lens configuration.
+    hyper_image_sky : HyperImageSky or None
+        The hyper image sky, which scales the sky subtracted from the image.
+    hyper_background_noise : HyperBackgroundNoise or None
+        The hyper background noise, which scales the background noise of the noise-map.
+    """
+
+    image = hyper_image_from_image_and_hyper_image_sky(
+        image=masked_imaging.image, hyper_image_sky=hyper_image_sky
+    )
+
+    noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+        noise_map=masked_imaging.noise_map,
+        tracer=tracer,
+        hyper_background_noise=hyper_background_noise,
+    )
+
+    blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
+        grid=masked_imaging.grid,
+        convolver=masked_imaging.convolver,
+        blurring_grid=masked_imaging.blurring_grid,
+    )
+
+    if not tracer.has_pixelization:
+
+        chi_squared, noise_normalization = chi_squared_and_noise_normalization_from_image_noise_map_and_model_image(
+            image=image, noise_map=noise_map, model_image=blurred_profile_image
+        )
+
+        return fit_util.likelihood_from_chi_squared_and_noise_normalization(
+            chi_squared=chi_squared, noise_normalization=noise_normalization
+        )
+
+    inversion = tracer.inversion_imaging_from_grid_and_data(
+        grid=masked_imaging.grid,
+        image=image - blurred_profile_image,
+        noise_map=noise_map,
+        convolver=masked_imaging.convolver,
+        inversion_uses_border=masked_imaging.inversion_uses_border,
+        preload_sparse_grids_of_planes=masked_imaging.preload_sparse_grids_of_planes,
+    )
+
+    chi_squared, noise_normalization = chi_squared_and_noise_normalization_from_image_noise_map_and_model_image(
+        image=image,
+        noise_map=noise_map,
+        model_image=np.asarray(blurred_profile_image)
+        + np.asarray(inversion.mapped_reconstructed_image),
+    )
+
+    return fit_util.evidence_from_inversion_terms(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=noise_normalization,
+    )
+
+
+def chi_squared_and_noise_normalization_from_image_noise_map_and_model_image(
+    image, noise_map, model_image
+):
+    """Compute the chi-squared and noise normalization of a model image fitted to an image, where every input is a \
+    1D masked array, directly from their values (see *figure_of_merit_from_masked_imaging_and_tracer*)."""
+
+    noise_map = np.asarray(noise_map)
+
+    chi_squared = np.sum(
+        np.square((np.asarray(image) - np.asarray(model_image)) / noise_map)
+    )
+    noise_normalization = np.sum(np.log(2 * np.pi * np.square(noise_map)))
+
+    return chi_squared, noise_normalization
+
+
+def likelihoods_from_images_noise_maps_and_model_images(
+    images, noise_maps, model_images
+):
+    """Compute the likelihood of a batch of model images fitted to a batch of images, where every input is an \
+    ndarray of shape (batch_size, image_pixels) of 1D masked arrays:
+
+    Likelihood = -0.5*[Chi_Squared_Term + Noise_Term]
+
+    This gives the same likelihoods as an *ImagingFit* of each model image which does not use an inversion.
+
+    Parameters
+    -----------
+    images : ndarray
+        The (hyper) images that are fitted.
+    noise_maps : ndarray
+        The (hyper) noise-maps of the images.
+    model_images : ndarray
+        The model images fitted to the images.
+    """
+    chi_squareds = np.sum(np.square((images - model_images) / noise_maps), axis=1)
+    noise_normalizations = np.sum(np.log(2 * np.pi * np.square(noise_maps)), axis=1)
+
+    return -0.5 * (chi_squareds + noise_normalizations)
@@ -0,0 +1,242 @@
+import numpy as np
+
+from autoarray.structures import grids
+from autolens.lens import critical_curves_solver
+
+
+def mass_profile_parameters_from_tracer(tracer):
+    """Return the classes of the mass profiles of a tracer (with the redshifts of their planes) and an ndarray of \
+    all of their numerical parameters, which are compared to decide whether two mass models barely differ."""
+
+    classes = []
+    parameters = []
+
+    for plane in tracer.planes:
+        for galaxy in plane.galaxies:
+            for mass_profile in galaxy.mass_profiles:
+
+                classes.append((plane.redshift, mass_profile.__class__.__name__))
+
+                for name, value in sorted(vars(mass_profile).items()):
+                    if name != "cache" and isinstance(value, (float, int, tuple)):
+                        parameters += list(np.ravel(np.asarray(value, dtype="float")))
+
+    return tuple(classes), np.asarray(parameters)
+
+
+class AdaptiveSubGrid:
+
+    # The sub-sizes a pixel can be sub-gridded to, in the order they are tried.
+    sub_sizes = (1, 2, 4, 8, 16)
+
+    # The maximum change of every mass-profile parameter (relative to 1 or its value, whichever is larger) for which
+    # the sub-grid layout of the previous call is reused.
+    layout_parameter_tolerance = 1.0e-2
+
+    def __init__(self, grid, tolerance=1.0e-4, magnification_sub_size_factor=None):
+        """A sub-grid whose sub-size varies pixel-to-pixel, which is used to compute the profile image of a tracer \
+        (see *Tracer.profile_image_from_adaptive_sub_grid*) with the sub-sampling concentrated on the highly \
+        magnified pixels near the critical curves, rather than a uniform *sub_size* over the mask.
+
+        The sub-size of every pixel (the sub-grid layout) is chosen in one of two ways:
+
+        - By convergence (the default): every pixel is evaluated at increasing sub-sizes (see *sub_sizes*) until \
+          its value changes by less than *tolerance* times the peak value of the image for two successive \
+          sub-sizes. Requiring two successive small changes prevents a pixel whose values at two coarse sub-sizes \
+          agree by chance (e.g. a pixel straddling a sharp feature) from converging early.
+
+        - By magnification, if *magnification_sub_size_factor* is input: the sub-size of every pixel is the \
+          smallest of *sub_sizes* which is at least this factor times the square root of the absolute \
+          magnification at its centre, such that the sub-pixels of a magnified pixel cover the source-plane as \
+          finely as those of an unmagnified pixel.
+
+        The layout is cached and reused (evaluating every pixel once at its cached sub-size) while the mass model \
+        of the tracer differs from the one the layout was chosen for by less than *layout_parameter_tolerance*. \
+        In convergence mode changes to the light profiles therefore do not change a reused layout.
+
+        The number of sub-pixels evaluated by the last call is *total_sub_pixels*, which can be compared to the \
+        number of pixels times the square of a uniform *sub_size*.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The masked grid whose (binned) pixels the profile image is computed on.
+        tolerance : float
+            The change of a pixel's value, as a fraction of the peak value of the image, below which its sub-size \
+            has converged.
+        magnification_sub_size_factor : float or None
+            If input, the sub-sizes are chosen from the magnification rather than by convergence.
+        """
+        self.grid = grid
+        self.pixel_centres = np.asarray(grid.in_1d_binned)
+        self.pixel_scales = np.asarray(grid.pixel_scales)
+        self.tolerance = tolerance
+        self.magnification_sub_size_factor = magnification_sub_size_factor
+
+        self.layout = None
+        self.layout_mass_profile_classes = None
+        self.layout_mass_profile_parameters = None
+        self.layout_reused = False
+
+        self.total_sub_pixels = 0
+
+    @property
+    def total_pixels(self):
+        return self.pixel_centres.shape[0]
+
+    def sub_grid_from_pixels_and_sub_size(self, pixels, sub_size):
+        """The (y,x) coordinates of the sub-pixels of a set of pixels at a sub-size, of shape \
+        (total_pixels * sub_size ** 2, 2), with the sub-pixels of every pixel contiguous."""
+
+        sub_fractions = (np.arange(sub_size) + 0.5) / sub_size - 0.5
+
+        sub_offsets = np.stack(
+            np.meshgrid(-sub_fractions, sub_fractions, indexing="ij"), axis=-1
+        ).reshape(-1, 2) * (self.pixel_scales)
+
+        return (
+            self.pixel_centres[pixels][:, np.newaxis, :] + sub_offsets[np.newaxis, :, :]
+        ).reshape(-1, 2)
+
+    def pixel_values_from_tracer_pixels_and_sub_size(self, tracer, pixels, sub_size):
+        """The profile image of a set of pixels computed at a sub-size, by evaluating the tracer on their \
+        sub-pixels and taking the mean of every pixel's sub-pixels."""
+
+        if pixels.shape[0] == 0:
+            return np.zeros(0)
+
+        self.total_sub_pixels += pixels.shape[0] * sub_size ** 2
+
+        sub_image = tracer.profile_image_from_grid(
+            grid=grids.GridIrregular(
+                grid=self.sub_grid_from_pixels_and_sub_size(
+                    pixels=pixels, sub_size=sub_size
+                )
+            )
+        )
+
+        return np.mean(np.asarray(sub_image).reshape(pixels.shape[0], -1), axis=1)
+
+    def layout_via_magnification_from_tracer(self, tracer):
+        """The sub-size of every pixel from the magnification at its centre (see *magnification_sub_size_factor*), \
+        where the magnification is the inverse of the determinant of the Jacobian of the lens mapping."""
+
+        determinants, _, _ = critical_curves_solver.jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+            tracer=tracer,
+            grid=self.pixel_centres,
+            step=1.0e-2 * np.min(self.pixel_scales),
+        )
+
+        with np.errstate(divide="ignore"):
+            minimum_sub_sizes = self.magnification_sub_size_factor * np.sqrt(
+                np.abs(1.0 / determinants)
+            )
+
+        sub_sizes = np.asarray(self.sub_sizes)
+
+        return sub_sizes[
+            np.minimum(
+                np.searchsorted(sub_sizes, minimum_sub_sizes), sub_sizes.shape[0] - 1
+            )
+        ]
+
+    def image_and_layout_via_convergence_from_tracer(self, tracer):
+        """Compute the profile image, increasing the sub-size of the pixels which have not converged, returning the \
+        image and the sub-size every pixel converged at."""
+
+        pixels = np.arange(self.total_pixels)
+
+        image = self.pixel_values_from_tracer_pixels_and_sub_size(
+            tracer=tracer, pixels=pixels, sub_size=self.sub_sizes[0]
+        )
+
+        layout = np.full(self.total_pixels, self.sub_sizes[0])
+        changed_below_tolerance = np.full(self.total_pixels, False)
+
+        for sub_size in self.sub_sizes[1:]:
+
+            pixel_values = self.pixel_values_from_tracer_pixels_and_sub_size(
+                tracer=tracer, pixels=pixels, sub_size=sub_size
+            )
+
+            change_below_tolerance = np.abs(
+                pixel_values - image[pixels]
+            ) <= self.tolerance * np.max(np.abs(image))
+
+            converged = change_below_tolerance & changed_below_tolerance[pixels]
+
+            image[pixels] = pixel_values
+            layout[pixels] = sub_size
+            changed_below_tolerance[pixels] = change_below_tolerance
+
+            pixels = pixels[~converged]
+
+            if pixels.shape[0] == 0:
+                break
+
+        return image, layout
+
+    def image_from_tracer_and_layout(self, tracer, layout):
+        """Compute the profile image with every pixel evaluated once at its sub-size in a layout."""
+
+        image = np.zeros(self.total_pixels)
+
+        for sub_size in np.unique(layout):
+
+            pixels = np.where(layout == sub_size)[0]
+
+            image[pixels] = self.pixel_values_from_tracer_pixels_and_sub_size(
+                tracer=tracer, pixels=pixels, sub_size=sub_size
+            )
+
+        return image
+
+    def layout_is_reusable_for_tracer(self, tracer):
+
+        if self.layout is None:
+            return False
+
+        classes, parameters = mass_profile_parameters_from_tracer(tracer=tracer)
+
+        if classes != self.layout_mass_profile_classes:
+            return False
+
+        return np.all(
+            np.abs(parameters - self.layout_mass_profile_parameters)
+            <= self.layout_parameter_tolerance
+            * np.maximum(np.abs(self.layout_mass_profile_parameters), 1.0)
+        )
+
+    def profile_image_from_tracer(self, tracer):
+        """Compute the (binned) profile image of a tracer on the pixels of the grid, with the sub-size of every \
+        pixel chosen adaptively or reused from the previous call (see *AdaptiveSubGrid*).
+
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer whose profile image is computed.
+        """
+
+        self.total_sub_pixels = 0
+        self.layout_reused = bool(self.layout_is_reusable_for_tracer(tracer=tracer))
+
+        if self.layout_reused:
+
+            image = self.image_from_tracer_and_layout(tracer=tracer, layout=self.layout)
+
+        else:
+
+            if self.magnification_sub_size_factor is not None:
+                layout = self.layout_via_magnification_from_tracer(tracer=tracer)
+                image = self.image_from_tracer_and_layout(tracer=tracer, layout=layout)
+            else:
+                image, layout = self.image_and_layout_via_convergence_from_tracer(
+                    tracer=tracer
+                )
+
+            self.layout = layout
+            self.layout_mass_profile_classes, self.layout_mass_profile_parameters = mass_profile_parameters_from_tracer(
+                tracer=tracer
+            )
+
+        return self.grid.mask.mapping.array_stored_1d_from_array_1d(array_1d=image)
@@ -0,0 +1,1369 @@
+from collections import OrderedDict
+from functools import partial
+
+import autoconf.named
+import autofit as af
+import numpy as np
+
+from autoarray.structures import grids
+from autoastro.profiles import light_profiles as lp
+from autoastro.profiles import mass_profiles as mp
+from autolens import exc
+from autolens.lens import executor as ex
+
+
+def radial_minimum_from_profile_class(profile_class):
+    """The radial minimum of a profile class, which coordinates radially closer to a profile's centre are moved to \
+    before it is evaluated (see *geometry_profiles.move_grid_to_radial_minimum*)."""
+    radial_minimum_config = autoconf.named.NamedConfig(
+        f"{af.conf.instance.config_path}/radial_minimum.ini"
+    )
+    return radial_minimum_config.get("radial_minimum", profile_class.__name__, float)
+
+
+def profile_frame_coordinates_of_profiles_from_grid(
+    grid, centres, radial_minimum, cos_phi=None, sin_phi=None
+):
+    """Return the (y,x) coordinates of a grid in the reference frame of every one of a set of profiles and their \
+    radii, as arrays of shape (total_profiles, total_coordinates), by translating to every profile's centre, \
+    rotating to its orientation (if *cos_phi* and *sin_phi* are input) and moving coordinates within the radial \
+    minimum of its centre to the radial minimum (see *geometry_profiles.move_grid_to_radial_minimum*).
+
+    The grid and centres can have the same leading batch axes (e.g. a grid of shape (total_batch, \
+    total_coordinates, 2) and centres of shape (total_batch, total_profiles, 2)), in which case the returned arrays \
+    have shape (total_batch, total_profiles, total_coordinates).
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates in the original reference frame of the grid.
+    centres : ndarray
+        The (y,x) centres of the profiles, of shape (total_profiles, 2).
+    radial_minimum : float
+        The radial minimum of the profiles' class.
+    cos_phi : ndarray or None
+        The cosine of the angle of every profile counter-clockwise from the positive x-axis, of shape \
+        (total_profiles, 1).
+    sin_phi : ndarray or None
+        The sine of the angle of every profile counter-clockwise from the positive x-axis, of shape \
+        (total_profiles, 1).
+    """
+    y = np.subtract(grid[..., np.newaxis, :, 0], centres[..., :, 0, np.newaxis])
+    x = np.subtract(grid[..., np.newaxis, :, 1], centres[..., :, 1, np.newaxis])
+
+    if cos_phi is not None:
+        y, x = y * cos_phi - x * sin_phi, x * cos_phi + y * sin_phi
+
+    radii = np.hypot(y, x)
+
+    if radial_minimum > 0.0:
+
+        moved = radii < radial_minimum
+
+        if np.any(moved):
+
+            with np.errstate(all="ignore"):
+                scale = radial_minimum / radii[moved]
+                y[moved] *= scale
+                x[moved] *= scale
+
+            y[np.isnan(y)] = radial_minimum
+            x[np.isnan(x)] = radial_minimum
+
+            radii = np.hypot(y, x)
+
+    return y, x, radii
+
+
+def parameter_columns_from_parameters(parameters):
+    """Split the parameters of a set of profiles, of shape (total_profiles, total_parameters), into one array of \
+    shape (total_profiles, 1) per parameter, which broadcasts against arrays of shape (total_profiles, \
+    total_coordinates)."""
+    return [parameters[..., index, np.newaxis] for index in range(parameters.shape[-1])]
+
+
+def sersic_profile_images_from_coordinates(y, x, parameters):
+    """The images of a set of Sersic light profiles (see *light_profiles.EllipticalSersic*) at coordinates in their \
+    reference frames, of shape (total_profiles, total_coordinates)."""
+    _, _, axis_ratio, intensity, effective_radius, sersic_index, sersic_constant = parameter_columns_from_parameters(
+        parameters=parameters
+    )
+
+    radii = np.sqrt(axis_ratio) * np.sqrt(np.square(x) + np.square(y / axis_ratio))
+
+    with np.errstate(all="ignore"):
+        return intensity * np.exp(
+            -sersic_constant
+            * (np.power(radii / effective_radius, 1.0 / sersic_index) - 1.0)
+        )
+
+
+def gaussian_profile_images_from_coordinates(y, x, parameters):
+    """The images of a set of Gaussian light profiles (see *light_profiles.EllipticalGaussian*) at coordinates in \
+    their reference frames, of shape (total_profiles, total_coordinates)."""
+    _, _, axis_ratio, intensity, sigma = parameter_columns_from_parameters(
+        parameters=parameters
+    )
+
+    radii = np.sqrt(np.square(x) + np.square(y / axis_ratio))
+
+    return (intensity / (sigma * np.sqrt(2.0 * np.pi))) * np.exp(
+        -0.5 * np.square(radii / sigma)
+    )
+
+
+def cored_power_law_convergences_from_coordinates(y, x, parameters):
+    """The convergences of a set of cored power-law mass profiles (see *mass_profiles.EllipticalCoredPowerLaw*) at \
+    coordinates in their reference frames, of shape (total_profiles, total_coordinates).
+
+    A power-law without a core (see *mass_profiles.EllipticalPowerLaw*) is a cored power-law with a core radius \
+    of 0.0, whose convergence is infinite at its centre."""
+    _, _, axis_ratio, einstein_radius_rescaled, slope, core_radius = parameter_columns_from_parameters(
+        parameters=parameters
+    )
+
+    radii_squared = np.square(x) + np.square(y / axis_ratio)
+
+    with np.errstate(divide="ignore"):
+        return einstein_radius_rescaled * np.power(
+            np.square(core_radius) + radii_squared, -(slope - 1.0) / 2.0
+        )
+
+
+def spherical_isothermal_potentials_from_coordinates(y, x, parameters):
+    """The potentials of a set of spherical isothermal mass profiles (see *mass_profiles.SphericalIsothermal*) at \
+    coordinates in their reference frames, of shape (total_profiles, total_coordinates)."""
+    _, _, einstein_radius_rescaled = parameter_columns_from_parameters(
+        parameters=parameters
+    )
+
+    return 2.0 * einstein_radius_rescaled * np.sqrt(np.square(x) + np.square(y))
+
+
+def elliptical_isothermal_deflections_from_coordinates(y, x, parameters):
+    """The (y,x) deflection angles of a set of elliptical isothermal mass profiles (see \
+    *mass_profiles.EllipticalIsothermal*) at coordinates in their reference frames, rotated back to the original \
+    reference frame of the grid, of shape (total_profiles, total_coordinates, 2)."""
+    cos_phi, sin_phi, axis_ratio, einstein_radius_rescaled = parameter_columns_from_parameters(
+        parameters=parameters
+    )
+
+    eccentricity = np.sqrt(1.0 - np.square(axis_ratio))
+    factor = 2.0 * einstein_radius_rescaled * axis_ratio / eccentricity
+
+    psi = np.sqrt(np.square(axis_ratio) * np.square(x) + np.square(y))
+
+    deflections_y = factor * np.arctanh(eccentricity * y / psi)
+    deflections_x = factor * np.arctan(eccentricity * x / psi)
+
+    return np.stack(
+        (
+            deflections_x * sin_phi + deflections_y * cos_phi,
+            deflections_x * cos_phi - deflections_y * sin_phi,
+        ),
+        axis=-1,
+    )
+
+
+# The number of (chunk_profiles, total_coordinates) arrays a kernel holds in memory at once.
+broadcast_arrays_per_profile = 6
+
+
+def chunk_profiles_from_grid_and_memory_budget(grid, memory_budget):
+    """The number of profiles a kernel evaluates at once on a grid, such that its (chunk_profiles, \
+    total_coordinates) arrays do not exceed the memory budget (in bytes)."""
+    total_coordinates = int(np.prod(grid.shape[:-1]))
+
+    return max(
+        int(
+            memory_budget
+            // (broadcast_arrays_per_profile * 8 * max(total_coordinates, 1))
+        ),
+        1,
+    )
+
+
+def add_kernel_quantity_from_grid(
+    grid, quantities_func, compiled_profiles, memory_budget, out
+):
+    """Add the summed quantity of a set of profiles of the same class to the output array *out*, computing it for \
+    all profiles together with a structure-of-arrays kernel.
+
+    The grid is transformed to the reference frame of every profile as arrays of shape (chunk_profiles, \
+    total_coordinates) (see *profile_frame_coordinates_of_profiles_from_grid*), which *quantities_func* computes \
+    the quantity of every profile on. The first two parameters of the profiles are the cosine and sine of their \
+    angles, which rotate the grid to their orientation. The profiles are evaluated in chunks of as many profiles as \
+    fit within the memory budget.
+
+    The grid, centres and parameters can have the same leading batch axes (see *CompiledProfiles*), which computes \
+    the quantities of a batch of planes in one calculation, with the output of shape (total_batch, \
+    total_coordinates).
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of the grid.
+    quantities_func : func
+        The function computing the quantity of every profile from coordinates in their reference frames (e.g. \
+        *sersic_profile_images_from_coordinates*).
+    compiled_profiles : CompiledProfiles
+        The profiles whose quantity is computed.
+    memory_budget : int
+        The maximum number of bytes of the (chunk_profiles, total_coordinates) arrays of a chunk.
+    out : ndarray
+        The array of shape (total_coordinates,) or (total_coordinates, 2) the quantity is added to.
+    """
+    centres = compiled_profiles.centres
+    parameters = compiled_profiles.parameters
+
+    profile_axis = centres.ndim - 2
+
+    chunk_profiles = chunk_profiles_from_grid_and_memory_budget(
+        grid=grid, memory_budget=memory_budget
+    )
+
+    for chunk_index in range(0, compiled_profiles.total_profiles, chunk_profiles):
+
+        chunk_parameters = parameters[
+            ..., chunk_index : chunk_index + chunk_profiles, :
+        ]
+
+        y, x, _ = profile_frame_coordinates_of_profiles_from_grid(
+            grid=grid,
+            centres=centres[..., chunk_index : chunk_index + chunk_profiles, :],
+            radial_minimum=compiled_profiles.radial_minimum,
+            cos_phi=chunk_parameters[..., 0, np.newaxis],
+            sin_phi=chunk_parameters[..., 1, np.newaxis],
+        )
+
+        out += np.sum(
+            quantities_func(y=y, x=x, parameters=chunk_parameters), axis=profile_axis
+        )
+
+
+def spherical_isothermal_radial_deflections_from_radii(radii, parameters):
+    """The magnitude of the deflection angles of a set of spherical isothermal mass profiles (see \
+    *mass_profiles.SphericalIsothermal*) at radii of shape (total_profiles, total_radii)."""
+    return np.multiply(parameters[..., 0, np.newaxis], np.ones(radii.shape))
+
+
+def spherical_nfw_radial_deflections_from_radii(radii, parameters):
+    """The magnitude of the deflection angles of a set of spherical NFW mass profiles (see \
+    *mass_profiles.SphericalNFW*) at radii of shape (total_profiles, total_radii)."""
+    kappa_s = parameters[..., 0, np.newaxis]
+    scale_radius = parameters[..., 1, np.newaxis]
+
+    return np.multiply(
+        4.0 * kappa_s * scale_radius,
+        mp.SphericalNFW.deflection_func_sph(radii / scale_radius),
+    )
+
+
+def radial_deflections_broadcast_kernel(
+    grid, centres, parameters, radial_minimum, radial_deflections_func
+):
+    """Compute the summed deflection angles of a set of spherical mass profiles of the same class on a grid, as one \
+    (total_profiles, total_coordinates) calculation.
+
+    The deflection angles of a spherical profile point to its centre, with a magnitude that depends only on the \
+    radius, which is computed by the class's *radial_deflections_func* (e.g. \
+    *spherical_isothermal_radial_deflections_from_radii*).
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates in the original reference frame of the grid.
+    centres : ndarray
+        The (y,x) centres of the profiles, of shape (total_profiles, 2).
+    parameters : ndarray
+        The parameters of the profiles, of shape (total_profiles, total_parameters).
+    radial_minimum : float
+        The radial minimum of the profiles' class.
+    radial_deflections_func : func
+        The function computing the magnitude of the profiles' deflection angles from their radii.
+    """
+
+    y, x, radii = profile_frame_coordinates_of_profiles_from_grid(
+        grid=grid, centres=centres, radial_minimum=radial_minimum
+    )
+
+    deflections_r = radial_deflections_func(radii=radii, parameters=parameters)
+
+    # Coordinates at the centre are deflected along the x-axis, as arctan2(0.0, 0.0) is 0.0.
+    at_centre = radii == 0.0
+    radii[at_centre] = 1.0
+    x[at_centre] = 1.0
+
+    np.divide(deflections_r, radii, out=radii)
+
+    return np.stack((np.sum(y * radii, axis=-2), np.sum(x * radii, axis=-2)), axis=-1)
+
+
+def far_profiles_from_grid_centres_and_cutoff_radius(grid, centres, cutoff_radius):
+    """Return a boolean array which is *True* for every profile whose centre is further than the cutoff radius from \
+    every coordinate of the grid, based on the distance of its centre from the grid's bounding box.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of the grid.
+    centres : ndarray
+        The (y,x) centres of the profiles, of shape (total_profiles, 2).
+    cutoff_radius : float
+        The distance beyond which a profile is far from the grid.
+    """
+    grid_minima = np.min(grid, axis=0)
+    grid_maxima = np.max(grid, axis=0)
+
+    distances = np.maximum(
+        np.maximum(grid_minima - centres, centres - grid_maxima), 0.0
+    )
+
+    return np.hypot(distances[:, 0], distances[:, 1]) > cutoff_radius
+
+
+def far_field_deflections_and_error_from_grid(
+    grid, broadcast_kernel, centres, parameters, radial_minimum
+):
+    """Approximate the summed deflection angles of a set of mass profiles far from a grid by their first-order \
+    Taylor expansion about the centre of the grid's bounding box, returning the approximate deflection angles and \
+    an estimate of the maximum error of the approximation.
+
+    The deflection angles and their gradient at the centre are computed by evaluating the profiles on 5 \
+    coordinates (the centre and a central-difference stencil), thus the cost does not depend on the size of the \
+    grid. The error is estimated as the largest difference between the exact and approximate deflection angles at \
+    the corners of the grid's bounding box, which for smooth far-field deflections is where the error is largest.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of the grid.
+    broadcast_kernel : func
+        The broadcast kernel computing the exact summed deflection angles of the profiles.
+    centres : ndarray
+        The (y,x) centres of the profiles, of shape (total_profiles, 2).
+    parameters : ndarray
+        The parameters of the profiles, of shape (total_profiles, total_parameters).
+    radial_minimum : float
+        The radial minimum of the profiles' class.
+    """
+    grid_minima = np.min(grid, axis=0)
+    grid_maxima = np.max(grid, axis=0)
+
+    centre = 0.5 * (grid_minima + grid_maxima)
+    step = max(0.5 * np.max(grid_maxima - grid_minima), 1.0e-4)
+
+    stencil = centre + np.array(
+        [[0.0, 0.0], [step, 0.0], [-step, 0.0], [0.0, step], [0.0, -step]]
+    )
+
+    stencil_deflections = broadcast_kernel(
+        grid=stencil,
+        centres=centres,
+        parameters=parameters,
+        radial_minimum=radial_minimum,
+    )
+
+    deflections_gradient = np.array(
+        [
+            stencil_deflections[1] - stencil_deflections[2],
+            stencil_deflections[3] - stencil_deflections[4],
+        ]
+    ) / (2.0 * step)
+
+    def deflections_from(coordinates):
+        return stencil_deflections[0] + np.dot(
+            coordinates - centre, deflections_gradient
+        )
+
+    corners = np.array(
+        [
+            [grid_minima[0], grid_minima[1]],
+            [grid_minima[0], grid_maxima[1]],
+            [grid_maxima[0], grid_minima[1]],
+            [grid_maxima[0], grid_maxima[1]],
+        ]
+    )
+
+    error = np.max(
+        np.hypot(
+            *(
+                broadcast_kernel(
+                    grid=corners,
+                    centres=centres,
+                    parameters=parameters,
+                    radial_minimum=radial_minimum,
+                )
+                - deflections_from(coordinates=corners)
+            ).T
+        )
+    )
+
+    return deflections_from(coordinates=grid), error
+
+
+def broadcast_deflections_from_grid(
+    grid, radial_deflections_func, compiled_profiles, memory_budget, cutoff_radius, out
+):
+    """Add the summed deflection angles of a set of profiles with a broadcast kernel to the output array *out*, \
+    returning the estimated error of the far-field approximation (which is 0.0 if no cutoff radius is used).
+
+    The profiles are evaluated by the kernel in chunks of as many profiles as fit within the memory budget, \
+    with every chunk computed as one (chunk_profiles, total_coordinates) calculation. If a cutoff radius is input, \
+    profiles further than it from every coordinate of the grid are approximated together by their far-field \
+    expansion (see *far_field_deflections_and_error_from_grid*).
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of the grid.
+    radial_deflections_func : func
+        The function computing the magnitude of the profiles' deflection angles from their radii (see \
+        *radial_deflections_broadcast_kernel*).
+    compiled_profiles : CompiledProfiles
+        The profiles whose deflection angles are computed.
+    memory_budget : int
+        The maximum number of bytes of the (chunk_profiles, total_coordinates) arrays of a chunk.
+    cutoff_radius : float or None
+        The distance from the grid beyond which the deflection angles of a profile are approximated.
+    out : ndarray
+        The (total_coordinates, 2) array the deflection angles are added to.
+    """
+    broadcast_kernel = partial(
+        radial_deflections_broadcast_kernel,
+        radial_deflections_func=radial_deflections_func,
+    )
+
+    centres = compiled_profiles.centres
+    parameters = compiled_profiles.parameters
+
+    error = 0.0
+
+    if cutoff_radius is not None and grid.shape[0] > 0:
+
+        far = far_profiles_from_grid_centres_and_cutoff_radius(
+            grid=grid, centres=centres, cutoff_radius=cutoff_radius
+        )
+
+        if np.any(far):
+
+            far_field_deflections, error = far_field_deflections_and_error_from_grid(
+                grid=grid,
+                broadcast_kernel=broadcast_kernel,
+                centres=centres[far],
+                parameters=parameters[far],
+                radial_minimum=compiled_profiles.radial_minimum,
+            )
+
+            out += far_field_deflections
+
+            centres = centres[~far]
+            parameters = parameters[~far]
+
+    chunk_profiles = chunk_profiles_from_grid_and_memory_budget(
+        grid=grid, memory_budget=memory_budget
+    )
+
+    for chunk_index in range(0, centres.shape[-2], chunk_profiles):
+
+        out += broadcast_kernel(
+            grid=grid,
+            centres=centres[..., chunk_index : chunk_index + chunk_profiles, :],
+            parameters=parameters[..., chunk_index : chunk_index + chunk_profiles, :],
+            radial_minimum=compiled_profiles.radial_minimum,
+        )
+
+    return error
+
+
+# The number of radii the summed radial deflection angles of a tree node are tabulated at.
+tree_monopole_table_size = 128
+
+
+class DeflectionsTreeNode:
+    def __init__(self, indexes, centres, leaf_size):
+        """A node of a *DeflectionsTree*, which holds the indexes of the profiles whose centres lie within a \
+        square region of the plane and, unless it is a leaf, the 4 child nodes the region is divided into.
+
+        Parameters
+        ----------
+        indexes : ndarray
+            The indexes of the profiles in the node.
+        centres : ndarray
+            The (y,x) centres of all profiles of the tree, of shape (total_profiles, 2).
+        leaf_size : int
+            The maximum number of profiles of a leaf node.
+        """
+        self.indexes = indexes
+
+        minima = np.min(centres[indexes], axis=0)
+        maxima = np.max(centres[indexes], axis=0)
+
+        self.size = np.max(maxima - minima)
+        self.children = []
+
+        if indexes.shape[0] > leaf_size and self.size > 0.0:
+
+            middle = 0.5 * (minima + maxima)
+
+            above = centres[indexes, 0] >= middle[0]
+            right = centres[indexes, 1] >= middle[1]
+
+            for quadrant in (
+                above & right,
+                above & ~right,
+                ~above & right,
+                ~above & ~right,
+            ):
+                if np.any(quadrant):
+                    self.children.append(
+                        DeflectionsTreeNode(
+                            indexes=indexes[quadrant],
+                            centres=centres,
+                            leaf_size=leaf_size,
+                        )
+                    )
+
+
+class DeflectionsTree:
+
+    leaf_size = 8
+
+    def __init__(self, compiled_profiles, radial_deflections_func, opening_angle):
+        """A Barnes-Hut tree of a set of spherical mass profiles of the same class, which computes their summed \
+        deflection angles hierarchically instead of summing over every profile at every coordinate.
+
+        The profiles are divided into a quadtree of nodes by the position of their centres. When the deflection \
+        angles at a coordinate are computed, a node whose size divided by its distance from the coordinate is below \
+        the *opening_angle* is approximated by its monopole: the deflection angles of a single spherical profile \
+        at the node's centre, whose radial deflection angles are the sum of those of the node's profiles. Nodes \
+        which are not distant enough are opened into their children, and the profiles of leaf nodes are evaluated \
+        exactly (see *radial_deflections_broadcast_kernel*).
+
+        The node's centre is the centre of its profiles weighted by their radial deflection angles at the closest \
+        distance a monopole is used, which cancels the dipole term of the approximation. The summed radial \
+        deflection angles are tabulated on *tree_monopole_table_size* logarithmically spaced radii and interpolated.
+
+        An opening angle of 0.0 opens every node and gives the exact deflection angles, and the error of the \
+        approximation increases with the opening angle as the cost decreases.
+
+        Parameters
+        ----------
+        compiled_profiles : CompiledProfiles
+            The profiles whose deflection angles are computed.
+        radial_deflections_func : func
+            The function computing the magnitude of the profiles' deflection angles from their radii (see \
+            *radial_deflections_broadcast_kernel*).
+        opening_angle : float
+            The ratio of a node's size to its distance from a coordinate below which it is approximated.
+        """
+        self.compiled_profiles = compiled_profiles
+        self.radial_deflections_func = radial_deflections_func
+        self.opening_angle = opening_angle
+
+        self.broadcast_kernel = partial(
+            radial_deflections_broadcast_kernel,
+            radial_deflections_func=radial_deflections_func,
+        )
+
+        self.root = DeflectionsTreeNode(
+            indexes=np.arange(compiled_profiles.total_profiles),
+            centres=compiled_profiles.centres,
+            leaf_size=self.leaf_size,
+        )
+
+        self.nodes = []
+        self.add_nodes(node=self.root)
+        self.add_monopole_centres()
+
+    def add_nodes(self, node):
+
+        self.nodes.append(node)
+
+        for child in node.children:
+            self.add_nodes(node=child)
+
+    def add_monopole_centres(self):
+
+        for node in self.nodes:
+
+            centres = self.compiled_profiles.centres[node.indexes]
+            parameters = self.compiled_profiles.parameters[node.indexes]
+
+            node.centre = np.mean(centres, axis=0)
+
+            if self.opening_angle > 0.0 and node.size > 0.0:
+
+                weights = self.radial_deflections_func(
+                    radii=np.full(
+                        (node.indexes.shape[0], 1), node.size / self.opening_angle
+                    ),
+                    parameters=parameters,
+                )[:, 0]
+
+                if np.sum(weights) > 0.0:
+                    node.centre = np.dot(weights, centres) / np.sum(weights)
+
+    def update_compiled_profiles(self, compiled_profiles):
+        """Use the tree for profiles with the same centres but (possibly) different parameters, reusing its nodes \
+        and recomputing the monopole centres of the nodes only if the parameters changed."""
+
+        parameters_changed = not np.array_equal(
+            compiled_profiles.parameters, self.compiled_profiles.parameters
+        )
+
+        self.compiled_profiles = compiled_profiles
+
+        if parameters_changed:
+            self.add_monopole_centres()
+
+    def monopole_deflections_from_node_and_grid(self, node, grid):
+        """Compute the deflection angles of the monopole of a node on a grid of coordinates which are all further \
+        than the node's size divided by the opening angle from its centre."""
+
+        y = grid[:, 0] - node.centre[0]
+        x = grid[:, 1] - node.centre[1]
+        radii = np.hypot(y, x)
+
+        table_radii = np.geomspace(
+            node.size / self.opening_angle,
+            max(np.max(radii), node.size / self.opening_angle),
+            tree_monopole_table_size,
+        )
+
+        table_deflections = np.sum(
+            self.radial_deflections_func(
+                radii=np.tile(table_radii, (node.indexes.shape[0], 1)),
+                parameters=self.compiled_profiles.parameters[node.indexes],
+            ),
+            axis=0,
+        )
+
+        deflections_r = np.interp(np.log(radii), np.log(table_radii), table_deflections)
+
+        return np.vstack((y * deflections_r / radii, x * deflections_r / radii)).T
+
+    def deflections_from_grid(self, grid, out):
+        """Add the summed deflection angles of the profiles on a grid to the output array *out*, traversing the \
+        tree with every node visited once for all coordinates which reach it."""
+
+        stack = [(self.root, np.arange(grid.shape[0]))]
+
+        while stack:
+
+            node, pixels = stack.pop()
+
+            if self.opening_angle > 0.0 and node.size > 0.0:
+
+                distances = np.hypot(
+                    grid[pixels, 0] - node.centre[0], grid[pixels, 1] - node.centre[1]
+                )
+
+                far = node.size < self.opening_angle * distances
+
+                if np.any(far):
+                    out[pixels[far]] += self.monopole_deflections_from_node_and_grid(
+                        node=node, grid=grid[pixels[far]]
+                    )
+                    pixels = pixels[~far]
+
+            if pixels.shape[0] == 0:
+                continue
+
+            if node.children:
+                stack.extend((child, pixels) for child in node.children)
+            else:
+                out[pixels] += self.broadcast_kernel(
+                    grid=grid[pixels],
+                    centres=self.compiled_profiles.centres[node.indexes],
+                    parameters=self.compiled_profiles.parameters[node.indexes],
+                    radial_minimum=self.compiled_profiles.radial_minimum,
+                )
+
+        return out
+
+
+# The number of deflection trees which are cached (see *deflections_tree_from_compiled_profiles_and_opening_angle*).
+deflections_trees_cache_size = 8
+
+deflections_trees_cache = OrderedDict()
+
+
+def deflections_tree_from_compiled_profiles_and_opening_angle(
+    compiled_profiles, radial_deflections_func, opening_angle
+):
+    """The *DeflectionsTree* of a class of profiles for an opening angle.
+
+    Building the tree costs about as much as evaluating it once, whereas the positions of line-of-sight halos are \
+    fixed for every likelihood evaluation of a phase and only their parameters change. Trees are therefore cached \
+    on the profile class, opening angle and centres of the profiles, such that planes with the same halo positions \
+    share a tree across calls and only recompute its monopole centres if the parameters change (see \
+    *DeflectionsTree.update_compiled_profiles*). The *deflections_trees_cache_size* most recently used trees are \
+    cached.
+
+    Parameters
+    ----------
+    compiled_profiles : CompiledProfiles
+        The profiles whose deflection angles are computed.
+    radial_deflections_func : func
+        The function computing the magnitude of the profiles' deflection angles from their radii.
+    opening_angle : float
+        The opening angle of the tree.
+    """
+
+    key = (
+        compiled_profiles.profile_class,
+        opening_angle,
+        compiled_profiles.centres.tobytes(),
+    )
+
+    if key in deflections_trees_cache:
+        deflections_trees_cache.move_to_end(key)
+        deflections_trees_cache[key].update_compiled_profiles(
+            compiled_profiles=compiled_profiles
+        )
+        return deflections_trees_cache[key]
+
+    deflections_trees_cache[key] = DeflectionsTree(
+        compiled_profiles=compiled_profiles,
+        radial_deflections_func=radial_deflections_func,
+        opening_angle=opening_angle,
+    )
+
+    while len(deflections_trees_cache) > deflections_trees_cache_size:
+        deflections_trees_cache.popitem(last=False)
+
+    return deflections_trees_cache[key]
+
+
+sersic_parameter_names = (
+    "cos_phi",
+    "sin_phi",
+    "axis_ratio",
+    "intensity",
+    "effective_radius",
+    "sersic_index",
+    "sersic_constant",
+)
+
+gaussian_parameter_names = ("cos_phi", "sin_phi", "axis_ratio", "intensity", "sigma")
+
+cored_power_law_parameter_names = (
+    "cos_phi",
+    "sin_phi",
+    "axis_ratio",
+    "einstein_radius_rescaled",
+    "slope",
+    "core_radius",
+)
+
+# The kernels of every quantity, as a dictionary mapping a profile class to the function computing the quantity of
+# its profiles (see *add_kernel_quantity_from_grid*) and the names of the parameters it packs. The quantities of
+# profiles of other classes are computed by the profile's own method (see *add_profile_quantity_from_grid*).
+profile_image_kernels = {
+    **{
+        profile_class: (sersic_profile_images_from_coordinates, sersic_parameter_names)
+        for profile_class in (
+            lp.EllipticalSersic,
+            lp.SphericalSersic,
+            lp.EllipticalExponential,
+            lp.SphericalExponential,
+            lp.EllipticalDevVaucouleurs,
+            lp.SphericalDevVaucouleurs,
+        )
+    },
+    **{
+        profile_class: (
+            gaussian_profile_images_from_coordinates,
+            gaussian_parameter_names,
+        )
+        for profile_class in (lp.EllipticalGaussian, lp.SphericalGaussian)
+    },
+}
+
+convergence_kernels = {
+    profile_class: (
+        cored_power_law_convergences_from_coordinates,
+        cored_power_law_parameter_names,
+    )
+    for profile_class in (
+        mp.EllipticalCoredPowerLaw,
+        mp.SphericalCoredPowerLaw,
+        mp.EllipticalCoredIsothermal,
+        mp.SphericalCoredIsothermal,
+        mp.EllipticalPowerLaw,
+        mp.SphericalPowerLaw,
+        mp.EllipticalIsothermal,
+        mp.SphericalIsothermal,
+    )
+}
+
+potential_kernels = {
+    mp.SphericalIsothermal: (
+        spherical_isothermal_potentials_from_coordinates,
+        ("cos_phi", "sin_phi", "einstein_radius_rescaled"),
+    )
+}
+
+deflections_kernels = {
+    mp.EllipticalIsothermal: (
+        elliptical_isothermal_deflections_from_coordinates,
+        ("cos_phi", "sin_phi", "axis_ratio", "einstein_radius_rescaled"),
+    )
+}
+
+broadcast_deflections_kernels = {
+    mp.SphericalIsothermal: (
+        spherical_isothermal_radial_deflections_from_radii,
+        ("einstein_radius",),
+    ),
+    mp.SphericalNFW: (
+        spherical_nfw_radial_deflections_from_radii,
+        ("kappa_s", "scale_radius"),
+    ),
+}
+
+
+def add_profile_quantity_from_grid(profile, func_name, grid, out):
+    """Add a quantity of a profile without a kernel, computed by its method *func_name*, to the output array *out*.
+
+    The quantity is reshaped to the layout of *out*, which requires it to have one value (or (y,x) pair) per \
+    coordinate of the grid. A *CompiledPlaneException* is raised if it does not (e.g. a mock profile returning \
+    fixed values), in which case the plane falls back to summing the quantities of its galaxies (see \
+    *Plane.sub_array_accumulated_from_grid*)."""
+
+    quantity = np.asarray(getattr(profile, func_name)(grid=grid))
+
+    if quantity.size != out.size:
+        raise exc.CompiledPlaneException(
+            "The {} of a {} has {} values, which cannot be added to an output array of shape {}".format(
+                func_name, profile.__class__.__name__, quantity.size, out.shape
+            )
+        )
+
+    out += quantity.reshape(out.shape)
+
+
+class CompiledProfiles:
+    def __init__(self, profiles, parameter_names):
+        """The parameters of a list of profiles of the same class packed into a structure-of-arrays, with one array \
+        of shape (total_profiles,) per parameter and an array of shape (total_profiles, 2) of their centres.
+
+        Parameters
+        ----------
+        profiles : [GeometryProfile]
+            The profiles whose parameters are packed, which must all be of the same class.
+        parameter_names : (str,)
+            The names of the attributes (or properties) of the profiles that are packed, in the order of the \
+            columns of *parameters*.
+        """
+        self.profile_class = profiles[0].__class__
+        self.radial_minimum = radial_minimum_from_profile_class(
+            profile_class=self.profile_class
+        )
+        self.centres = np.array(
+            [profile.centre for profile in profiles], dtype="float64"
+        ).reshape(len(profiles), 2)
+        self.parameters = np.array(
+            [
+                [getattr(profile, name) for name in parameter_names]
+                for profile in profiles
+            ],
+            dtype="float64",
+        ).reshape(len(profiles), len(parameter_names))
+
+    @classmethod
+    def from_batch_of_profiles(cls, batch_of_profiles, parameter_names):
+        """Pack the profiles of a batch of planes, each of which has the same number of profiles of the same class, \
+        into a structure-of-arrays whose centres and parameters have a leading batch axis, of shapes (total_batch, \
+        total_profiles, 2) and (total_batch, total_profiles, total_parameters).
+
+        Parameters
+        ----------
+        batch_of_profiles : [[GeometryProfile]]
+            The profiles of every plane in the batch.
+        parameter_names : (str,)
+            The names of the attributes (or properties) of the profiles that are packed.
+        """
+        compiled_profiles_of_batch = [
+            cls(profiles=profiles, parameter_names=parameter_names)
+            for profiles in batch_of_profiles
+        ]
+
+        compiled_profiles = compiled_profiles_of_batch[0]
+        compiled_profiles.centres = np.stack(
+            [profiles.centres for profiles in compiled_profiles_of_batch]
+        )
+        compiled_profiles.parameters = np.stack(
+            [profiles.parameters for profiles in compiled_profiles_of_batch]
+        )
+
+        return compiled_profiles
+
+    @property
+    def total_profiles(self):
+        return self.centres.shape[-2]
+
+
+class CompiledPlane:
+
+    # Classes with fewer profiles than this are evaluated by the profiles' own methods rather than a kernel, as a
+    # kernel only pays off for many profiles and its values agree with the profiles' only to numerical precision.
+    kernel_minimum_profiles = 5
+
+    memory_budget = 2 ** 27
+    cutoff_radius = None
+    opening_angle = None
+
+    def __init__(
+        self,
+        galaxies,
+        memory_budget=None,
+        cutoff_radius=None,
+        opening_angle=None,
+        executor=None,
+    ):
+        """A compiled representation of the galaxies of a plane, which evaluates their summed profile image, \
+        convergence and deflection angles without dispatching to every galaxy and profile.
+
+        The quantities of every profile are accumulated into one output array instead of creating an array for \
+        every galaxy and addition. Profiles of classes with a kernel (see *profile_image_kernels*, \
+        *convergence_kernels*, *potential_kernels* and *deflections_kernels*) and at least *kernel_minimum_profiles* \
+        profiles are packed into a *CompiledProfiles* structure-of-arrays and evaluated together by the kernel as \
+        one (total_profiles, total_coordinates) calculation, whereas profiles of other classes are evaluated by their \
+        own methods (see *add_profile_quantity_from_grid*).
+
+        For group and cluster scale lenses, whose planes contain many galaxies with the same mass profile, the \
+        deflection angles of classes with a broadcast kernel (see *broadcast_deflections_kernels*) and at least \
+        *kernel_minimum_profiles* profiles are computed for all profiles of the class as one (total_profiles, \
+        total_coordinates) calculation, chunked such that the arrays of a chunk do not exceed *memory_budget* \
+        bytes. If a *cutoff_radius* is used, profiles further than it from every coordinate of a grid are \
+        approximated by their far-field expansion, and the estimated error of the approximation is stored as \
+        *deflections_cutoff_error* (see *broadcast_deflections_from_grid*).
+
+        For planes of many line-of-sight halos, an *opening_angle* can instead be used, which computes the \
+        deflection angles of these classes hierarchically using a Barnes-Hut tree (see *DeflectionsTree*), where \
+        groups of profiles whose size divided by their distance from a coordinate is below the opening angle are \
+        approximated by their monopole. The cutoff radius is not used by the tree, and the tree is shared by planes \
+        whose halos have the same positions (see *deflections_tree_from_compiled_profiles_and_opening_angle*).
+
+        The calculations of every profile class and every other profile are independent, and are evaluated by the \
+        *executor*, which can evaluate them concurrently on a thread pool (see *executor.ThreadedExecutor*).
+
+        The profiles of the galaxies are packed every time a quantity is computed, which costs little compared to \
+        evaluating them, such that profiles changed in-place are used without recompiling the plane.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The galaxies of the plane.
+        memory_budget : int or None
+            The maximum number of bytes of the arrays of a broadcast chunk, which defaults to the class attribute.
+        cutoff_radius : float or None
+            The distance from a grid beyond which the deflection angles of profiles with a broadcast kernel are \
+            approximated, which defaults to the class attribute (no cutoff).
+        opening_angle : float or None
+            The opening angle of the Barnes-Hut tree used to compute the deflection angles of profiles with a \
+            broadcast kernel, which defaults to the class attribute (no tree).
+        executor : SerialExecutor or ThreadedExecutor or None
+            The executor which evaluates the calculations of the profiles, which defaults to the serial executor.
+        """
+        self.galaxies = galaxies
+        self.memory_budget = memory_budget or self.memory_budget
+        self.cutoff_radius = (
+            cutoff_radius if cutoff_radius is not None else self.cutoff_radius
+        )
+        self.opening_angle = (
+            opening_angle if opening_angle is not None else self.opening_angle
+        )
+        self.executor = executor or ex.serial_executor
+        self.deflections_cutoff_error = 0.0
+
+    @property
+    def light_profiles(self):
+        return [
+            profile for galaxy in self.galaxies for profile in galaxy.light_profiles
+        ]
+
+    @property
+    def mass_profiles(self):
+        return [profile for galaxy in self.galaxies for profile in galaxy.mass_profiles]
+
+    def compiled_and_other_profiles_from_profiles_and_kernels(self, profiles, kernels):
+        """Group a list of profiles by their class, returning a list of every group with a kernel and at least \
+        *kernel_minimum_profiles* profiles as a (kernel, *CompiledProfiles*) tuple and a list of the remaining \
+        profiles."""
+
+        kernel_classes = [
+            profile_class
+            for profile_class in kernels
+            if sum(profile.__class__ is profile_class for profile in profiles)
+            >= self.kernel_minimum_profiles
+        ]
+
+        profiles_of_classes = {}
+        other_profiles = []
+
+        for profile in profiles:
+            if profile.__class__ in kernel_classes:
+                profiles_of_classes.setdefault(profile.__class__, []).append(profile)
+            else:
+                other_profiles.append(profile)
+
+        compiled_profiles = [
+            (
+                kernels[profile_class][0],
+                CompiledProfiles(
+                    profiles=profiles_of_class,
+                    parameter_names=kernels[profile_class][1],
+                ),
+            )
+            for profile_class, profiles_of_class in profiles_of_classes.items()
+        ]
+
+        return compiled_profiles, other_profiles
+
+    def results_of_calculations_accumulated_into_output(self, calculations, out):
+        """Evaluate a list of independent calculations, each of which adds a quantity to an input output array, \
+        accumulating their quantities into the output array *out* and returning the list of their return values.
+
+        With a serial executor every calculation adds its quantity directly to *out*. Otherwise the calculations \
+        are evaluated concurrently by the executor (see *executor.ThreadedExecutor*) into their own arrays, which \
+        are added to *out* in the order of the calculations such that the result is deterministic.
+        """
+        if self.executor.threads == 1:
+            return [calculation(out=out) for calculation in calculations]
+
+        def quantity_and_result_from_calculation(calculation):
+            quantity = np.zeros(out.shape)
+            return quantity, calculation(out=quantity)
+
+        results = []
+
+        for quantity, result in self.executor.map(
+            quantity_and_result_from_calculation, calculations
+        ):
+            out += quantity
+            results.append(result)
+
+        return results
+
+    def calculations_from_grid(self, grid, profiles, kernels, func_name):
+        """The calculations which add a quantity of a list of profiles on a grid to an output array, with one \
+        calculation for every class of profiles with a kernel (see *add_kernel_quantity_from_grid*) and one for \
+        every other profile, whose quantity is computed by its method *func_name*."""
+
+        compiled_profiles, other_profiles = self.compiled_and_other_profiles_from_profiles_and_kernels(
+            profiles=profiles, kernels=kernels
+        )
+
+        coordinates = np.asarray(grid)
+
+        return [
+            partial(
+                add_kernel_quantity_from_grid,
+                grid=coordinates,
+                quantities_func=quantities_func,
+                compiled_profiles=profiles_of_class,
+                memory_budget=self.memory_budget,
+            )
+            for quantities_func, profiles_of_class in compiled_profiles
+        ] + [
+            partial(
+                add_profile_quantity_from_grid,
+                profile=profile,
+                func_name=func_name,
+                grid=grid,
+            )
+            for profile in other_profiles
+        ]
+
+    def quantity_from_grid(self, grid, profiles, kernels, func_name, out):
+
+        self.results_of_calculations_accumulated_into_output(
+            calculations=self.calculations_from_grid(
+                grid=grid, profiles=profiles, kernels=kernels, func_name=func_name
+            ),
+            out=out,
+        )
+
+        return out
+
+    def profile_image_from_grid(self, grid, out=None):
+        """Compute the summed image of the light profiles on a grid, accumulated into the 1D output array *out* \
+        (which is created if not input)."""
+        if out is None:
+            out = np.zeros(grid.shape[0])
+
+        return self.quantity_from_grid(
+            grid=grid,
+            profiles=self.light_profiles,
+            kernels=profile_image_kernels,
+            func_name="profile_image_from_grid",
+            out=out,
+        )
+
+    def convergence_from_grid(self, grid, out=None):
+        """Compute the summed convergence of the mass profiles on a grid, accumulated into the 1D output array \
+        *out* (which is created if not input)."""
+        if out is None:
+            out = np.zeros(grid.shape[0])
+
+        return self.quantity_from_grid(
+            grid=grid,
+            profiles=self.mass_profiles,
+            kernels=convergence_kernels,
+            func_name="convergence_from_grid",
+            out=out,
+        )
+
+    def potential_from_grid(self, grid, out=None):
+        """Compute the summed potential of the mass profiles on a grid, accumulated into the 1D output array *out* \
+        (which is created if not input)."""
+        if out is None:
+            out = np.zeros(grid.shape[0])
+
+        return self.quantity_from_grid(
+            grid=grid,
+            profiles=self.mass_profiles,
+            kernels=potential_kernels,
+            func_name="potential_from_grid",
+            out=out,
+        )
+
+    def deflections_from_grid(self, grid, out=None):
+        """Compute the summed (y,x) deflection angles of the mass profiles on a grid, accumulated into the 2D \
+        output array *out* of shape (total_coordinates, 2) (which is created if not input)."""
+        if out is None:
+            out = np.zeros((grid.shape[0], 2))
+
+        broadcast_profiles, other_profiles = self.compiled_and_other_profiles_from_profiles_and_kernels(
+            profiles=self.mass_profiles, kernels=broadcast_deflections_kernels
+        )
+
+        calculations = []
+
+        for radial_deflections_func, profiles_of_class in broadcast_profiles:
+
+            if self.opening_angle is not None:
+                calculations.append(
+                    partial(
+                        deflections_tree_from_compiled_profiles_and_opening_angle(
+                            compiled_profiles=profiles_of_class,
+                            radial_deflections_func=radial_deflections_func,
+                            opening_angle=self.opening_angle,
+                        ).deflections_from_grid,
+                        grid=np.asarray(grid),
+                    )
+                )
+            else:
+                calculations.append(
+                    partial(
+                        broadcast_deflections_from_grid,
+                        grid=np.asarray(grid),
+                        radial_deflections_func=radial_deflections_func,
+                        compiled_profiles=profiles_of_class,
+                        memory_budget=self.memory_budget,
+                        cutoff_radius=self.cutoff_radius,
+                    )
+                )
+
+        calculations += self.calculations_from_grid(
+            grid=grid,
+            profiles=other_profiles,
+            kernels=deflections_kernels,
+            func_name="deflections_from_grid",
+        )
+
+        results = self.results_of_calculations_accumulated_into_output(
+            calculations=calculations, out=out
+        )
+
+        self.deflections_cutoff_error = sum(
+            result for result in results if isinstance(result, float)
+        )
+
+        return out
+
+
+class CompiledPlaneBatch:
+
+    memory_budget = CompiledPlane.memory_budget
+
+    def __init__(self, galaxies_of_batch, memory_budget=None):
+        """A compiled representation of the galaxies of the same plane of a batch of tracers (see \
+        *ray_tracing.TracerBatch*), which evaluates the summed profile images and deflection angles of every plane \
+        in the batch on a batch of grids.
+
+        The profiles of every class with a kernel (see *CompiledPlane*) which every plane has the same number of, \
+        for example the profiles of tracers of the same model, are packed into a *CompiledProfiles* whose \
+        centres and parameters have a leading batch axis. The kernel evaluates them on the grids of the whole batch \
+        as one (total_batch, total_profiles, total_coordinates) calculation. The quantities of other profiles are \
+        computed by their own methods on the grid of their plane.
+
+        Parameters
+        ----------
+        galaxies_of_batch : [[Galaxy]]
+            The galaxies of the plane of every tracer in the batch.
+        memory_budget : int or None
+            The maximum number of bytes of the arrays of a kernel chunk, which defaults to the class attribute.
+        """
+        self.galaxies_of_batch = galaxies_of_batch
+        self.memory_budget = memory_budget or self.memory_budget
+
+    @property
+    def batch_size(self):
+        return len(self.galaxies_of_batch)
+
+    @property
+    def light_profiles_of_batch(self):
+        return [
+            [profile for galaxy in galaxies for profile in galaxy.light_profiles]
+            for galaxies in self.galaxies_of_batch
+        ]
+
+    @property
+    def mass_profiles_of_batch(self):
+        return [
+            [profile for galaxy in galaxies for profile in galaxy.mass_profiles]
+            for galaxies in self.galaxies_of_batch
+        ]
+
+    @staticmethod
+    def compiled_and_other_profiles_of_batch_from_profiles_and_kernels(
+        profiles_of_batch, kernels
+    ):
+        """Group the profiles of every plane in the batch by their class, returning a list of every class with a \
+        kernel which every plane has the same number of profiles of as a (kernel, *CompiledProfiles*) tuple, with a \
+        leading batch axis, and a list of the remaining profiles of every plane."""
+
+        kernel_classes = []
+
+        for profile_class in kernels:
+
+            total_profiles_of_batch = {
+                sum(profile.__class__ is profile_class for profile in profiles)
+                for profiles in profiles_of_batch
+            }
+
+            if len(total_profiles_of_batch) == 1 and 0 not in total_profiles_of_batch:
+                kernel_classes.append(profile_class)
+
+        compiled_profiles = [
+            (
+                kernels[profile_class][0],
+                CompiledProfiles.from_batch_of_profiles(
+                    batch_of_profiles=[
+                        [
+                            profile
+                            for profile in profiles
+                            if profile.__class__ is profile_class
+                        ]
+                        for profiles in profiles_of_batch
+                    ],
+                    parameter_names=kernels[profile_class][1],
+                ),
+            )
+            for profile_class in kernel_classes
+        ]
+
+        other_profiles_of_batch = [
+            [profile for profile in profiles if profile.__class__ not in kernel_classes]
+            for profiles in profiles_of_batch
+        ]
+
+        return compiled_profiles, other_profiles_of_batch
+
+    def add_other_profiles_quantity_from_grids(
+        self, grids_of_batch, other_profiles_of_batch, func_name, out
+    ):
+        """Add a quantity of the profiles without a kernel of every plane in the batch, computed by their method \
+        *func_name* on the grid of their plane, to the output array *out*."""
+
+        for (batch_index, profiles) in enumerate(other_profiles_of_batch):
+
+            if not profiles:
+                continue
+
+            grid = grids.GridIrregular(grid=grids_of_batch[batch_index])
+
+            for profile in profiles:
+                add_profile_quantity_from_grid(
+                    profile=profile,
+                    func_name=func_name,
+                    grid=grid,
+                    out=out[batch_index],
+                )
+
+    def profile_images_from_grids(self, grids_of_batch, out=None):
+        """Compute the summed image of the light profiles of every plane in the batch on its grid, where \
+        *grids_of_batch* has shape (total_batch, total_coordinates, 2), accumulated into the output array *out* of \
+        shape (total_batch, total_coordinates) (which is created if not input)."""
+        if out is None:
+            out = np.zeros(grids_of_batch.shape[:-1])
+
+        compiled_profiles, other_profiles_of_batch = self.compiled_and_other_profiles_of_batch_from_profiles_and_kernels(
+            profiles_of_batch=self.light_profiles_of_batch,
+            kernels=profile_image_kernels,
+        )
+
+        for quantities_func, profiles_of_class in compiled_profiles:
+            add_kernel_quantity_from_grid(
+                grid=grids_of_batch,
+                quantities_func=quantities_func,
+                compiled_profiles=profiles_of_class,
+                memory_budget=self.memory_budget,
+                out=out,
+            )
+
+        self.add_other_profiles_quantity_from_grids(
+            grids_of_batch=grids_of_batch,
+            other_profiles_of_batch=other_profiles_of_batch,
+            func_name="profile_image_from_grid",
+            out=out,
+        )
+
+        return out
+
+    def deflections_from_grids(self, grids_of_batch, out=None):
+        """Compute the summed (y,x) deflection angles of the mass profiles of every plane in the batch on its grid, \
+        where *grids_of_batch* has shape (total_batch, total_coordinates, 2), accumulated into the output array *out* \
+        of the same shape (which is created if not input).
+
+        Classes with a broadcast kernel (see *broadcast_deflections_kernels*) are always evaluated exactly, \
+        without a cutoff radius or tree."""
+        if out is None:
+            out = np.zeros(grids_of_batch.shape)
+
+        compiled_profiles, other_profiles_of_batch = self.compiled_and_other_profiles_of_batch_from_profiles_and_kernels(
+            profiles_of_batch=self.mass_profiles_of_batch,
+            kernels={**deflections_kernels, **broadcast_deflections_kernels},
+        )
+
+        for kernel, profiles_of_class in compiled_profiles:
+            if profiles_of_class.profile_class in broadcast_deflections_kernels:
+                broadcast_deflections_from_grid(
+                    grid=grids_of_batch,
+                    radial_deflections_func=kernel,
+                    compiled_profiles=profiles_of_class,
+                    memory_budget=self.memory_budget,
+                    cutoff_radius=None,
+                    out=out,
+                )
+            else:
+                add_kernel_quantity_from_grid(
+                    grid=grids_of_batch,
+                    quantities_func=kernel,
+                    compiled_profiles=profiles_of_class,
+                    memory_budget=self.memory_budget,
+                    out=out,
+                )
+
+        self.add_other_profiles_quantity_from_grids(
+            grids_of_batch=grids_of_batch,
+            other_profiles_of_batch=other_profiles_of_batch,
+            func_name="deflections_from_grid",
+            out=out,
+        )
+
+        return out
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+
+import autofit as af
+
+
+class CriticalCurvesCache:
+
+    max_size = 16
+
+    def __init__(self):
+        """A least-recently-used cache of the critical curves and caustics of lensing objects (planes and tracers), \
+        keyed by the redshifts and mass-profile parameters of the object (see *Tracer.critical_curves_key*) and the \
+        configuration of its calculation grid (see *key_from_lensing_obj*).
+
+        Critical curves are computed by contouring the eigen values of the lensing jacobian over a calculation \
+        grid, which is expensive, yet the same mass model is visualized and plotted many times (e.g. the maximum \
+        likelihood model of a phase on every visualization, in every plot of a subplot and by its result). Every \
+        plane and tracer with the same key therefore shares the cached critical curves and caustics, which are \
+        computed once for the *max_size* most recently used mass models.
+
+        The number of times a key was and was not in the cache are counted as *hits* and *misses*.
+        """
+        self.critical_curves_and_caustics = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def entry_from_key(self, key):
+
+        if key in self.critical_curves_and_caustics:
+            self.hits += 1
+            self.critical_curves_and_caustics.move_to_end(key)
+        else:
+            self.misses += 1
+            self.critical_curves_and_caustics[key] = {}
+
+            while len(self.critical_curves_and_caustics) > self.max_size:
+                self.critical_curves_and_caustics.popitem(last=False)
+
+        return self.critical_curves_and_caustics[key]
+
+    @staticmethod
+    def key_from_lensing_obj(lensing_obj):
+        """The key of a plane or tracer in the cache, which is its *critical_curves_key* and the configuration of \
+        the calculation grid its critical curves are computed on.
+
+        The calculation grid has the configured number of pixels and spans the region whose convergence is above \
+        the configured threshold, such that for a given mass model these determine the grid's shape and pixel \
+        scale. They are used instead of the grid itself, whose bounding box is found by root-finding every time it \
+        is computed."""
+        return (
+            lensing_obj.critical_curves_key,
+            af.conf.instance.general.get("calculation_grid", "pixels", int),
+            af.conf.instance.general.get(
+                "calculation_grid", "convergence_threshold", float
+            ),
+        )
+
+    def critical_curves_from_lensing_obj(self, lensing_obj):
+        """The [tangential, radial] critical curves of a plane or tracer, which are computed (see \
+        *critical_curves_from_calculation_grid*) if no object with the same key has computed them."""
+
+        entry = self.entry_from_key(
+            key=self.key_from_lensing_obj(lensing_obj=lensing_obj)
+        )
+
+        return self.critical_curves_from_entry_and_lensing_obj(
+            entry=entry, lensing_obj=lensing_obj
+        )
+
+    def caustics_from_lensing_obj(self, lensing_obj):
+        """The [tangential, radial] caustics of a plane or tracer, which are its critical curves ray-traced to the \
+        source-plane (see *caustics_from_critical_curves*), computed if no object with the same key has computed \
+        them."""
+
+        entry = self.entry_from_key(
+            key=self.key_from_lensing_obj(lensing_obj=lensing_obj)
+        )
+
+        if "caustics" not in entry:
+            entry["caustics"] = lensing_obj.caustics_from_critical_curves(
+                critical_curves=self.critical_curves_from_entry_and_lensing_obj(
+                    entry=entry, lensing_obj=lensing_obj
+                )
+            )
+
+        return entry["caustics"]
+
+    @staticmethod
+    def critical_curves_from_entry_and_lensing_obj(entry, lensing_obj):
+
+        if "critical_curves" not in entry:
+            entry[
+                "critical_curves"
+            ] = lensing_obj.critical_curves_from_calculation_grid()
+
+        return entry["critical_curves"]
+
+    def clear(self):
+        self.critical_curves_and_caustics.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# The cache shared by every plane and tracer, and therefore by the visualizer, plots and results.
+critical_curves_cache = CriticalCurvesCache()
@@ -0,0 +1,409 @@
+import numpy as np
+
+from autoarray.structures import grids
+from autolens.lens import positions_solver
+
+
+def jacobian_determinants_and_eigen_values_from_tracer_and_grid(tracer, grid, step):
+    """Compute the determinant and the tangential and radial eigen values of the Jacobian of the lens mapping (from \
+    the image-plane to the source-plane) at every (y,x) coordinate of a grid.
+
+    The Jacobian is computed by central finite differences of the coordinates ray-traced to the source-plane, \
+    such that it includes every plane of a multi-plane tracer. For a single lens plane its eigen values are \
+    1 - convergence - shear and 1 - convergence + shear, and for multiple planes the convergence and shear are those \
+    of the symmetric part of the Jacobian (the rotation it gains between planes changes the determinant but not \
+    which eigen value is zero on a critical curve).
+
+    Parameters
+    ----------
+    tracer : Tracer
+        The tracer whose lens mapping is differentiated.
+    grid : ndarray
+        The (y,x) image-plane coordinates of shape (total_coordinates, 2) where the Jacobian is computed.
+    step : float
+        The offset of the coordinates the finite differences are computed from.
+    """
+    offsets = step * np.array([[1.0, 0.0], [-1.0, 0.0], [0.0, 1.0], [0.0, -1.0]])
+
+    traced_grid = positions_solver.PositionsFinder.source_plane_grid_from_tracer_and_grid(
+        tracer=tracer,
+        grid=(grid[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, 2),
+    )
+    traced_grid = traced_grid.reshape(-1, 4, 2)
+
+    derivatives_y = (traced_grid[:, 0] - traced_grid[:, 1]) / (2.0 * step)
+    derivatives_x = (traced_grid[:, 2] - traced_grid[:, 3]) / (2.0 * step)
+
+    determinants = (
+        derivatives_y[:, 0] * derivatives_x[:, 1]
+        - derivatives_x[:, 0] * derivatives_y[:, 1]
+    )
+
+    one_minus_convergence = 0.5 * (derivatives_y[:, 0] + derivatives_x[:, 1])
+    shear = np.hypot(
+        0.5 * (derivatives_y[:, 0] - derivatives_x[:, 1]),
+        0.5 * (derivatives_x[:, 0] + derivatives_y[:, 1]),
+    )
+
+    return determinants, one_minus_convergence - shear, one_minus_convergence + shear
+
+
+# The 4 edges of a cell, as the indexes of their 2 corners in *positions_solver.cell_corner_offsets* (bottom, top,
+# left and right).
+cell_edges = np.array([[0, 1], [2, 3], [0, 2], [1, 3]])
+
+# The offsets of a cell and its 4 neighbours which share an edge with it.
+cell_neighbour_offsets = np.array([[0, 0], [-1, 0], [1, 0], [0, -1], [0, 1]])
+
+# The pairs of edges joined by the contour in a cell whose 4 edges are all crossed (a saddle), if its centre has the
+# same sign as its (0, 0) corner, which separates the (0, 1) and (1, 0) corners, and otherwise.
+saddle_edge_pairs_joining_corners_0_and_3 = [(0, 3), (2, 1)]
+saddle_edge_pairs_separating_corners_0_and_3 = [(0, 2), (1, 3)]
+
+
+class CriticalCurvesFinder:
+
+    # The size of the cells of the coarse grid in units of the pixel scale of the grid, if not input.
+    coarse_pixel_scale_factor = 8.0
+
+    # The size of the cells the contours are refined to in units of the pixel scale of the grid, if not input.
+    pixel_scale_precision_factor = 0.25
+
+    # The tolerance the contours are located to by bisection in units of the pixel scale precision, if not input.
+    tolerance_factor = 0.01
+
+    # The step of the finite differences of the Jacobian in units of the pixel scale precision.
+    jacobian_step_factor = 0.01
+
+    def __init__(
+        self, grid, pixel_scale_precision=None, tolerance=None, coarse_pixel_scale=None
+    ):
+        """Finds the critical curves of a tracer (where the determinant of the Jacobian of its lens mapping is zero) \
+        by following the contours of the determinant through an adaptive grid, which are located by bisection.
+
+        The determinant is computed on the corners of a coarse grid of square cells covering the region of the input \
+        *grid*. Only cells whose corners have different signs are crossed by a critical curve, and these and their \
+        neighbours (which a curve bending between two cells may cross without changing the sign of their corners) \
+        are refined, by dividing them into 4 cells of half the size, until their size is below \
+        *pixel_scale_precision*. The point where the contour crosses each edge of a final cell is then located by \
+        bisection to within *tolerance*, and the points are joined cell-to-cell (by marching squares) into ordered \
+        contours.
+
+        The number of coordinates ray-traced after the coarse grid therefore scales with the length of the critical \
+        curves divided by the precision, rather than with the square of the resolution of a magnification map, and \
+        the accuracy of every point is set by the tolerance rather than the pixel scale. Critical curves smaller \
+        than a coarse cell (by default 8 pixels of the grid), which do not cross its corners, may not be found.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid whose extent defines the region of the image-plane that is searched (e.g. the *calculation_grid* \
+            of a tracer).
+        pixel_scale_precision : float or None
+            The size of the cells below which the refinement stops, which sets the spacing of the points of the \
+            critical curves.
+        tolerance : float or None
+            The distance to which every point of a critical curve is located by bisection.
+        coarse_pixel_scale : float or None
+            The size of the cells of the coarse grid the search begins from.
+        """
+        self.grid = grid
+
+        pixel_scale = np.min(grid.pixel_scales)
+
+        self.coarse_pixel_scale = (
+            coarse_pixel_scale
+            if coarse_pixel_scale is not None
+            else self.coarse_pixel_scale_factor * pixel_scale
+        )
+        self.pixel_scale_precision = (
+            pixel_scale_precision
+            if pixel_scale_precision is not None
+            else self.pixel_scale_precision_factor * pixel_scale
+        )
+        self.tolerance = (
+            tolerance
+            if tolerance is not None
+            else self.tolerance_factor * self.pixel_scale_precision
+        )
+
+    def determinants_from_tracer_and_grid(self, tracer, grid):
+        return jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+            tracer=tracer,
+            grid=grid,
+            step=self.jacobian_step_factor * self.pixel_scale_precision,
+        )[0]
+
+    def cells_and_corner_signs_from_tracer(self, tracer):
+        """Refine the coarse grid around the zero contours of the Jacobian determinant, returning the origin, the \
+        final pixel scale, the integer (y,x) indexes of the final cells crossed by a contour, the integer lattice \
+        of their unique corners, the index of every cell corner in that lattice and the sign of the determinant \
+        (*True* if positive) at every lattice corner."""
+
+        origin, cells = positions_solver.origin_and_cells_from_grid_and_pixel_scale(
+            grid=self.grid, pixel_scale=self.coarse_pixel_scale
+        )
+        pixel_scale = self.coarse_pixel_scale
+
+        total_cells = np.max(cells, axis=0) + 1
+
+        while True:
+
+            corners = (
+                cells[:, np.newaxis, :]
+                + positions_solver.cell_corner_offsets[np.newaxis, :, :]
+            )
+
+            unique_corners, corner_indexes = np.unique(
+                corners.reshape(-1, 2), axis=0, return_inverse=True
+            )
+
+            corner_indexes = corner_indexes.reshape(-1, 4)
+
+            determinants = self.determinants_from_tracer_and_grid(
+                tracer=tracer, grid=origin + pixel_scale * unique_corners
+            )
+
+            signs = determinants > 0.0
+
+            cell_signs = signs[corner_indexes]
+
+            crossed = np.any(cell_signs, axis=1) & ~np.all(cell_signs, axis=1)
+
+            cells = cells[crossed]
+            corner_indexes = corner_indexes[crossed]
+
+            if cells.shape[0] == 0 or pixel_scale <= self.pixel_scale_precision:
+                return (
+                    origin,
+                    pixel_scale,
+                    cells,
+                    unique_corners,
+                    corner_indexes,
+                    signs,
+                    determinants,
+                )
+
+            # A contour which enters and leaves a cell through the same edge does not change the sign of its
+            # corners, thus the neighbours of every crossed cell are refined too, such that contours are not broken
+            # where they bend between two cells.
+
+            cells = np.unique(
+                (
+                    cells[:, np.newaxis, :] + cell_neighbour_offsets[np.newaxis, :, :]
+                ).reshape(-1, 2),
+                axis=0,
+            )
+            cells = cells[np.all((cells >= 0) & (cells < total_cells), axis=1)]
+
+            pixel_scale *= 0.5
+            total_cells *= 2
+
+            cells = (
+                2 * cells[:, np.newaxis, :]
+                + positions_solver.cell_corner_offsets[np.newaxis, :, :]
+            ).reshape(-1, 2)
+
+    def points_from_tracer_and_edges(
+        self, tracer, lower_points, upper_points, lower_signs
+    ):
+        """Locate the zero of the Jacobian determinant on every edge between a pair of points by bisection, \
+        stopping once the edges are shorter than the tolerance."""
+
+        edge_length = np.max(np.hypot(*(upper_points - lower_points).T))
+
+        while edge_length > self.tolerance:
+
+            middle_points = 0.5 * (lower_points + upper_points)
+
+            middle_signs = (
+                self.determinants_from_tracer_and_grid(
+                    tracer=tracer, grid=middle_points
+                )
+                > 0.0
+            )
+
+            same_sign = middle_signs == lower_signs
+
+            lower_points = np.where(
+                same_sign[:, np.newaxis], middle_points, lower_points
+            )
+            upper_points = np.where(
+                same_sign[:, np.newaxis], upper_points, middle_points
+            )
+
+            edge_length *= 0.5
+
+        return 0.5 * (lower_points + upper_points)
+
+    def contours_from_tracer(self, tracer):
+        """Find every zero contour of the Jacobian determinant of a tracer, as a list of ndarrays of the ordered \
+        (y,x) coordinates of each contour. Closed contours end with their first coordinate."""
+
+        origin, pixel_scale, cells, unique_corners, corner_indexes, signs, determinants = self.cells_and_corner_signs_from_tracer(
+            tracer=tracer
+        )
+
+        if cells.shape[0] == 0:
+            return []
+
+        # Every cell edge is identified by the lattice indexes of its 2 corners, such that the edges shared by
+        # neighbouring cells are located once and join the contour segments of both cells.
+
+        edge_corner_indexes = corner_indexes[:, cell_edges]
+
+        crossed_edges = (
+            signs[edge_corner_indexes[:, :, 0]] != signs[edge_corner_indexes[:, :, 1]]
+        )
+
+        unique_edges, edge_indexes = np.unique(
+            edge_corner_indexes[crossed_edges], axis=0, return_inverse=True
+        )
+
+        cell_edge_indexes = np.full(crossed_edges.shape, -1)
+        cell_edge_indexes[crossed_edges] = edge_indexes.reshape(-1)
+
+        points = self.points_from_tracer_and_edges(
+            tracer=tracer,
+            lower_points=origin + pixel_scale * unique_corners[unique_edges[:, 0]],
+            upper_points=origin + pixel_scale * unique_corners[unique_edges[:, 1]],
+            lower_signs=signs[unique_edges[:, 0]],
+        )
+
+        neighbours = [[] for _ in range(points.shape[0])]
+
+        for cell_index in range(cells.shape[0]):
+
+            edges = cell_edge_indexes[cell_index]
+
+            if np.all(edges >= 0):
+
+                centre_sign = np.mean(determinants[corner_indexes[cell_index]]) > 0.0
+
+                edge_pairs = (
+                    saddle_edge_pairs_joining_corners_0_and_3
+                    if centre_sign == signs[corner_indexes[cell_index, 0]]
+                    else saddle_edge_pairs_separating_corners_0_and_3
+                )
+
+            else:
+
+                edge_pairs = [tuple(np.where(edges >= 0)[0])]
+
+            for edge_0, edge_1 in edge_pairs:
+                neighbours[edges[edge_0]].append(edges[edge_1])
+                neighbours[edges[edge_1]].append(edges[edge_0])
+
+        return [
+            points[contour]
+            for contour in self.contours_from_neighbours(neighbours=neighbours)
+        ]
+
+    @staticmethod
+    def contours_from_neighbours(neighbours):
+        """Join the points of the contour segments into ordered contours, given the (at most 2) neighbours of every \
+        point. Contours which leave the grid (whose end points have 1 neighbour) are followed from one end first, \
+        and the remaining contours are closed."""
+
+        visited = np.zeros(len(neighbours), dtype="bool")
+
+        start_indexes = [
+            index for index in range(len(neighbours)) if len(neighbours[index]) == 1
+        ] + list(range(len(neighbours)))
+
+        contours = []
+
+        for start_index in start_indexes:
+
+            if visited[start_index]:
+                continue
+
+            contour = [start_index]
+            visited[start_index] = True
+
+            while True:
+
+                unvisited_neighbours = [
+                    neighbour
+                    for neighbour in neighbours[contour[-1]]
+                    if not visited[neighbour]
+                ]
+
+                if len(unvisited_neighbours) == 0:
+                    break
+
+                contour.append(unvisited_neighbours[0])
+                visited[unvisited_neighbours[0]] = True
+
+            if len(contour) > 2 and contour[0] in neighbours[contour[-1]]:
+                contour.append(contour[0])
+
+            contours.append(contour)
+
+        return contours
+
+    def critical_curves_from_tracer(self, tracer):
+        """Find the [tangential, radial] critical curves of a tracer, in the same format as *lensing.LensingObject*.
+
+        Every contour is classified as tangential or radial depending on which eigen value of the Jacobian is \
+        closest to zero along it, and the longest contour of each type is returned (or an empty list if there is \
+        no contour of that type).
+
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer whose critical curves are found, which can have any number of planes.
+        """
+
+        tangential_critical_curve = []
+        radial_critical_curve = []
+
+        for contour in sorted(
+            self.contours_from_tracer(tracer=tracer), key=len, reverse=True
+        ):
+
+            _, tangential_eigen_values, radial_eigen_values = jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+                tracer=tracer,
+                grid=contour,
+                step=self.jacobian_step_factor * self.pixel_scale_precision,
+            )
+
+            if np.median(np.abs(tangential_eigen_values)) < np.median(
+                np.abs(radial_eigen_values)
+            ):
+                if len(tangential_critical_curve) == 0:
+                    tangential_critical_curve = grids.GridIrregular(grid=contour)
+            elif len(radial_critical_curve) == 0:
+                radial_critical_curve = grids.GridIrregular(grid=contour)
+
+        return [tangential_critical_curve, radial_critical_curve]
+
+    @staticmethod
+    def caustics_from_tracer_and_critical_curves(tracer, critical_curves):
+        """The caustics of a list of critical curves, which are the critical curves ray-traced to the source-plane \
+        through every plane of the tracer."""
+
+        return [
+            grids.GridIrregular(
+                grid=positions_solver.PositionsFinder.source_plane_grid_from_tracer_and_grid(
+                    tracer=tracer, grid=np.asarray(critical_curve)
+                )
+            )
+            if len(critical_curve) > 0
+            else []
+            for critical_curve in critical_curves
+        ]
+
+    @staticmethod
+    def einstein_radius_from_critical_curve(critical_curve):
+        """Estimate the Einstein radius from a (tangential) critical curve, as the radius of the circle with the \
+        same area as the curve encloses."""
+
+        if len(critical_curve) == 0:
+            return 0.0
+
+        y, x = np.asarray(critical_curve)[:, 0], np.asarray(critical_curve)[:, 1]
+
+        area = np.abs(0.5 * np.sum(y[:-1] * np.diff(x) - x[:-1] * np.diff(y)))
+
+        return np.sqrt(area / np.pi)
@@ -0,0 +1,131 @@
+import numpy as np
+
+from autoarray.structures import grids
+from autolens.lens import positions_solver
+
+
+class DeflectionsInterpolator:
+    def __init__(self, pixel_scale_interpolation_grid, tolerance):
+        """Computes the deflection angles of a plane on a (traced) grid by evaluating them exactly on a coarse grid \
+        of square cells and interpolating them bilinearly to the coordinates of the grid, with error control.
+
+        The coarse grid is built in the frame of the coordinates it interpolates to, i.e. the grid traced to the \
+        plane, such that every plane of a multi-plane tracer is interpolated between coordinates in its own frame. \
+        Only the cells which contain a coordinate are used, and the corners they share are evaluated once.
+
+        The interpolation error of every cell is estimated by also evaluating the deflection angles exactly at its \
+        centre, where the error of bilinear interpolation is largest, and comparing them to the interpolated \
+        values. The deflection angles of every coordinate in a cell whose error exceeds *tolerance* (e.g. cells \
+        close to the centre of a cuspy mass profile) are evaluated exactly instead.
+
+        The number of coordinates that were and were not interpolated are counted as *total_interpolated* and \
+        *total_exact*.
+
+        Parameters
+        ----------
+        pixel_scale_interpolation_grid : float
+            The size of the cells of the coarse grid.
+        tolerance : float or None
+            The maximum estimated error of the interpolated deflection angles of a cell, above which they are \
+            evaluated exactly. If *None*, every cell is interpolated.
+        """
+        self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+        self.tolerance = tolerance
+        self.total_interpolated = 0
+        self.total_exact = 0
+
+    @staticmethod
+    def exact_deflections_from_plane_and_grid(plane, grid):
+        return np.asarray(
+            plane.deflections_from_grid(grid=grids.GridIrregular(grid=grid))
+        )
+
+    def deflections_from_plane_and_grid(self, plane, grid):
+        """Compute the deflection angles of a plane on a grid of (y,x) coordinates in the plane's frame, returning \
+        an ndarray of shape (total_coordinates, 2).
+
+        Parameters
+        ----------
+        plane : Plane
+            The plane whose deflection angles are computed.
+        grid : aa.Grid or ndarray
+            The (y,x) coordinates of the grid traced to the plane.
+        """
+
+        coordinates = np.asarray(grid)
+
+        if not plane.has_mass_profile:
+            return np.zeros(coordinates.shape)
+
+        pixel_scale = self.pixel_scale_interpolation_grid
+
+        origin = np.min(coordinates, axis=0)
+
+        scaled_coordinates = (coordinates - origin) / pixel_scale
+
+        coordinate_cells = np.floor(scaled_coordinates).astype("int")
+
+        cells, cell_indexes = np.unique(coordinate_cells, axis=0, return_inverse=True)
+        cell_indexes = cell_indexes.reshape(-1)
+
+        corners, corner_indexes = np.unique(
+            (
+                cells[:, np.newaxis, :]
+                + positions_solver.cell_corner_offsets[np.newaxis, :, :]
+            ).reshape(-1, 2),
+            axis=0,
+            return_inverse=True,
+        )
+        corner_indexes = corner_indexes.reshape(-1, 4)
+
+        # The cell centres are only evaluated if they are used to estimate the interpolation error.
+        nodes = (
+            corners
+            if self.tolerance is None
+            else np.concatenate((corners, cells + 0.5), axis=0)
+        )
+
+        exact_deflections = self.exact_deflections_from_plane_and_grid(
+            plane=plane, grid=origin + pixel_scale * nodes
+        )
+
+        corner_deflections = exact_deflections[: corners.shape[0]][corner_indexes]
+
+        fractions = scaled_coordinates - coordinate_cells
+
+        weights = np.stack(
+            (
+                (1.0 - fractions[:, 0]) * (1.0 - fractions[:, 1]),
+                (1.0 - fractions[:, 0]) * fractions[:, 1],
+                fractions[:, 0] * (1.0 - fractions[:, 1]),
+                fractions[:, 0] * fractions[:, 1],
+            ),
+            axis=-1,
+        )
+
+        deflections = np.einsum("ij,ijk->ik", weights, corner_deflections[cell_indexes])
+
+        total_exact = 0
+
+        if self.tolerance is not None:
+
+            errors = np.hypot(
+                *(
+                    np.mean(corner_deflections, axis=1)
+                    - exact_deflections[corners.shape[0] :]
+                ).T
+            )
+
+            exact = (errors > self.tolerance)[cell_indexes]
+
+            total_exact = int(np.sum(exact))
+
+            if total_exact > 0:
+                deflections[exact] = self.exact_deflections_from_plane_and_grid(
+                    plane=plane, grid=coordinates[exact]
+                )
+
+        self.total_exact += total_exact
+        self.total_interpolated += coordinates.shape[0] - total_exact
+
+        return deflections
@@ -0,0 +1,82 @@
+import threading
+from concurrent import futures
+
+
+class SerialExecutor:
+
+    threads = 1
+
+    def map(self, func, iterable):
+        """Evaluate a function on every item of an iterable in the calling thread, returning the results as a list \
+        in the order of the items."""
+        return list(map(func, iterable))
+
+
+# The thread pools shared by every *ThreadedExecutor* with the same number of threads.
+thread_pools = {}
+thread_pools_lock = threading.Lock()
+
+# Records whether the current thread is a worker of a thread pool, in which case nested calls are evaluated serially.
+worker_state = threading.local()
+
+
+class ThreadedExecutor:
+    def __init__(self, threads):
+        """An executor which evaluates independent calculations (e.g. the profile classes of a plane or the planes \
+        of a tracer) on a thread pool of *threads* workers, which is shared by every executor (and therefore every \
+        phase) with the same number of threads.
+
+        The profile kernels spend their time in NumPy routines which release the GIL, thus the calculations run \
+        concurrently. Results are returned in the order of the input items, such that quantities reduced from them \
+        (e.g. by summing in order) do not depend on the order the workers finish and are deterministic.
+
+        Calculations which themselves call the executor from a worker thread (e.g. a plane evaluated on the pool \
+        which fans out its profile classes) are evaluated serially in that worker, which prevents the workers \
+        blocking on tasks queued behind them.
+
+        Parameters
+        ----------
+        threads : int
+            The number of worker threads of the thread pool.
+        """
+        self.threads = threads
+
+    @property
+    def thread_pool(self):
+
+        with thread_pools_lock:
+            if self.threads not in thread_pools:
+                thread_pools[self.threads] = futures.ThreadPoolExecutor(
+                    max_workers=self.threads
+                )
+
+        return thread_pools[self.threads]
+
+    def map(self, func, iterable):
+        """Evaluate a function on every item of an iterable on the thread pool, returning the results as a list in \
+        the order of the items."""
+
+        items = list(iterable)
+
+        if len(items) < 2 or getattr(worker_state, "is_worker", False):
+            return list(map(func, items))
+
+        def worker_func(item):
+            worker_state.is_worker = True
+            try:
+                return func(item)
+            finally:
+                worker_state.is_worker = False
+
+        return list(self.thread_pool.map(worker_func, items))
+
+
+serial_executor = SerialExecutor()
+
+
+def executor_from_threads(threads):
+    """The executor which evaluates calculations on *threads* threads, which is the serial executor if *threads* \
+    is 1 or *None*."""
+    if threads is None or threads <= 1:
+        return serial_executor
+    return ThreadedExecutor(threads=threads)
@@ -7,11 +7,101 @@ from autoarray.structures import grids, visibilities as vis
 from autoarray.masked import masked_structures
 from autoastro.util import cosmology_util
 from autolens import exc
+from autolens.lens import compiled_plane as cp
+from autolens.lens import critical_curves_cache as ccc
+from autolens.lens import executor as ex
 from autoastro import dimensions as dim
 from autolens.util import lens_util
 
 
+class PlaneMetadata:
+
+    __slots__ = (
+        "has_light_profile",
+        "has_mass_profile",
+        "has_pixelization",
+        "has_regularization",
+        "has_hyper_galaxy",
+        "galaxies_with_light_profile",
+        "galaxies_with_mass_profile",
+        "galaxies_with_pixelization",
+        "galaxies_with_regularization",
+        "_light_profile_centres_of_galaxies",
+    )
+
+    def __init__(self, galaxies):
+        """The properties of a plane which depend only on which profiles, pixelizations, regularizations and hyper \
+        galaxies its galaxies have, computed once by scanning the galaxies rather than every time they are accessed.
+
+        The lists are shared by every access and must not be modified. The light profile centres are only computed \
+        when first accessed, as not every light profile has a centre.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy] or None
+            The galaxies of the plane.
+        """
+
+        galaxy_list = galaxies or []
+
+        self.galaxies_with_light_profile = [
+            galaxy for galaxy in galaxy_list if galaxy.has_light_profile
+        ]
+        self.galaxies_with_mass_profile = [
+            galaxy for galaxy in galaxy_list if galaxy.has_mass_profile
+        ]
+        self.galaxies_with_pixelization = [
+            galaxy for galaxy in galaxy_list if galaxy.has_pixelization
+        ]
+        self.galaxies_with_regularization = [
+            galaxy for galaxy in galaxy_list if galaxy.has_regularization
+        ]
+
+        self.has_light_profile = (
+            None if galaxies is None else len(self.galaxies_with_light_profile) > 0
+        )
+        self.has_mass_profile = (
+            None if galaxies is None else len(self.galaxies_with_mass_profile) > 0
+        )
+        self.has_pixelization = len(self.galaxies_with_pixelization) > 0
+        self.has_regularization = len(self.galaxies_with_regularization) > 0
+        self.has_hyper_galaxy = any(galaxy.has_hyper_galaxy for galaxy in galaxy_list)
+
+        self._light_profile_centres_of_galaxies = None
+
+    @property
+    def light_profile_centres_of_galaxies(self):
+
+        if self._light_profile_centres_of_galaxies is None:
+            self._light_profile_centres_of_galaxies = [
+                galaxy.light_profile_centres
+                for galaxy in self.galaxies_with_light_profile
+            ]
+
+        return self._light_profile_centres_of_galaxies
+
+    @property
+    def light_profile_centres(self):
+        return [
+            item
+            for light_profile_centres in self.light_profile_centres_of_galaxies
+            for item in light_profile_centres
+        ]
+
+
 class AbstractPlane(lensing.LensingObject):
+
+    # The attributes of every plane, which are stored in slots rather than the instance dictionary to reduce the
+    # memory of the many planes held when post-processing a posterior.
+    __slots__ = (
+        "redshift",
+        "cosmology",
+        "metadata",
+        "_galaxies",
+        "_executor",
+        "_compiled_plane",
+    )
+
     def __init__(self, redshift, galaxies, cosmology):
         """A plane of galaxies where all galaxies are at the same redshift.
 
@@ -43,8 +133,27 @@ class AbstractPlane(lensing.LensingObject):
                 redshift = galaxies[0].redshift
 
         self.redshift = redshift
-        self.galaxies = galaxies
         self.cosmology = cosmology
+        self._executor = ex.serial_executor
+        self.galaxies = galaxies
+
+    @property
+    def galaxies(self):
+        return self._galaxies
+
+    @galaxies.setter
+    def galaxies(self, galaxies):
+        """Set the galaxies of the plane, recomputing its metadata (see *PlaneMetadata*) and discarding its compiled \
+        plane."""
+        self._galaxies = galaxies
+        self.invalidate_metadata()
+
+    def invalidate_metadata(self):
+        """Recompute the plane's metadata and discard its compiled plane, which must be called if the profiles, \
+        pixelizations, regularizations or hyper galaxies of its galaxies are changed in-place (replacing the \
+        galaxies via *galaxies* does this automatically)."""
+        self.metadata = PlaneMetadata(galaxies=self._galaxies)
+        self._compiled_plane = None
 
     @property
     def galaxy_redshifts(self):
@@ -52,39 +161,35 @@ class AbstractPlane(lensing.LensingObject):
 
     @property
     def has_light_profile(self):
-        if self.galaxies is not None:
-            return any(
-                list(map(lambda galaxy: galaxy.has_light_profile, self.galaxies))
-            )
+        return self.metadata.has_light_profile
 
     @property
     def has_mass_profile(self):
-        if self.galaxies is not None:
-            return any(list(map(lambda galaxy: galaxy.has_mass_profile, self.galaxies)))
+        return self.metadata.has_mass_profile
 
     @property
     def has_pixelization(self):
-        return any([galaxy.pixelization for galaxy in self.galaxies])
+        return self.metadata.has_pixelization
 
     @property
     def has_regularization(self):
-        return any([galaxy.regularization for galaxy in self.galaxies])
+        return self.metadata.has_regularization
 
     @property
     def galaxies_with_light_profile(self):
-        return list(filter(lambda galaxy: galaxy.has_light_profile, self.galaxies))
+        return self.metadata.galaxies_with_light_profile
 
     @property
     def galaxies_with_mass_profile(self):
-        return list(filter(lambda galaxy: galaxy.has_mass_profile, self.galaxies))
+        return self.metadata.galaxies_with_mass_profile
 
     @property
     def galaxies_with_pixelization(self):
-        return list(filter(lambda galaxy: galaxy.has_pixelization, self.galaxies))
+        return self.metadata.galaxies_with_pixelization
 
     @property
     def galaxies_with_regularization(self):
-        return list(filter(lambda galaxy: galaxy.has_regularization, self.galaxies))
+        return self.metadata.galaxies_with_regularization
 
     @property
     def pixelization(self):
@@ -118,23 +223,15 @@ class AbstractPlane(lensing.LensingObject):
 
     @property
     def has_hyper_galaxy(self):
-        return any(list(map(lambda galaxy: galaxy.has_hyper_galaxy, self.galaxies)))
+        return self.metadata.has_hyper_galaxy
 
     @property
     def light_profile_centres(self):
-        return [
-            item
-            for light_profile_centres in self.light_profile_centres_of_galaxies
-            for item in light_profile_centres
-        ]
+        return self.metadata.light_profile_centres
 
     @property
     def light_profile_centres_of_galaxies(self):
-        return [
-            galaxy.light_profile_centres
-            for galaxy in self.galaxies
-            if galaxy.has_light_profile
-        ]
+        return self.metadata.light_profile_centres_of_galaxies
 
     @property
     def mass_profiles(self):
@@ -276,8 +373,79 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
             redshift=redshift, galaxies=galaxies, cosmology=cosmology
         )
 
+    @property
+    def compiled_plane(self):
+        """The plane's galaxies compiled into a *CompiledPlane*, which evaluates the profile image, convergence and \
+        deflection angles of all galaxies in one pass per profile class (see *compiled_plane.CompiledPlane*)."""
+        if self._compiled_plane is None:
+            self._compiled_plane = cp.CompiledPlane(
+                galaxies=self.galaxies, executor=self.executor
+            )
+        return self._compiled_plane
+
+    @property
+    def executor(self):
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor):
+        """Set the executor which evaluates the independent profile calculations of the plane's galaxies, which \
+        can evaluate them concurrently on a thread pool (see *executor.ThreadedExecutor*)."""
+        self._executor = executor
+
+        if self._compiled_plane is not None:
+            self._compiled_plane.executor = executor
+
+    @property
+    def critical_curves_key(self):
+        """The key of the plane's critical curves and caustics in the critical curves cache, which planes with the same \
+        redshift and mass profiles share (see *critical_curves_cache.CriticalCurvesCache*)."""
+        return ("Plane", lens_util.mass_profiles_key_from_planes(planes=[self]))
+
+    def critical_curves_from_calculation_grid(self):
+        """Compute the [tangential, radial] critical curves of the plane from the eigen values of its lensing \
+        jacobian on its calculation grid (see *lensing.LensingObject*), without using the critical curves cache."""
+        return [
+            lensing.LensingObject.tangential_critical_curve.fget(self),
+            lensing.LensingObject.radial_critical_curve.fget(self),
+        ]
+
+    def caustics_from_critical_curves(self, critical_curves):
+        return [
+            critical_curve - self.deflections_from_grid(grid=critical_curve)
+            if len(critical_curve) > 0
+            else []
+            for critical_curve in critical_curves
+        ]
+
+    @property
+    def critical_curves(self):
+        return ccc.critical_curves_cache.critical_curves_from_lensing_obj(
+            lensing_obj=self
+        )
+
+    @property
+    def tangential_critical_curve(self):
+        return self.critical_curves[0]
+
+    @property
+    def radial_critical_curve(self):
+        return self.critical_curves[1]
+
+    @property
+    def caustics(self):
+        return ccc.critical_curves_cache.caustics_from_lensing_obj(lensing_obj=self)
+
+    @property
+    def tangential_caustic(self):
+        return self.caustics[0]
+
+    @property
+    def radial_caustic(self):
+        return self.caustics[1]
+
     @grids.convert_coordinates_to_grid
-    def profile_image_from_grid(self, grid):
+    def profile_image_from_grid(self, grid, out=None):
         """Compute the profile-image plane image of the list of galaxies of the plane's sub-grid, by summing the
         individual images of each galaxy's light profile.
 
@@ -289,30 +457,59 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
 
         Parameters
         -----------
-
+        out : ndarray or None
+            A 1D sub-array the image is added to in-place (see *sub_array_accumulated_from_grid*), for example \
+            the summed image of several planes.
         """
-        if self.galaxies:
-            profile_image = sum(
-                map(
-                    lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
-                    self.galaxies,
-                )
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=profile_image
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=self.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.profile_image_from_grid,
+                out=out,
             )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.zeros((grid.sub_shape_1d,))
+        )
+
+    def sub_array_accumulated_from_grid(self, grid, compiled_plane_func, out=None):
+        """Add a quantity of the plane's galaxies on a grid into the output array *out* (which is created as zeros \
+        of shape (sub_shape_1d,) or (sub_shape_1d, 2) if not input), using a method of the plane's compiled plane.
+
+        Every galaxy and profile adds its values directly into *out*, rather than creating an array per galaxy and \
+        a new array per addition, so the output is wrapped in an *Array* or *Grid* once per plane (or once for \
+        all planes if the same *out* is passed to every plane).
+
+        If a profile's quantity does not have one value per coordinate of the grid (e.g. a mock profile) it cannot \
+        be added into *out*, and the summed quantities of the galaxies are returned instead, unless *out* was \
+        input."""
+
+        out_input = out is not None
+
+        if out is None:
+            out = np.zeros(
+                (grid.shape[0], 2)
+                if compiled_plane_func is cp.CompiledPlane.deflections_from_grid
+                else (grid.shape[0],)
             )
 
+        if self.galaxies:
+            try:
+                compiled_plane_func(self.compiled_plane, grid=grid, out=out)
+            except exc.CompiledPlaneException:
+                if out_input:
+                    raise
+                return sum(
+                    getattr(galaxy, compiled_plane_func.__name__)(grid=grid)
+                    for galaxy in self.galaxies
+                )
+
+        return out
+
     def profile_images_of_galaxies_from_grid(self, grid):
         return list(
             map(lambda galaxy: galaxy.profile_image_from_grid(grid=grid), self.galaxies)
         )
 
     @grids.convert_coordinates_to_grid
-    def convergence_from_grid(self, grid):
+    def convergence_from_grid(self, grid, out=None):
         """Compute the convergence of the list of galaxies of the plane's sub-grid, by summing the individual convergences \
         of each galaxy's mass profile.
 
@@ -329,21 +526,19 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
             potential is calculated on.
         galaxies : [g.Galaxy]
             The galaxies whose mass profiles are used to compute the surface densities.
+        out : ndarray or None
+            A 1D sub-array the values are added to in-place (see *sub_array_accumulated_from_grid*).
         """
-        if self.galaxies:
-            convergence = sum(
-                map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=convergence
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.full((grid.sub_shape_1d), 0.0)
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=self.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.convergence_from_grid,
+                out=out,
             )
+        )
 
     @grids.convert_coordinates_to_grid
-    def potential_from_grid(self, grid):
+    def potential_from_grid(self, grid, out=None):
         """Compute the potential of the list of galaxies of the plane's sub-grid, by summing the individual potentials \
         of each galaxy's mass profile.
 
@@ -360,30 +555,26 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
             potential is calculated on.
         galaxies : [g.Galaxy]
             The galaxies whose mass profiles are used to compute the surface densities.
+        out : ndarray or None
+            A 1D sub-array the values are added to in-place (see *sub_array_accumulated_from_grid*).
         """
-        if self.galaxies:
-            potential = sum(
-                map(lambda g: g.potential_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=potential
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.full((grid.sub_shape_1d), 0.0)
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=self.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.potential_from_grid,
+                out=out,
             )
+        )
 
     @grids.convert_coordinates_to_grid
-    def deflections_from_grid(self, grid):
-        if self.galaxies:
-            deflections = sum(
-                map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
-        else:
-            return grid.mapping.grid_stored_1d_from_sub_grid_1d(
-                sub_grid_1d=np.full((grid.sub_shape_1d, 2), 0.0)
+    def deflections_from_grid(self, grid, out=None):
+        return grid.mapping.grid_stored_1d_from_sub_grid_1d(
+            sub_grid_1d=self.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.deflections_from_grid,
+                out=out,
             )
+        )
 
     @grids.convert_coordinates_to_grid
     def traced_grid_from_grid(self, grid):
@@ -546,6 +737,11 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
             pixelization = galaxies_with_pixelization[0].pixelization
 
+            # The border relocates the grids in-place, and traced grids are memoized read-only by the tracer.
+            if inversion_uses_border:
+                grid = grid.copy()
+                sparse_grid = sparse_grid.copy() if sparse_grid is not None else None
+
             return pixelization.mapper_from_grid_and_sparse_grid(
                 grid=grid,
                 sparse_grid=sparse_grid,
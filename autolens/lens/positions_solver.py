@@ -0,0 +1,268 @@
+import numpy as np
+
+from autoarray.structures import grids
+
+
+def source_in_triangles_from_corners(corners_0, corners_1, corners_2, coordinate):
+    """Return the barycentric weights of a source-plane coordinate in a set of source-plane triangles and a boolean \
+    array which is *True* for every triangle that contains it.
+
+    Triangles of zero area (e.g. on a critical curve where the lens mapping folds) never contain the coordinate.
+
+    Parameters
+    ----------
+    corners_0, corners_1, corners_2 : ndarray
+        The (y,x) source-plane coordinates of the 3 corners of every triangle, each of shape (total_triangles, 2).
+    coordinate : ndarray
+        The (y,x) source-plane coordinate.
+    """
+    edge_1 = corners_1 - corners_0
+    edge_2 = corners_2 - corners_0
+    offset = coordinate - corners_0
+
+    determinant = edge_1[:, 0] * edge_2[:, 1] - edge_1[:, 1] * edge_2[:, 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight_1 = (offset[:, 0] * edge_2[:, 1] - offset[:, 1] * edge_2[:, 0]) / (
+            determinant
+        )
+        weight_2 = (edge_1[:, 0] * offset[:, 1] - edge_1[:, 1] * offset[:, 0]) / (
+            determinant
+        )
+
+    weights = np.stack((1.0 - weight_1 - weight_2, weight_1, weight_2), axis=-1)
+
+    inside = np.all(weights >= -PositionsFinder.triangle_tolerance, axis=-1)
+    inside &= determinant != 0.0
+
+    return weights, inside
+
+
+# The integer (y,x) offsets of the 4 corners of a cell from its lower corner, which are also the offsets of the 4
+# cells it is divided into when it is refined.
+cell_corner_offsets = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+
+
+def origin_and_cells_from_grid_and_pixel_scale(grid, pixel_scale):
+    """The (y,x) origin of a grid of square cells of size *pixel_scale*, which is the lower corner of the bounding \
+    box of the grid's (binned) pixels, and the integer (y,x) indexes of its cells, which cover the bounding box."""
+
+    grid_1d = np.asarray(grid.in_1d_binned)
+
+    half_pixel_scales = 0.5 * np.asarray(grid.pixel_scales)
+
+    minima = np.min(grid_1d, axis=0) - half_pixel_scales
+    maxima = np.max(grid_1d, axis=0) + half_pixel_scales
+
+    total_cells = np.maximum(np.ceil((maxima - minima) / pixel_scale), 1).astype("int")
+
+    y, x = np.meshgrid(
+        np.arange(total_cells[0]), np.arange(total_cells[1]), indexing="ij"
+    )
+
+    return minima, np.stack((y.ravel(), x.ravel()), axis=-1)
+
+
+class PositionsFinder:
+
+    # The fractional tolerance by which a coordinate can lie outside a triangle and be treated as inside it, such
+    # that images on the edge between two cells are not missed because of rounding.
+    triangle_tolerance = 1.0e-8
+
+    # The fraction of its size by which the source-plane bounding box of a cell is expanded when deciding whether it
+    # is refined.
+    cell_bounding_box_buffer = 0.5
+
+    # The size of the cells of the coarse grid in units of the pixel scale of the grid, if not input.
+    coarse_pixel_scale_factor = 10
+
+    def __init__(self, grid, pixel_scale_precision, coarse_pixel_scale=None):
+        """Finds the image-plane positions of the multiple images of a source-plane coordinate, by iteratively \
+        refining an adaptive grid around the images.
+
+        The search begins on a coarse grid of square cells covering the region of the input *grid*. Every cell is \
+        ray-traced to the source-plane, and only cells whose ray-traced corners surround the source-plane \
+        coordinate can contain an image. These cells are refined, by dividing them into 4 cells of half the size \
+        whose corners are ray-traced, until their size is below *pixel_scale_precision*. Every final cell is split \
+        into 2 triangles, and the position of an image in a triangle which contains the source-plane coordinate is \
+        computed by mapping it back through the linear mapping of the triangle, giving positions to a fraction of \
+        the precision.
+
+        After the coarse grid, the number of coordinates ray-traced therefore depends on the number of images and \
+        the precision, not on the number of pixels of the grid. Images closer together than a coarse cell, which \
+        only occurs very close to a critical curve, may not be resolved.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid whose extent defines the region of the image-plane that is searched.
+        pixel_scale_precision : float
+            The size of the cells below which the refinement stops.
+        coarse_pixel_scale : float or None
+            The size of the cells of the coarse grid the search begins from, which defaults to \
+            *coarse_pixel_scale_factor* times the pixel scale of the grid.
+        """
+        self.grid = grid
+        self.pixel_scale_precision = pixel_scale_precision
+        self.coarse_pixel_scale = (
+            coarse_pixel_scale
+            if coarse_pixel_scale is not None
+            else self.coarse_pixel_scale_factor * grid.pixel_scales[0]
+        )
+
+    def origin_and_coarse_cells(self):
+        return origin_and_cells_from_grid_and_pixel_scale(
+            grid=self.grid, pixel_scale=self.coarse_pixel_scale
+        )
+
+    @staticmethod
+    def source_plane_grid_from_tracer_and_grid(tracer, grid):
+        return np.asarray(
+            tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=grids.GridIrregular.manual_1d(grid=grid)
+            )[-1]
+        )
+
+    def image_plane_and_source_plane_corners_from(
+        self, tracer, origin, cells, pixel_scale
+    ):
+        """Ray-trace the corners of a set of cells, returning their image-plane and source-plane corners as arrays \
+        of shape (total_cells, 4, 2).
+
+        Cells are indexed on an integer lattice of spacing *pixel_scale* from the origin, such that the corners \
+        shared by neighbouring cells are identified exactly and ray-traced once."""
+
+        corners = cells[:, np.newaxis, :] + cell_corner_offsets[np.newaxis, :, :]
+
+        unique_corners, corner_indexes = np.unique(
+            corners.reshape(-1, 2), axis=0, return_inverse=True
+        )
+
+        image_plane_corners = origin + pixel_scale * unique_corners
+
+        source_plane_corners = self.source_plane_grid_from_tracer_and_grid(
+            tracer=tracer, grid=image_plane_corners
+        )
+
+        corner_indexes = corner_indexes.reshape(-1)
+
+        return (
+            image_plane_corners[corner_indexes].reshape(corners.shape),
+            source_plane_corners[corner_indexes].reshape(corners.shape),
+        )
+
+    def image_plane_positions_from_tracer_and_source_plane_coordinate(
+        self, tracer, source_plane_coordinate
+    ):
+        """Find the image-plane positions of the multiple images of a source-plane coordinate, sorted from the \
+        top-left of the image-plane (decreasing y then increasing x) like the pixels of a grid.
+
+        Until the cells reach the precision, a cell is refined if the source-plane coordinate is within the \
+        bounding box of its ray-traced corners, expanded by *cell_bounding_box_buffer* of its size. This is less \
+        strict than the triangles containing the coordinate, such that cells which are folded by a critical curve \
+        (where the ray-traced triangles do not cover the source-plane area the cell maps to) are also refined.
+
+        Positions which do not trace to within *pixel_scale_precision* of the source-plane coordinate are removed, \
+        which are not images but cells around the centre of a singular mass profile, whose ray-traced corners \
+        enclose the whole source-plane.
+
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer whose lens mapping is solved.
+        source_plane_coordinate : (float, float)
+            The (y,x) source-plane coordinate whose images are found.
+        """
+
+        coordinate = np.asarray(source_plane_coordinate)
+
+        origin, cells = self.origin_and_coarse_cells()
+        pixel_scale = self.coarse_pixel_scale
+
+        while True:
+
+            image_plane_corners, source_plane_corners = self.image_plane_and_source_plane_corners_from(
+                tracer=tracer, origin=origin, cells=cells, pixel_scale=pixel_scale
+            )
+
+            if pixel_scale <= self.pixel_scale_precision:
+                break
+
+            minima = np.min(source_plane_corners, axis=1)
+            maxima = np.max(source_plane_corners, axis=1)
+            buffer = self.cell_bounding_box_buffer * (maxima - minima)
+
+            cells = cells[
+                np.all(minima - buffer <= coordinate, axis=1)
+                & np.all(maxima + buffer >= coordinate, axis=1)
+            ]
+
+            if cells.shape[0] == 0:
+                return []
+
+            pixel_scale *= 0.5
+
+            cells = (
+                2 * cells[:, np.newaxis, :] + cell_corner_offsets[np.newaxis, :, :]
+            ).reshape(-1, 2)
+
+        positions = []
+
+        for triangle in ((0, 1, 3), (0, 2, 3)):
+
+            weights, inside = source_in_triangles_from_corners(
+                corners_0=source_plane_corners[:, triangle[0]],
+                corners_1=source_plane_corners[:, triangle[1]],
+                corners_2=source_plane_corners[:, triangle[2]],
+                coordinate=coordinate,
+            )
+
+            positions.append(
+                np.einsum(
+                    "ij,ijk->ik",
+                    weights[inside],
+                    image_plane_corners[inside][:, triangle, :],
+                )
+            )
+
+        positions = np.concatenate(positions)
+
+        if positions.shape[0] > 0:
+
+            residuals = (
+                self.source_plane_grid_from_tracer_and_grid(
+                    tracer=tracer, grid=positions
+                )
+                - coordinate
+            )
+
+            positions = positions[
+                np.hypot(residuals[:, 0], residuals[:, 1]) < self.pixel_scale_precision
+            ]
+
+        return self.positions_with_duplicates_removed_from_positions(
+            positions=positions, pixel_scale=pixel_scale
+        )
+
+    @staticmethod
+    def positions_with_duplicates_removed_from_positions(positions, pixel_scale):
+        """Remove positions within 2 cells of a previous position, which are the same image found in adjacent \
+        cells (when it lies on their shared edge), and sort them from the top-left of the image-plane.
+
+        The y coordinates are rounded to the cell size before sorting, such that images in the same row of cells \
+        are sorted by their x coordinate irrespective of numerical noise in y."""
+
+        positions = positions[
+            np.lexsort((positions[:, 1], -np.round(positions[:, 0] / pixel_scale)))
+        ]
+
+        unique_positions = []
+
+        for position in positions:
+            if all(
+                np.hypot(*(position - unique_position)) > 2.0 * pixel_scale
+                for unique_position in unique_positions
+            ):
+                unique_positions.append(position)
+
+        return [tuple(position) for position in unique_positions]
@@ -1,21 +1,263 @@
 from abc import ABC
+from collections import OrderedDict
 
 import numpy as np
 from astropy import cosmology as cosmo
 
 from autoastro import lensing
-from autoarray.util import array_util, grid_util
-from autoarray.mask import mask as msk
 from autoarray.structures import grids
 from autoarray.masked.masked_structures import MaskedArray
 from autoarray.operators.inversion import inversions as inv
 from autoastro.galaxy import galaxy as g
 from autoastro.util import cosmology_util
+from autolens import exc
+from autolens.lens import compiled_plane as cp
+from autolens.lens import critical_curves_cache as ccc
+from autolens.lens import critical_curves_solver
+from autolens.lens import deflections_interpolator as di
+from autolens.lens import executor as ex
 from autolens.lens import plane as pl
+from autolens.lens import positions_solver
 from autolens.util import lens_util
 
 
+class TracedGridsWorkspace:
+    def __init__(self):
+        """A reusable workspace for multi-plane ray-tracing of a grid, which is attached to the grid as its \
+        *traced_grids_workspace* attribute (see *attach_to_grid*).
+
+        When a tracer traces a grid with a workspace, the traced grids of every plane are written into a \
+        preallocated buffer of shape (total_planes, sub_shape_1d, 2) and the traced grids returned are views of \
+        this buffer. No grids are therefore allocated when the same grid is traced many times (e.g. every call to \
+        the likelihood function of a non-linear search), irrespective of the number of planes and sub-size.
+
+        The traced grids returned by a tracer are overwritten the next time the grid is traced, thus they should \
+        not be stored between fits.
+        """
+        self.traced_grids_of_total_planes = {}
+        self.scaled_deflections = None
+        self.fused_grid = None
+        self.fused_blurring_grid = None
+        self.owner = None
+
+    @classmethod
+    def attach_to_grid(cls, grid):
+        if grid is not None:
+            grid.traced_grids_workspace = cls()
+        return grid
+
+    def traced_grids_from_grid_and_total_planes(self, grid, total_planes):
+        """The buffer of traced grids for a tracer with *total_planes* planes, where slicing the buffer gives a \
+        grid with the same mask as the input grid."""
+
+        if total_planes not in self.traced_grids_of_total_planes:
+            self.traced_grids_of_total_planes[total_planes] = grid[np.newaxis].repeat(
+                total_planes, axis=0
+            )
+
+        return self.traced_grids_of_total_planes[total_planes]
+
+    def fused_grid_from_grid_and_blurring_grid(self, grid, blurring_grid):
+        """The grid fused with its blurring grid (see *lens_util.fused_grid_from_grid_and_blurring_grid*), which is \
+        computed once and given its own workspace so that it too is traced without allocating grids."""
+
+        if self.fused_grid is None or self.fused_blurring_grid is not blurring_grid:
+            self.fused_grid = self.attach_to_grid(
+                grid=lens_util.fused_grid_from_grid_and_blurring_grid(
+                    grid=grid, blurring_grid=blurring_grid
+                )
+            )
+            self.fused_blurring_grid = blurring_grid
+
+        return self.fused_grid
+
+    def scaled_deflections_from_grid(self, grid):
+
+        if self.scaled_deflections is None:
+            self.scaled_deflections = np.zeros(shape=grid.shape)
+
+        return self.scaled_deflections
+
+
+class FixedGalaxyBlurredImagesCache:
+
+    max_size = 4
+
+    def __init__(self, grid, blurring_grid, convolver):
+        """A cache of the blurred profile images of image-plane galaxies whose light profiles do not change between \
+        fits (e.g. a lens light fixed to the result of an earlier phase). It is held by a phase's analysis and \
+        attached to every tracer the analysis creates, such that each fixed galaxy is evaluated and convolved once \
+        per phase and its blurred image is then added to the blurred image of the tracer's other galaxies.
+
+        Galaxies in the image-plane are evaluated on the unlensed image-plane grid, therefore their blurred images \
+        do not depend on the mass model and only change if their light profiles do. Blurred images are keyed by \
+        the class and parameters of a galaxy's light profiles (see *lens_util.profiles_key_from_profiles*), thus a \
+        galaxy whose light changes no longer matches its key and is never given a stale image. A galaxy's blurred \
+        image is only cached once its key is seen in two consecutive fits, such that galaxies whose light varies \
+        every fit are blurred with the rest of the tracer as normal, instead of being convolved separately. At most \
+        *max_size* blurred images are held, with the least recently used evicted first.
+
+        The blurred images are only valid for the grid, blurring grid and convolver of the cache, and tracers do not \
+        use the cache for any others.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid the blurred images are computed on.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid the blurred images are computed on.
+        convolver : aa.Convolver
+            The convolver which blurs the images with the PSF.
+        """
+        self.grid = grid
+        self.blurring_grid = blurring_grid
+        self.convolver = convolver
+        self.blurred_images = OrderedDict()
+        self.previous_keys = set()
+
+    def is_for_grid_blurring_grid_and_convolver(self, grid, blurring_grid, convolver):
+        return (
+            grid is self.grid
+            and blurring_grid is self.blurring_grid
+            and convolver is self.convolver
+        )
+
+    def fixed_galaxies_and_blurred_images_from_galaxies(self, galaxies):
+        """Given the galaxies of the image-plane, return the galaxies whose blurred images are cached and their \
+        blurred images, caching the blurred image of every galaxy whose light profiles are unchanged since the \
+        previous call.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The galaxies in the image-plane of a tracer.
+        """
+
+        keys = set()
+        fixed_galaxies = []
+        blurred_images = []
+
+        for galaxy in galaxies:
+
+            if not galaxy.has_light_profile:
+                continue
+
+            key = lens_util.profiles_key_from_profiles(profiles=galaxy.light_profiles)
+            keys.add(key)
+
+            if key in self.blurred_images:
+                self.blurred_images.move_to_end(key)
+            elif key in self.previous_keys:
+                self.blurred_images[
+                    key
+                ] = galaxy.blurred_profile_image_from_grid_and_convolver(
+                    grid=self.grid,
+                    convolver=self.convolver,
+                    blurring_grid=self.blurring_grid,
+                )
+            else:
+                continue
+
+            fixed_galaxies.append(galaxy)
+            blurred_images.append(self.blurred_images[key])
+
+        while len(self.blurred_images) > self.max_size:
+            self.blurred_images.popitem(last=False)
+
+        self.previous_keys = keys
+
+        return fixed_galaxies, blurred_images
+
+
+class TracerMetadata:
+
+    __slots__ = (
+        "galaxies",
+        "has_light_profile",
+        "has_mass_profile",
+        "has_pixelization",
+        "has_regularization",
+        "has_hyper_galaxy",
+        "upper_plane_index_with_light_profile",
+        "plane_indexes_with_pixelizations",
+        "_planes",
+        "_light_profile_centres_of_planes",
+    )
+
+    def __init__(self, planes):
+        """The properties of a tracer which depend only on the metadata of its planes (see *plane.PlaneMetadata*), \
+        computed once rather than every time they are accessed.
+
+        The lists are shared by every access and must not be modified. The light profile centres are only computed \
+        when first accessed, as not every light profile has a centre.
+
+        Parameters
+        ----------
+        planes : [Plane]
+            The planes of the tracer.
+        """
+
+        self._planes = planes
+
+        self.galaxies = [galaxy for plane in planes for galaxy in plane.galaxies or []]
+
+        self.has_light_profile = any(plane.has_light_profile for plane in planes)
+        self.has_mass_profile = any(plane.has_mass_profile for plane in planes)
+        self.has_pixelization = any(plane.has_pixelization for plane in planes)
+        self.has_regularization = any(plane.has_regularization for plane in planes)
+        self.has_hyper_galaxy = any(plane.has_hyper_galaxy for plane in planes)
+
+        self.upper_plane_index_with_light_profile = max(
+            [
+                plane_index if plane.has_light_profile else 0
+                for (plane_index, plane) in enumerate(planes)
+            ]
+        )
+
+        self.plane_indexes_with_pixelizations = [
+            plane_index
+            for (plane_index, plane) in enumerate(planes)
+            if plane.has_pixelization
+        ]
+
+        self._light_profile_centres_of_planes = None
+
+    @property
+    def light_profile_centres_of_planes(self):
+
+        if self._light_profile_centres_of_planes is None:
+            self._light_profile_centres_of_planes = [
+                plane.light_profile_centres
+                for plane in self._planes
+                if plane.has_light_profile
+            ]
+
+        return self._light_profile_centres_of_planes
+
+    @property
+    def light_profile_centres(self):
+        return [
+            item
+            for light_profile_centres in self.light_profile_centres_of_planes
+            for item in light_profile_centres
+        ]
+
+
 class AbstractTracer(lensing.LensingObject, ABC):
+
+    # The attributes of every tracer, which are stored in slots rather than the instance dictionary to reduce the
+    # memory of the many tracers held when post-processing a posterior.
+    __slots__ = (
+        "planes",
+        "plane_redshifts",
+        "cosmology",
+        "metadata",
+        "fixed_galaxy_blurred_images_cache",
+        "_traced_grids_cache",
+        "_executor",
+        "_scaling_factors_of_planes",
+    )
+
     def __init__(self, planes, cosmology):
         """Ray-tracer for a lens system with any number of planes.
 
@@ -43,11 +285,110 @@ class AbstractTracer(lensing.LensingObject, ABC):
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
+        self._traced_grids_cache = OrderedDict()
+        self.fixed_galaxy_blurred_images_cache = None
+        self._executor = ex.serial_executor
+        self._scaling_factors_of_planes = None
+        self.metadata = TracerMetadata(planes=planes)
+
+    def invalidate_metadata(self):
+        """Recompute the metadata of the tracer and its planes (see *TracerMetadata*), which must be called if the \
+        profiles, pixelizations, regularizations or hyper galaxies of its galaxies are changed in-place."""
+        for plane in self.planes:
+            plane.invalidate_metadata()
+
+        self.metadata = TracerMetadata(planes=self.planes)
 
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
 
+    @property
+    def mass_profiles_key(self):
+        return lens_util.mass_profiles_key_from_planes(planes=self.planes)
+
+    @property
+    def traced_grids_cache(self):
+        return self._traced_grids_cache
+
+    @property
+    def executor(self):
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor):
+        """Set the executor which evaluates independent calculations, for example the profile images of the planes \
+        after ray-tracing and the profile classes of every plane, which can evaluate them concurrently on a thread \
+        pool (see *executor.ThreadedExecutor*)."""
+        self._executor = executor
+
+        for plane in self.planes:
+            plane.executor = executor
+
+    @property
+    def critical_curves_key(self):
+        """The key of the tracer's critical curves and caustics in the critical curves cache, which tracers with the \
+        same cosmology, plane redshifts and mass profiles share (see *critical_curves_cache.CriticalCurvesCache*)."""
+        return ("Tracer", str(self.cosmology), self.mass_profiles_key)
+
+    @property
+    def critical_curves_finder(self):
+        return critical_curves_solver.CriticalCurvesFinder(grid=self.calculation_grid)
+
+    def critical_curves_from_calculation_grid(self):
+        """Compute the [tangential, radial] critical curves of the tracer by following the zero contours of the \
+        determinant of the Jacobian of its lens mapping over its calculation grid (see \
+        *critical_curves_solver.CriticalCurvesFinder*), without using the critical curves cache.
+
+        The Jacobian is computed from the grid ray-traced through every plane, such that the critical curves of \
+        multi-plane tracers are correct."""
+        return self.critical_curves_finder.critical_curves_from_tracer(tracer=self)
+
+    def caustics_from_critical_curves(self, critical_curves):
+        return critical_curves_solver.CriticalCurvesFinder.caustics_from_tracer_and_critical_curves(
+            tracer=self, critical_curves=critical_curves
+        )
+
+    @property
+    def einstein_radius_via_tangential_critical_curve(self):
+        """An estimate of the Einstein radius of the tracer in arc-seconds, as the radius of the circle with the \
+        same area as its tangential critical curve."""
+        return critical_curves_solver.CriticalCurvesFinder.einstein_radius_from_critical_curve(
+            critical_curve=self.tangential_critical_curve
+        )
+
+    @property
+    def critical_curves(self):
+        return ccc.critical_curves_cache.critical_curves_from_lensing_obj(
+            lensing_obj=self
+        )
+
+    @property
+    def tangential_critical_curve(self):
+        return self.critical_curves[0]
+
+    @property
+    def radial_critical_curve(self):
+        return self.critical_curves[1]
+
+    @property
+    def caustics(self):
+        return ccc.critical_curves_cache.caustics_from_lensing_obj(lensing_obj=self)
+
+    @property
+    def tangential_caustic(self):
+        return self.caustics[0]
+
+    @property
+    def radial_caustic(self):
+        return self.caustics[1]
+
+    @traced_grids_cache.setter
+    def traced_grids_cache(self, traced_grids_cache):
+        """Replace the cache of memoized traced grids, for example with that of another tracer whose mass profiles \
+        are identical (see *mass_profiles_key*) such that grids it has already traced are not traced again."""
+        self._traced_grids_cache = traced_grids_cache
+
     @property
     def image_plane(self):
         return self.planes[0]
@@ -58,7 +399,7 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def galaxies(self):
-        return list([galaxy for plane in self.planes for galaxy in plane.galaxies])
+        return self.metadata.galaxies
 
     @property
     def all_planes_have_redshifts(self):
@@ -66,32 +407,27 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def has_light_profile(self):
-        return any(list(map(lambda plane: plane.has_light_profile, self.planes)))
+        return self.metadata.has_light_profile
 
     @property
     def has_mass_profile(self):
-        return any(list(map(lambda plane: plane.has_mass_profile, self.planes)))
+        return self.metadata.has_mass_profile
 
     @property
     def has_pixelization(self):
-        return any(list(map(lambda plane: plane.has_pixelization, self.planes)))
+        return self.metadata.has_pixelization
 
     @property
     def has_regularization(self):
-        return any(list(map(lambda plane: plane.has_regularization, self.planes)))
+        return self.metadata.has_regularization
 
     @property
     def has_hyper_galaxy(self):
-        return any(list(map(lambda plane: plane.has_hyper_galaxy, self.planes)))
+        return self.metadata.has_hyper_galaxy
 
     @property
     def upper_plane_index_with_light_profile(self):
-        return max(
-            [
-                plane_index if plane.has_light_profile else 0
-                for (plane_index, plane) in enumerate(self.planes)
-            ]
-        )
+        return self.metadata.upper_plane_index_with_light_profile
 
     @property
     def planes_with_light_profile(self):
@@ -103,19 +439,11 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def light_profile_centres(self):
-        return [
-            item
-            for light_profile_centres in self.light_profile_centres_of_planes
-            for item in light_profile_centres
-        ]
+        return self.metadata.light_profile_centres
 
     @property
     def light_profile_centres_of_planes(self):
-        return [
-            plane.light_profile_centres
-            for plane in self.planes
-            if plane.has_light_profile
-        ]
+        return self.metadata.light_profile_centres_of_planes
 
     @property
     def mass_profiles(self):
@@ -147,15 +475,7 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def plane_indexes_with_pixelizations(self):
-        plane_indexes_with_inversions = [
-            plane_index if plane.has_pixelization else None
-            for (plane_index, plane) in enumerate(self.planes)
-        ]
-        return [
-            plane_index
-            for plane_index in plane_indexes_with_inversions
-            if plane_index is not None
-        ]
+        return self.metadata.plane_indexes_with_pixelizations
 
     @property
     def pixelizations_of_planes(self):
@@ -273,6 +593,19 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
             unit_mass=unit_mass,
         )
 
+    @property
+    def scaling_factors_of_planes(self):
+        """The (total_planes, total_planes) matrix of scaling factors between every pair of planes, where entry \
+        [i, j] rescales the deflection-angles of plane i when tracing to plane j.
+
+        The matrix is computed once per set of plane redshifts and cosmology (see \
+        *lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology*) and shared between tracers."""
+        if self._scaling_factors_of_planes is None:
+            self._scaling_factors_of_planes = lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+                plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+            )
+        return self._scaling_factors_of_planes
+
     def scaling_factor_between_planes(self, i, j):
         return cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
             redshift_0=self.plane_redshifts[i],
@@ -290,26 +623,310 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
 
 
 class AbstractTracerLensing(AbstractTracerCosmology, ABC):
+
+    traced_grids_cache_size = 8
+
+    # The maximum estimated error (in arc-seconds) of interpolated deflection angles, above which they are evaluated
+    # exactly (see *deflections_interpolator_from_grid*).
+    deflections_interpolation_tolerance = 1.0e-3
+
     @grids.convert_coordinates_to_grid
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an image-plane grid through every plane of the tracer (or up to and including plane \
+        *plane_index_limit*), returning the traced grid of every plane.
+
+        The traced grids are memoized on the tracer (see *memoized_traced_grids_of_planes_from_grid*), and copies \
+        of them are returned which the caller may modify in-place.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is traced.
+        plane_index_limit : int or None
+            If input, ray-tracing stops at this plane and only the traced grids up to it are returned.
+        """
+        return [
+            traced_grid.copy()
+            for traced_grid in self.memoized_traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+        ]
+
+    def memoized_traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an image-plane grid through every plane of the tracer (or up to and including plane \
+        *plane_index_limit*), returning the memoized traced grid of every plane.
+
+        A single fit traces the same grid many times (e.g. for the profile image, the mappers and the sparse grids), \
+        therefore the traced grids are memoized on the tracer, keyed by the identity of the input grid and the \
+        plane index limit. The cache holds at most *traced_grids_cache_size* entries and is discarded with the \
+        tracer. Grids must therefore not be modified in-place after being traced, and the cached traced grids are \
+        read-only, such that anything which modifies them (e.g. the border relocation of an inversion) must copy \
+        them first. The tracer's own calculations use these grids, whereas *traced_grids_of_planes_from_grid* \
+        returns writeable copies.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is traced.
+        plane_index_limit : int or None
+            If input, ray-tracing stops at this plane and only the traced grids up to it are returned.
+        """
+
+        cached_traced_grids = self._cached_traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+
+        if cached_traced_grids is not None:
+            return cached_traced_grids
+
+        traced_grids = self._traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+
+        self._cache_traced_grids_of_planes(
+            grid=grid,
+            plane_index_limit=plane_index_limit,
+            traced_grids=traced_grids,
+            workspace=getattr(grid, "traced_grids_workspace", None),
+        )
+
+        return list(traced_grids)
+
+    def _cached_traced_grids_of_planes_from_grid(self, grid, plane_index_limit):
+        """Return the memoized traced grids of an input grid, or *None* if they are not cached.
+
+        If the traced grids are views of a *TracedGridsWorkspace* buffer they are only valid if no tracer with a \
+        different traced grids cache has written to that workspace since they were cached."""
+
+        key = (id(grid), plane_index_limit)
+
+        if key not in self._traced_grids_cache:
+            return None
+
+        cached_grid, cached_traced_grids, workspace = self._traced_grids_cache[key]
 
-        grid_calc = grid.copy()  # TODO looks unnecessary? Probably pretty expensive too
+        if cached_grid is not grid:
+            return None
+
+        if workspace is not None and workspace.owner != id(self._traced_grids_cache):
+            return None
+
+        self._traced_grids_cache.move_to_end(key)
+        return list(cached_traced_grids)
+
+    def _cache_traced_grids_of_planes(
+        self, grid, plane_index_limit, traced_grids, workspace
+    ):
+
+        for traced_grid in traced_grids:
+            traced_grid.flags.writeable = False
+
+        self._traced_grids_cache[(id(grid), plane_index_limit)] = (
+            grid,
+            traced_grids,
+            workspace,
+        )
+
+        if len(self._traced_grids_cache) > self.traced_grids_cache_size:
+            self._traced_grids_cache.popitem(last=False)
+
+    def traced_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+        """Trace an image-plane grid and its blurring grid through every plane of the tracer (or up to and \
+        including plane *plane_index_limit*), returning the traced grids and traced blurring grids of every plane.
+
+        The traced grids are memoized on the tracer (see \
+        *memoized_traced_grids_of_planes_from_grid_and_blurring_grid*), and copies of them are returned which the \
+        caller may modify in-place.
+        """
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid, plane_index_limit=plane_index_limit
+        )
+
+        return (
+            [traced_grid.copy() for traced_grid in traced_grids_of_planes],
+            [
+                traced_blurring_grid.copy()
+                for traced_blurring_grid in traced_blurring_grids_of_planes
+            ],
+        )
+
+    def memoized_traced_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+        """Trace an image-plane grid and its blurring grid through every plane of the tracer (or up to and \
+        including plane *plane_index_limit*), returning the memoized (read-only) traced grids and traced blurring \
+        grids of every plane.
+
+        The grid and blurring grid are concatenated into a single block of coordinates (see \
+        *fused_grid_from_grid_and_blurring_grid*) which is traced once, halving the number of deflection angle \
+        calculations performed per plane. The traced block is split back into the traced grids and traced \
+        blurring grids, which are memoized as if each had been traced separately.
+
+        If either grid uses an interpolator, deflection angles must be interpolated separately for each grid and \
+        they are traced separately.
+        """
+
+        traced_grids_of_planes = self._cached_traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+        traced_blurring_grids_of_planes = self._cached_traced_grids_of_planes_from_grid(
+            grid=blurring_grid, plane_index_limit=plane_index_limit
+        )
+
+        if (
+            traced_grids_of_planes is not None
+            and traced_blurring_grids_of_planes is not None
+        ):
+            return traced_grids_of_planes, traced_blurring_grids_of_planes
+
+        if not self._grid_and_blurring_grid_can_be_fused(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+            return (
+                self.memoized_traced_grids_of_planes_from_grid(
+                    grid=grid, plane_index_limit=plane_index_limit
+                ),
+                self.memoized_traced_grids_of_planes_from_grid(
+                    grid=blurring_grid, plane_index_limit=plane_index_limit
+                ),
+            )
+
+        _, traced_grids_of_planes, traced_blurring_grids_of_planes = self._traced_fused_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid, plane_index_limit=plane_index_limit
+        )
+
+        return traced_grids_of_planes, traced_blurring_grids_of_planes
+
+    @staticmethod
+    def _grid_and_blurring_grid_can_be_fused(grid, blurring_grid):
+        return (
+            blurring_grid is not None
+            and getattr(grid, "interpolator", None) is None
+            and getattr(blurring_grid, "interpolator", None) is None
+        )
+
+    def _traced_fused_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+
+        workspace = getattr(grid, "traced_grids_workspace", None)
+
+        if workspace is not None:
+            fused_grid = workspace.fused_grid_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+        else:
+            fused_grid = lens_util.fused_grid_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+
+        traced_fused_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=fused_grid, plane_index_limit=plane_index_limit
+        )
+
+        workspace = getattr(fused_grid, "traced_grids_workspace", None)
+
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self._split_traced_fused_grids_of_planes(
+            grid=grid,
+            blurring_grid=blurring_grid,
+            traced_fused_grids_of_planes=traced_fused_grids_of_planes,
+        )
+
+        self._cache_traced_grids_of_planes(
+            grid=grid,
+            plane_index_limit=plane_index_limit,
+            traced_grids=traced_grids_of_planes,
+            workspace=workspace,
+        )
+
+        self._cache_traced_grids_of_planes(
+            grid=blurring_grid,
+            plane_index_limit=plane_index_limit,
+            traced_grids=traced_blurring_grids_of_planes,
+            workspace=workspace,
+        )
+
+        return (
+            traced_fused_grids_of_planes,
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        )
+
+    @staticmethod
+    def _split_traced_fused_grids_of_planes(
+        grid, blurring_grid, traced_fused_grids_of_planes
+    ):
+
+        traced_grids_of_planes = [
+            grid.mapping.grid_stored_1d_from_sub_grid_1d(
+                sub_grid_1d=traced_fused_grid[: grid.sub_shape_1d]
+            )
+            for traced_fused_grid in traced_fused_grids_of_planes
+        ]
+
+        traced_blurring_grids_of_planes = [
+            blurring_grid.mapping.grid_stored_1d_from_sub_grid_1d(
+                sub_grid_1d=traced_fused_grid[grid.sub_shape_1d :]
+            )
+            for traced_fused_grid in traced_fused_grids_of_planes
+        ]
+
+        return traced_grids_of_planes, traced_blurring_grids_of_planes
+
+    def deflections_interpolator_from_grid(self, grid):
+        """The interpolator of the deflection angles of every plane when an image-plane grid is traced, which is \
+        used if the grid has an interpolator (e.g. a *MaskedImaging* with a *pixel_scale_interpolation_grid*) and \
+        interpolates with the same pixel scale, within an error of *deflections_interpolation_tolerance* (see \
+        *deflections_interpolator.DeflectionsInterpolator*)."""
+
+        grid_interpolator = getattr(grid, "interpolator", None)
+
+        if grid_interpolator is None:
+            return None
+
+        return di.DeflectionsInterpolator(
+            pixel_scale_interpolation_grid=grid_interpolator.pixel_scale_interpolation_grid,
+            tolerance=self.deflections_interpolation_tolerance,
+        )
+
+    @staticmethod
+    def deflections_of_plane_from_grid(plane, grid, interpolator):
+        """The deflection angles of a plane on a grid traced to it, which are interpolated on a coarse grid in the \
+        plane's frame if an interpolator is input.
+
+        The interpolator of the image-plane grid is inherited by the traced grids, but interpolates between \
+        image-plane coordinates, therefore the deflection angles are never computed using it."""
+
+        if interpolator is None:
+            return plane.deflections_from_grid(grid=grid)
+
+        return interpolator.deflections_from_plane_and_grid(plane=plane, grid=grid)
+
+    def _traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+
+        workspace = getattr(grid, "traced_grids_workspace", None)
+
+        if workspace is not None:
+            return self._traced_grids_of_planes_from_grid_and_workspace(
+                grid=grid, workspace=workspace, plane_index_limit=plane_index_limit
+            )
+
+        interpolator = self.deflections_interpolator_from_grid(grid=grid)
 
         traced_grids = []
         traced_deflections = []
 
         for (plane_index, plane) in enumerate(self.planes):
 
-            scaled_grid = grid_calc.copy()
+            scaled_grid = grid.copy()
 
             if plane_index > 0:
                 for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
-                    )
+                    scaling_factor = self.scaling_factors_of_planes[
+                        previous_plane_index, plane_index
+                    ]
 
                     scaled_deflections = (
                         scaling_factor * traced_deflections[previous_plane_index]
@@ -319,18 +936,73 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
             traced_grids.append(scaled_grid)
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+            # The deflection angles of the last plane traced to are never used, so are not computed.
+            if plane_index == plane_index_limit or plane_index == self.total_planes - 1:
+                return traced_grids
+
+            traced_deflections.append(
+                self.deflections_of_plane_from_grid(
+                    plane=plane, grid=scaled_grid, interpolator=interpolator
+                )
+            )
+
+        return traced_grids
+
+    def _traced_grids_of_planes_from_grid_and_workspace(
+        self, grid, workspace, plane_index_limit=None
+    ):
+        """Perform multi-plane ray-tracing writing every traced grid into the preallocated buffer of a \
+        *TracedGridsWorkspace*, such that no grids are allocated and the traced grids returned are views of the \
+        workspace buffer. These views are overwritten the next time the grid is traced (by any tracer)."""
+
+        workspace_grids = workspace.traced_grids_from_grid_and_total_planes(
+            grid=grid, total_planes=self.total_planes
+        )
+        scaled_deflections = workspace.scaled_deflections_from_grid(grid=grid)
+
+        workspace.owner = id(self._traced_grids_cache)
+
+        interpolator = self.deflections_interpolator_from_grid(grid=grid)
+
+        traced_grids = []
+        traced_deflections = []
+
+        for (plane_index, plane) in enumerate(self.planes):
+
+            traced_grid = workspace_grids[plane_index]
+
+            np.copyto(traced_grid, grid)
+
+            for previous_plane_index in range(plane_index):
+
+                np.multiply(
+                    self.scaling_factors_of_planes[previous_plane_index, plane_index],
+                    traced_deflections[previous_plane_index],
+                    out=scaled_deflections,
+                )
+
+                traced_grid -= scaled_deflections
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+            traced_grids.append(traced_grid)
+
+            # The deflection angles of the last plane traced to are never used, so are not computed.
+            if plane_index == plane_index_limit or plane_index == self.total_planes - 1:
+                return traced_grids
+
+            traced_deflections.append(
+                self.deflections_of_plane_from_grid(
+                    plane=plane, grid=traced_grid, interpolator=interpolator
+                )
+            )
 
         return traced_grids
 
     @grids.convert_coordinates_to_grid
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid
+        )
 
         return traced_grids_of_planes[plane_i] - traced_grids_of_planes[plane_j]
 
@@ -341,30 +1013,231 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
             sub_array_1d=profile_image
         )
 
-    @grids.convert_coordinates_to_grid
-    def profile_images_of_planes_from_grid(self, grid):
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+    def profile_image_from_adaptive_sub_grid(self, adaptive_sub_grid):
+        """Compute the profile image of the tracer on the pixels of an adaptive sub-grid, whose sub-size varies \
+        pixel-to-pixel depending on how quickly the image converges or the magnification (see \
+        *adaptive_sub_grid.AdaptiveSubGrid*).
+
+        Parameters
+        ----------
+        adaptive_sub_grid : AdaptiveSubGrid
+            The adaptive sub-grid, which caches its sub-grid layout between calls.
+        """
+        return adaptive_sub_grid.profile_image_from_tracer(tracer=self)
+
+    @grids.convert_coordinates_to_grid
+    def profile_images_of_planes_from_grid(self, grid):
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
+
+        profile_images_of_planes = self.executor.map(
+            lambda plane_index: self.planes[plane_index].profile_image_from_grid(
+                grid=traced_grids_of_planes[plane_index]
+            ),
+            range(len(traced_grids_of_planes)),
+        )
+
+        if self.upper_plane_index_with_light_profile < self.total_planes - 1:
+            for plane_index in range(
+                self.upper_plane_index_with_light_profile, self.total_planes - 1
+            ):
+                profile_images_of_planes.append(
+                    grid.mapping.array_stored_1d_from_sub_array_1d(
+                        sub_array_1d=np.zeros(shape=profile_images_of_planes[0].shape)
+                    )
+                )
+
+        return profile_images_of_planes
+
+    def profile_images_of_planes_from_grid_and_blurring_grid(self, grid, blurring_grid):
+        """Compute the profile image and blurring image of every plane, where the grid and blurring grid are \
+        ray-traced and have their light profiles evaluated together as one fused grid (see \
+        *memoized_traced_grids_of_planes_from_grid_and_blurring_grid*), with the images split only after evaluation.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid the profile images are computed on.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid the blurring images are computed on.
+        """
+
+        if not self._grid_and_blurring_grid_can_be_fused(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+            return (
+                self.profile_images_of_planes_from_grid(grid=grid),
+                self.profile_images_of_planes_from_grid(grid=blurring_grid),
+            )
+
+        traced_fused_grids_of_planes, _, _ = self._traced_fused_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid,
+            blurring_grid=blurring_grid,
+            plane_index_limit=self.upper_plane_index_with_light_profile,
+        )
+
+        fused_images_of_planes = self.executor.map(
+            lambda plane_index: self.planes[plane_index].profile_image_from_grid(
+                grid=traced_fused_grids_of_planes[plane_index]
+            ),
+            range(len(traced_fused_grids_of_planes)),
+        )
+
+        profile_images_of_planes = []
+        blurring_images_of_planes = []
+
+        for fused_image in fused_images_of_planes:
+
+            profile_images_of_planes.append(
+                grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=fused_image[: grid.sub_shape_1d]
+                )
+            )
+            blurring_images_of_planes.append(
+                blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=fused_image[grid.sub_shape_1d :]
+                )
+            )
+
+        for plane_index in range(
+            self.upper_plane_index_with_light_profile, self.total_planes - 1
+        ):
+            profile_images_of_planes.append(
+                grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=np.zeros(shape=grid.sub_shape_1d)
+                )
+            )
+            blurring_images_of_planes.append(
+                blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=np.zeros(shape=blurring_grid.sub_shape_1d)
+                )
+            )
+
+        return profile_images_of_planes, blurring_images_of_planes
+
+    def profile_image_and_blurring_image_from_grid_and_blurring_grid(
+        self, grid, blurring_grid
+    ):
+
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
+
+        profile_image = grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=sum(profile_images_of_planes)
+        )
+        blurring_image = blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=sum(blurring_images_of_planes)
+        )
+
+        return profile_image, blurring_image
+
+    def profile_images_of_planes_and_galaxies_from_grid_and_blurring_grid(
+        self, grid, blurring_grid
+    ):
+        """Compute the profile image and blurring image of every galaxy in every plane, returning two lists (one \
+        entry per plane) of lists (one entry per galaxy of the plane).
+
+        Every galaxy is evaluated once on the fused grid of its plane (see \
+        *profile_images_of_planes_from_grid_and_blurring_grid*), with its image split only after evaluation. The \
+        galaxies of planes above *upper_plane_index_with_light_profile* have no light and are given images of \
+        zeros without being traced to.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid the profile images are computed on.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid the blurring images are computed on.
+        """
+
+        plane_index_limit = self.upper_plane_index_with_light_profile
+
+        fused = self._grid_and_blurring_grid_can_be_fused(
+            grid=grid, blurring_grid=blurring_grid
         )
 
-        profile_images_of_planes = [
-            self.planes[plane_index].profile_image_from_grid(
-                grid=traced_grids_of_planes[plane_index]
+        if fused:
+            traced_fused_grids_of_planes, _, _ = self._traced_fused_grids_of_planes_from_grid_and_blurring_grid(
+                grid=grid,
+                blurring_grid=blurring_grid,
+                plane_index_limit=plane_index_limit,
+            )
+        else:
+            traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+            traced_blurring_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+                grid=blurring_grid, plane_index_limit=plane_index_limit
             )
-            for plane_index in range(len(traced_grids_of_planes))
-        ]
 
-        if self.upper_plane_index_with_light_profile < self.total_planes - 1:
-            for plane_index in range(
-                self.upper_plane_index_with_light_profile, self.total_planes - 1
-            ):
-                profile_images_of_planes.append(
+        def images_of_galaxies_from_plane_index(plane_index):
+
+            galaxies = self.planes[plane_index].galaxies
+
+            if plane_index > plane_index_limit:
+                return (
+                    [
+                        grid.mapping.array_stored_1d_from_sub_array_1d(
+                            sub_array_1d=np.zeros(shape=grid.sub_shape_1d)
+                        )
+                        for _ in galaxies
+                    ],
+                    [
+                        blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                            sub_array_1d=np.zeros(shape=blurring_grid.sub_shape_1d)
+                        )
+                        for _ in galaxies
+                    ],
+                )
+
+            if not fused:
+                return (
+                    [
+                        galaxy.profile_image_from_grid(
+                            grid=traced_grids_of_planes[plane_index]
+                        )
+                        for galaxy in galaxies
+                    ],
+                    [
+                        galaxy.profile_image_from_grid(
+                            grid=traced_blurring_grids_of_planes[plane_index]
+                        )
+                        for galaxy in galaxies
+                    ],
+                )
+
+            fused_images = [
+                galaxy.profile_image_from_grid(
+                    grid=traced_fused_grids_of_planes[plane_index]
+                )
+                for galaxy in galaxies
+            ]
+
+            return (
+                [
                     grid.mapping.array_stored_1d_from_sub_array_1d(
-                        sub_array_1d=np.zeros(shape=profile_images_of_planes[0].shape)
+                        sub_array_1d=fused_image[: grid.sub_shape_1d]
                     )
-                )
+                    for fused_image in fused_images
+                ],
+                [
+                    blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                        sub_array_1d=fused_image[grid.sub_shape_1d :]
+                    )
+                    for fused_image in fused_images
+                ],
+            )
 
-        return profile_images_of_planes
+        images_of_planes_and_galaxies = self.executor.map(
+            images_of_galaxies_from_plane_index, range(self.total_planes)
+        )
+
+        return (
+            [profile_images for profile_images, _ in images_of_planes_and_galaxies],
+            [blurring_images for _, blurring_images in images_of_planes_and_galaxies],
+        )
 
     def padded_profile_image_from_grid_and_psf_shape(self, grid, psf_shape_2d):
 
@@ -374,14 +1247,24 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
     @grids.convert_coordinates_to_grid
     def convergence_from_grid(self, grid):
-        convergence = sum(
-            [plane.convergence_from_grid(grid=grid) for plane in self.planes]
-        )
+        convergence = np.zeros(grid.shape[0])
+        for plane in self.planes:
+            plane.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.convergence_from_grid,
+                out=convergence,
+            )
         return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=convergence)
 
     @grids.convert_coordinates_to_grid
     def potential_from_grid(self, grid):
-        potential = sum([plane.potential_from_grid(grid=grid) for plane in self.planes])
+        potential = np.zeros(grid.shape[0])
+        for plane in self.planes:
+            plane.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.potential_from_grid,
+                out=potential,
+            )
         return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=potential)
 
     @grids.convert_coordinates_to_grid
@@ -390,9 +1273,13 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
     @grids.convert_coordinates_to_grid
     def deflections_of_planes_summed_from_grid(self, grid):
-        deflections = sum(
-            [plane.deflections_from_grid(grid=grid) for plane in self.planes]
-        )
+        deflections = np.zeros((grid.shape[0], 2))
+        for plane in self.planes:
+            plane.sub_array_accumulated_from_grid(
+                grid=grid,
+                compiled_plane_func=cp.CompiledPlane.deflections_from_grid,
+                out=deflections,
+            )
         return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
 
     def grid_at_redshift_from_grid_and_redshift(self, grid, redshift):
@@ -401,7 +1288,7 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
         This is performed using multi-plane ray-tracing and the existing redshifts and planes of the tracer. However, \
         any redshift can be input even if a plane does not exist there, including redshifts before the first plane \
-        of the lens system.
+        of the lens system. The tracer is not changed (see *grids_at_redshifts_from_grid_and_redshifts*).
 
         Parameters
         ----------
@@ -410,78 +1297,162 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
         redshift : float
             The redshift the image-plane grid is traced to.
         """
+        return self.grids_at_redshifts_from_grid_and_redshifts(
+            grid=grid, redshifts=[redshift]
+        )[0]
 
-        if redshift <= self.plane_redshifts[0]:
-            return grid.copy()
+    def grids_at_redshifts_from_grid_and_redshifts(self, grid, redshifts):
+        """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to every redshift \
+        of a list of redshifts, which can be any redshift in the strong lens configuration.
 
-        plane_index_with_redshift = [
-            plane_index
-            for plane_index, plane in enumerate(self.planes)
-            if plane.redshift == redshift
-        ]
+        The grid is traced through the planes of the tracer once (which is memoized, see \
+        *traced_grids_of_planes_from_grid*) and the deflection-angles of every plane are recovered from the traced \
+        grids. The grid at a redshift between planes is then the image-plane grid minus the deflection-angles of \
+        every plane below it, rescaled to that redshift by scaling factors which are cached (see \
+        *lens_util.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology*). A sweep over many redshifts \
+        therefore costs one ray-tracing calculation, and no planes or tracers are created.
 
-        if plane_index_with_redshift:
-            return self.traced_grids_of_planes_from_grid(grid=grid)[
-                plane_index_with_redshift[0]
-            ]
+        A redshift beyond the last plane changes the final redshift the deflection-angles of every plane are scaled \
+        to, thus the grid is traced through a tracer with a plane without galaxies inserted at that redshift.
 
-        for plane_index, plane_redshift in enumerate(self.plane_redshifts):
+        The returned grids are copies, which can be changed without changing the memoized traced grids.
 
-            if redshift < plane_redshift:
-                plane_index_insert = plane_index
+        Parameters
+        ----------
+        grid : ndsrray or aa.Grid
+            The image-plane grid which is traced to the redshifts.
+        redshifts : [float]
+            The redshifts the image-plane grid is traced to.
+        """
 
-        planes = self.planes
-        planes.insert(
-            plane_index_insert,
-            pl.Plane(redshift=redshift, galaxies=[], cosmology=self.cosmology),
-        )
+        traced_grids = self.memoized_traced_grids_of_planes_from_grid(grid=grid)
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        deflections_of_planes = None
 
-        return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
+        grids_at_redshifts = []
 
-    def image_plane_multiple_image_positions_of_galaxies(self, grid):
-        return [
-            self.image_plane_multiple_image_positions(
-                grid=grid, source_plane_coordinate=light_profile_centre
+        for redshift in redshifts:
+
+            if redshift <= self.plane_redshifts[0]:
+                grids_at_redshifts.append(grid.copy())
+                continue
+
+            if redshift in self.plane_redshifts:
+                grids_at_redshifts.append(
+                    traced_grids[self.plane_redshifts.index(redshift)].copy()
+                )
+                continue
+
+            if redshift > self.plane_redshifts[-1]:
+                tracer = Tracer(
+                    planes=self.planes
+                    + [
+                        pl.Plane(
+                            redshift=redshift, galaxies=[], cosmology=self.cosmology
+                        )
+                    ],
+                    cosmology=self.cosmology,
+                )
+                grids_at_redshifts.append(
+                    tracer.traced_grids_of_planes_from_grid(grid=grid)[-1]
+                )
+                continue
+
+            if deflections_of_planes is None:
+                deflections_of_planes = self.deflections_of_planes_from_grid_and_traced_grids(
+                    grid=grid, traced_grids=traced_grids
+                )
+
+            scaling_factors = lens_util.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+                plane_redshifts=self.plane_redshifts,
+                redshift=redshift,
+                cosmology=self.cosmology,
             )
-            for light_profile_centre in self.light_profile_centres_of_planes[-1]
-        ]
 
-    def image_plane_multiple_image_positions(self, grid, source_plane_coordinate):
+            grid_at_redshift = grid.copy()
+
+            for plane_index, scaling_factor in enumerate(scaling_factors):
+                if scaling_factor != 0.0:
+                    grid_at_redshift -= (
+                        scaling_factor * deflections_of_planes[plane_index]
+                    )
 
-        # TODO : This should not input as a grid but use a iterative adaptive grid.
+            grids_at_redshifts.append(grid_at_redshift)
 
-        if grid.sub_size > 1:
-            grid = grid.in_1d_binned
+        return grids_at_redshifts
 
-        source_plane_grid = self.traced_grids_of_planes_from_grid(grid=grid)[-1]
+    def deflections_of_planes_from_grid_and_traced_grids(self, grid, traced_grids):
+        """Recover the (unscaled) deflection-angles of every plane except the last from the traced grids of an \
+        image-plane grid, without evaluating any mass profiles.
 
-        source_plane_squared_distances = source_plane_grid.squared_distances_from_coordinate(
-            coordinate=source_plane_coordinate
-        )
+        The grid traced to plane i + 1 is the image-plane grid minus the deflection-angles of planes 0 to i scaled \
+        to plane i + 1, thus the deflection-angles of plane i follow from those of the planes before it."""
 
-        trough_pixels = array_util.trough_pixels_from_array_2d(
-            array_2d=source_plane_squared_distances.in_2d, mask_2d=grid.mask
-        )
+        scaling_factors = self.scaling_factors_of_planes
 
-        trough_mask = msk.Mask.from_pixel_coordinates(
-            shape_2d=grid.shape_2d,
-            pixel_coordinates=trough_pixels,
-            pixel_scales=grid.pixel_scales,
-            sub_size=grid.sub_size,
-            origin=grid.origin,
-            buffer=1,
-        )
+        deflections_of_planes = []
 
-        multiple_image_pixels = grid_util.positions_at_coordinate_from_grid_2d(
-            grid_2d=source_plane_grid.in_2d,
-            coordinate=source_plane_coordinate,
-            mask_2d=trough_mask,
+        for plane_index in range(self.total_planes - 1):
+
+            deflections = np.asarray(grid) - np.asarray(traced_grids[plane_index + 1])
+
+            for previous_plane_index in range(plane_index):
+                deflections = (
+                    deflections
+                    - scaling_factors[previous_plane_index, plane_index + 1]
+                    * deflections_of_planes[previous_plane_index]
+                )
+
+            deflections_of_planes.append(
+                deflections / scaling_factors[plane_index, plane_index + 1]
+            )
+
+        return deflections_of_planes
+
+    def image_plane_multiple_image_positions_of_galaxies(
+        self, grid, pixel_scale_precision=None
+    ):
+        return [
+            self.image_plane_multiple_image_positions(
+                grid=grid,
+                source_plane_coordinate=light_profile_centre,
+                pixel_scale_precision=pixel_scale_precision,
+            )
+            for light_profile_centre in self.light_profile_centres_of_planes[-1]
+        ]
+
+    def image_plane_multiple_image_positions(
+        self, grid, source_plane_coordinate, pixel_scale_precision=None
+    ):
+        """Compute the image-plane positions of the multiple images of a source-plane coordinate, to a precision \
+        below the grid's pixel scale, using an iteratively refined adaptive grid which begins coarse over the grid's \
+        region and only refines the cells around the images (see *positions_solver.PositionsFinder*).
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid whose extent defines the region of the image-plane that is searched.
+        source_plane_coordinate : (float, float)
+            The (y,x) source-plane coordinate whose images are found.
+        pixel_scale_precision : float or None
+            The size of the cells below which the adaptive grid stops being refined, which defaults to 1% of the \
+            grid's pixel scale.
+        """
+
+        if pixel_scale_precision is None:
+            pixel_scale_precision = 0.01 * grid.pixel_scales[0]
+
+        positions_finder = positions_solver.PositionsFinder(
+            grid=grid, pixel_scale_precision=pixel_scale_precision
         )
 
-        return grids.Coordinates.from_pixels_and_mask(
-            pixels=[multiple_image_pixels], mask=trough_mask
+        return grids.Coordinates(
+            coordinates=[
+                positions_finder.image_plane_positions_from_tracer_and_source_plane_coordinate(
+                    tracer=self, source_plane_coordinate=source_plane_coordinate
+                )
+            ],
+            mask=grid.mask,
         )
 
     @property
@@ -527,9 +1498,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
-
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=profile_image.in_2d_binned + blurring_image.in_2d_binned,
@@ -550,18 +1521,18 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
-            plane.blurred_profile_image_from_grid_and_psf(
-                grid=traced_grids_of_planes[plane_index],
-                psf=psf,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            psf.convolved_array_from_array_2d_and_mask(
+                array_2d=profile_image.in_2d_binned + blurring_image.in_2d_binned,
+                mask=grid.mask,
+            )
+            for profile_image, blurring_image in zip(
+                profile_images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
     def blurred_profile_image_from_grid_and_convolver(
@@ -572,20 +1543,83 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         These are summed to give the tracer's overall blurred image in 1D.
 
+        If the tracer has a *FixedGalaxyBlurredImagesCache* for the grid, blurring grid and convolver, the cached \
+        blurred images of image-plane galaxies with fixed light profiles are added to the blurred image of the \
+        remaining light, instead of every galaxy being evaluated and blurred.
+
         Parameters
         ----------
         convolver : hyper_galaxies.imaging.convolution.ConvolverImage
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
+        cache = self.fixed_galaxy_blurred_images_cache
 
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        if cache is not None and cache.is_for_grid_blurring_grid_and_convolver(
+            grid=grid, blurring_grid=blurring_grid, convolver=convolver
+        ):
+            fixed_galaxies, fixed_blurred_images = cache.fixed_galaxies_and_blurred_images_from_galaxies(
+                galaxies=self.image_plane.galaxies
+            )
+
+            if fixed_galaxies:
+                return sum(
+                    fixed_blurred_images,
+                    self.tracer_without_light_of_image_plane_galaxies(
+                        galaxies=fixed_galaxies
+                    ).blurred_profile_image_from_grid_and_convolver(
+                        grid=grid, convolver=convolver, blurring_grid=blurring_grid
+                    ),
+                )
+
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return convolver.convolved_image_from_image_and_blurring_image(
             image=profile_image, blurring_image=blurring_image
         )
 
+    def tracer_without_light_of_image_plane_galaxies(self, galaxies):
+        """Return a copy of the tracer where the input image-plane galaxies are replaced by galaxies with only their \
+        mass profiles, which shares the tracer's memoized traced grids. The returned tracer traces grids \
+        identically but its profile images omit the light of the input galaxies, which is used to blur only the \
+        light whose blurred image is not cached (see *FixedGalaxyBlurredImagesCache*).
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The image-plane galaxies whose light is omitted from the returned tracer.
+        """
+
+        galaxy_ids = set(map(id, galaxies))
+
+        image_plane = pl.Plane(
+            redshift=self.image_plane.redshift,
+            galaxies=[
+                g.Galaxy(
+                    redshift=galaxy.redshift,
+                    **{
+                        name: value
+                        for name, value in galaxy.__dict__.items()
+                        if g.is_mass_profile(value)
+                    }
+                )
+                if id(galaxy) in galaxy_ids
+                else galaxy
+                for galaxy in self.image_plane.galaxies
+            ],
+            cosmology=self.cosmology,
+        )
+
+        tracer = self.__class__(
+            planes=[image_plane] + self.planes[1:], cosmology=self.cosmology
+        )
+        tracer.traced_grids_cache = self.traced_grids_cache
+        tracer.executor = self.executor
+
+        return tracer
+
     def blurred_profile_images_of_planes_from_grid_and_convolver(
         self, grid, convolver, blurring_grid
     ):
@@ -600,18 +1634,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        profile_images_of_planes, blurring_images_of_planes = self.profile_images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
-            plane.blurred_profile_image_from_grid_and_convolver(
-                grid=traced_grids_of_planes[plane_index],
-                convolver=convolver,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            convolver.convolved_image_from_image_and_blurring_image(
+                image=profile_image, blurring_image=blurring_image
+            )
+            for profile_image, blurring_image in zip(
+                profile_images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
     def unmasked_blurred_profile_image_from_grid_and_psf(self, grid, psf):
@@ -628,7 +1661,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
 
-        traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
+        traced_padded_grids = self.memoized_traced_grids_of_planes_from_grid(
+            grid=padded_grid
+        )
 
         unmasked_blurred_profile_images_of_planes = []
 
@@ -651,7 +1686,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
 
-        traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
+        traced_padded_grids = self.memoized_traced_grids_of_planes_from_grid(
+            grid=padded_grid
+        )
 
         for plane, traced_padded_grid in zip(self.planes, traced_padded_grids):
             padded_image_1d_of_galaxies = plane.profile_images_of_galaxies_from_grid(
@@ -721,8 +1758,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             if sparse_image_plane_grids_of_planes[plane_index] is None:
                 traced_sparse_grids_of_planes.append(None)
             else:
-                traced_sparse_grids = self.traced_grids_of_planes_from_grid(
-                    grid=sparse_image_plane_grids_of_planes[plane_index]
+                traced_sparse_grids = self.memoized_traced_grids_of_planes_from_grid(
+                    grid=sparse_image_plane_grids_of_planes[plane_index],
+                    plane_index_limit=plane_index,
                 )
                 traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
 
@@ -734,7 +1772,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         mappers_of_planes = []
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid
+        )
 
         traced_sparse_grids_of_planes = self.traced_sparse_grids_of_planes_from_grid(
             grid=grid, preload_sparse_grids_of_planes=preload_sparse_grids_of_planes
@@ -820,7 +1860,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_profile_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid
+        )
 
         for (plane_index, plane) in enumerate(self.planes):
             profile_images_of_galaxies = plane.profile_images_of_galaxies_from_grid(
@@ -842,9 +1884,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_blurred_profile_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid
+        )
 
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+        traced_blurring_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
             grid=blurring_grid
         )
 
@@ -870,7 +1914,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_profile_visibilities_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.memoized_traced_grids_of_planes_from_grid(
+            grid=grid
+        )
 
         for (plane_index, plane) in enumerate(self.planes):
             profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
@@ -913,6 +1959,7 @@ class Tracer(AbstractTracerData):
         source_galaxies,
         planes_between_lenses,
         cosmology=cosmo.Planck15,
+        opening_angle=None,
     ):
 
         """Ray-tracer for a lens system with any number of planes.
@@ -940,6 +1987,10 @@ class Tracer(AbstractTracerData):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        opening_angle : float or None
+            If input, the deflection angles of the spherical mass profiles of every plane (e.g. the line-of-sight \
+            halos) are computed using a Barnes-Hut tree with this opening angle (see \
+            *compiled_plane.DeflectionsTree*), instead of exactly.
         """
 
         lens_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
@@ -971,4 +2022,320 @@ class Tracer(AbstractTracerData):
                 )
             )
 
+        if opening_angle is not None:
+            for plane in planes:
+                plane.compiled_plane.opening_angle = opening_angle
+
         return Tracer(planes=planes, cosmology=cosmology)
+
+
+class TracerTemplate:
+    def __init__(self, plane_redshifts, plane_indexes, cosmology=cosmo.Planck15):
+        """The plane structure of the tracers of a phase, which maps the position of every galaxy in a list of \
+        galaxies (e.g. the galaxies of a model instance, which are in the same order for every instance) to the \
+        plane it is in.
+
+        *Tracer.from_galaxies* sorts the galaxies by redshift and bins them into planes every time it is called, \
+        whereas the galaxies and their redshifts rarely change between the likelihood evaluations of a phase. A \
+        template is therefore computed once from the first list of galaxies (see *from_galaxies*), after which \
+        *tracer_from_galaxies* only places every galaxy in its prebuilt plane slot.
+
+        Parameters
+        ----------
+        plane_redshifts : [float]
+            The redshifts of the planes in ascending redshift order.
+        plane_indexes : [int]
+            The index of the plane of every galaxy, in the order the galaxies are input.
+        cosmology : astropy.cosmology
+            The cosmology of the ray-tracing calculation.
+        """
+        self.plane_redshifts = plane_redshifts
+        self.plane_indexes = plane_indexes
+        self.cosmology = cosmology
+
+    @classmethod
+    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+
+        plane_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
+            galaxies=galaxies
+        )
+
+        plane_index_of_redshift = {
+            redshift: plane_index
+            for plane_index, redshift in enumerate(plane_redshifts)
+        }
+
+        return TracerTemplate(
+            plane_redshifts=plane_redshifts,
+            plane_indexes=[
+                plane_index_of_redshift[galaxy.redshift] for galaxy in galaxies
+            ],
+            cosmology=cosmology,
+        )
+
+    def matches_galaxies(self, galaxies):
+        """Whether a list of galaxies has the same number of galaxies as the template and every galaxy has the \
+        redshift of its plane slot, such that *tracer_from_galaxies* can place them in the template's planes."""
+
+        if len(galaxies) != len(self.plane_indexes):
+            return False
+
+        return all(
+            galaxy.redshift == self.plane_redshifts[plane_index]
+            for galaxy, plane_index in zip(galaxies, self.plane_indexes)
+        )
+
+    def tracer_from_galaxies(self, galaxies):
+        """Create the tracer of a list of galaxies by placing every galaxy in its plane slot, which gives the same \
+        tracer as *Tracer.from_galaxies*. If the galaxies do not match the template (see *matches_galaxies*), \
+        the tracer is created by *Tracer.from_galaxies* instead.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The galaxies of the tracer, in the order of the galaxies the template was created from.
+        """
+
+        galaxies = list(galaxies)
+
+        if not self.matches_galaxies(galaxies=galaxies):
+            return Tracer.from_galaxies(galaxies=galaxies, cosmology=self.cosmology)
+
+        galaxies_in_planes = [[] for _ in self.plane_redshifts]
+
+        for galaxy, plane_index in zip(galaxies, self.plane_indexes):
+            galaxies_in_planes[plane_index].append(galaxy)
+
+        return Tracer(
+            planes=[
+                pl.Plane(
+                    redshift=redshift,
+                    galaxies=galaxies_in_plane,
+                    cosmology=self.cosmology,
+                )
+                for redshift, galaxies_in_plane in zip(
+                    self.plane_redshifts, galaxies_in_planes
+                )
+            ],
+            cosmology=self.cosmology,
+        )
+
+
+class TracerBatch:
+    def __init__(self, tracers):
+        """A batch of tracers which all have the same plane redshifts and cosmology, for example the tracers of \
+        every walker proposed by an ensemble sampler for the same model.
+
+        The traced grids, images and blurred images of every tracer are computed together along a leading batch \
+        axis. The galaxies of every plane are compiled for the whole batch (see *compiled_plane.CompiledPlaneBatch*), \
+        such that profiles with a kernel are evaluated for every tracer in one calculation per plane, and the \
+        multi-plane ray-tracing arithmetic is performed once for the batch. The blurred images are convolved with \
+        the PSF by the *Convolver*, as they are by a tracer.
+
+        Deflection angles are interpolated by a tracer if the grid has an interpolator (see \
+        *Tracer.deflections_interpolator_from_grid*), which depends on each tracer's deflection angles, thus for \
+        such grids the quantities of each tracer are computed by its own methods and stacked.
+
+        Parameters
+        ----------
+        tracers : [Tracer]
+            The tracers in the batch, which must have identical plane redshifts and cosmologies.
+        """
+
+        if len(tracers) == 0:
+            raise exc.TracerBatchException(
+                "A TracerBatch requires at least one tracer."
+            )
+
+        for tracer in tracers[1:]:
+            if (
+                tracer.plane_redshifts != tracers[0].plane_redshifts
+                or tracer.cosmology != tracers[0].cosmology
+            ):
+                raise exc.TracerBatchException(
+                    "Every tracer in a TracerBatch must have the same plane redshifts and cosmology."
+                )
+
+        self.tracers = tracers
+
+    @classmethod
+    def from_galaxies_of_tracers(cls, galaxies_of_tracers, cosmology=cosmo.Planck15):
+        return TracerBatch(
+            tracers=[
+                Tracer.from_galaxies(galaxies=galaxies, cosmology=cosmology)
+                for galaxies in galaxies_of_tracers
+            ]
+        )
+
+    @property
+    def batch_size(self):
+        return len(self.tracers)
+
+    @property
+    def total_planes(self):
+        return self.tracers[0].total_planes
+
+    @property
+    def plane_redshifts(self):
+        return self.tracers[0].plane_redshifts
+
+    @property
+    def scaling_factors_of_planes(self):
+        return self.tracers[0].scaling_factors_of_planes
+
+    @property
+    def upper_plane_index_with_light_profile(self):
+        return max(
+            [tracer.upper_plane_index_with_light_profile for tracer in self.tracers]
+        )
+
+    def compiled_plane_batch_from_plane_index(self, plane_index):
+        """The galaxies of plane *plane_index* of every tracer compiled for the whole batch (see \
+        *compiled_plane.CompiledPlaneBatch*)."""
+        return cp.CompiledPlaneBatch(
+            galaxies_of_batch=[
+                tracer.planes[plane_index].galaxies for tracer in self.tracers
+            ]
+        )
+
+    def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an image-plane grid through the planes of every tracer in the batch, returning an ndarray of \
+        shape (batch_size, total_planes, total_coordinates, 2) (or up to and including plane *plane_index_limit*).
+
+        The deflection angles of every plane are computed for the whole batch at once (see \
+        *compiled_plane.CompiledPlaneBatch*) and are rescaled and subtracted for every tracer at once.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregular
+            The image-plane grid which is traced.
+        plane_index_limit : int or None
+            If input, ray-tracing stops at this plane.
+        """
+
+        if getattr(grid, "interpolator", None) is not None:
+            return np.stack(
+                [
+                    np.stack(
+                        [
+                            np.asarray(traced_grid)
+                            for traced_grid in tracer.memoized_traced_grids_of_planes_from_grid(
+                                grid=grid, plane_index_limit=plane_index_limit
+                            )
+                        ]
+                    )
+                    for tracer in self.tracers
+                ]
+            )
+
+        total_planes = (
+            self.total_planes if plane_index_limit is None else plane_index_limit + 1
+        )
+
+        traced_grids = np.zeros(shape=(self.batch_size, total_planes) + grid.shape)
+        deflections = np.zeros(shape=(self.batch_size, total_planes) + grid.shape)
+
+        for plane_index in range(total_planes):
+
+            traced_grids[:, plane_index] = np.asarray(grid) - np.einsum(
+                "i,bi...->b...",
+                self.scaling_factors_of_planes[:plane_index, plane_index],
+                deflections[:, :plane_index],
+            )
+
+            # The deflection angles of the last plane traced to are never used, so are not computed.
+            if plane_index < total_planes - 1:
+                self.compiled_plane_batch_from_plane_index(
+                    plane_index=plane_index
+                ).deflections_from_grids(
+                    grids_of_batch=traced_grids[:, plane_index],
+                    out=deflections[:, plane_index],
+                )
+
+        return traced_grids
+
+    def profile_images_from_grid(self, grid):
+        """Compute the (unbinned) profile image of every tracer in the batch on a grid, returning an ndarray of \
+        shape (batch_size, total_coordinates).
+
+        The light profiles of every plane are evaluated for the whole batch at once (see \
+        *compiled_plane.CompiledPlaneBatch*)."""
+
+        if getattr(grid, "interpolator", None) is not None:
+            return np.stack(
+                [
+                    np.asarray(tracer.profile_image_from_grid(grid=grid))
+                    for tracer in self.tracers
+                ]
+            )
+
+        traced_grids = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
+
+        profile_images = np.zeros(shape=(self.batch_size, grid.shape[0]))
+
+        for plane_index in range(traced_grids.shape[1]):
+            self.compiled_plane_batch_from_plane_index(
+                plane_index=plane_index
+            ).profile_images_from_grids(
+                grids_of_batch=traced_grids[:, plane_index], out=profile_images
+            )
+
+        return profile_images
+
+    def blurred_profile_images_from_grid_and_convolver(
+        self, grid, convolver, blurring_grid
+    ):
+        """Compute the blurred profile image of every tracer in the batch, returning an ndarray of shape \
+        (batch_size, image_pixels) of the 1D masked blurred images.
+
+        The grid and blurring grid are traced and evaluated together as one fused grid (see \
+        *lens_util.fused_grid_from_grid_and_blurring_grid*), whose images are split, binned up from the sub-grid and \
+        convolved with the PSF by the *Convolver* for every tracer.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid the images are computed on.
+        convolver : aa.Convolver
+            The convolver which performs the PSF convolution of the masked 1D images.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid, whose light is blurred into the masked region by the PSF.
+        """
+
+        if not Tracer._grid_and_blurring_grid_can_be_fused(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+            return np.stack(
+                [
+                    np.asarray(
+                        tracer.blurred_profile_image_from_grid_and_convolver(
+                            grid=grid, convolver=convolver, blurring_grid=blurring_grid
+                        ).in_1d_binned
+                    )
+                    for tracer in self.tracers
+                ]
+            )
+
+        fused_images = self.profile_images_from_grid(
+            grid=lens_util.fused_grid_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+        )
+
+        return np.stack(
+            [
+                np.asarray(
+                    convolver.convolved_image_from_image_and_blurring_image(
+                        image=grid.mapping.array_stored_1d_from_sub_array_1d(
+                            sub_array_1d=fused_image[: grid.sub_shape_1d]
+                        ),
+                        blurring_image=blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                            sub_array_1d=fused_image[grid.sub_shape_1d :]
+                        ),
+                    ).in_1d_binned
+                )
+                for fused_image in fused_images
+            ]
+        )
@@ -1,11 +1,18 @@
 from autoarray.structures import grids
 from autoarray.masked import masked_dataset
 from autolens.fit import fit
+from autolens.lens import ray_tracing
 from autolens import exc
 
 
 class AbstractLensMasked:
-    def __init__(self, positions, positions_threshold, preload_sparse_grids_of_planes):
+    def __init__(
+        self,
+        positions,
+        positions_threshold,
+        preload_sparse_grids_of_planes,
+        ray_tracing_uses_workspace=False,
+    ):
 
         if positions is not None:
             self.positions = grids.Coordinates(coordinates=positions)
@@ -16,6 +23,14 @@ class AbstractLensMasked:
 
         self.preload_sparse_grids_of_planes = preload_sparse_grids_of_planes
 
+        self.ray_tracing_uses_workspace = ray_tracing_uses_workspace
+
+        if ray_tracing_uses_workspace:
+            ray_tracing.TracedGridsWorkspace.attach_to_grid(grid=self.grid)
+            ray_tracing.TracedGridsWorkspace.attach_to_grid(
+                grid=getattr(self, "blurring_grid", None)
+            )
+
     def check_positions_trace_within_threshold_via_tracer(self, tracer):
 
         if self.positions is not None and self.positions_threshold is not None:
@@ -53,6 +68,7 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        ray_tracing_uses_workspace=False,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -82,6 +98,9 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        ray_tracing_uses_workspace : bool
+            If *True*, the grid and blurring grid are ray-traced into a preallocated workspace that is reused for \
+            every fit, instead of allocating new traced grids for every plane in every fit.
         """
 
         super(MaskedImaging, self).__init__(
@@ -98,6 +117,7 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             positions=positions,
             positions_threshold=positions_threshold,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            ray_tracing_uses_workspace=ray_tracing_uses_workspace,
         )
 
     def binned_from_bin_up_factor(self, bin_up_factor):
@@ -119,6 +139,7 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            ray_tracing_uses_workspace=self.ray_tracing_uses_workspace,
         )
 
     def signal_to_noise_limited_from_signal_to_noise_limit(self, signal_to_noise_limit):
@@ -137,6 +158,7 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            ray_tracing_uses_workspace=self.ray_tracing_uses_workspace,
         )
 
 
@@ -1,12 +1,24 @@
+from collections import OrderedDict
+
 import autofit as af
 from autoastro.galaxy import galaxy as g
+from autolens.lens import executor as ex
 from autolens.lens import ray_tracing
+from autolens.pipeline.phase.dataset import likelihood_cache as lc
 
 
 class Analysis(af.Analysis):
-    def __init__(self, cosmology, results):
+
+    traced_grids_cache_size = 2
+
+    def __init__(self, cosmology, results, threads=1, likelihood_cache=None):
 
         self.cosmology = cosmology
+        self.traced_grids_caches = OrderedDict()
+        self.tracer_template = None
+        self.executor = ex.executor_from_threads(threads=threads)
+        self.likelihood_cache = likelihood_cache
+        self._likelihood_cache_state_key = None
 
         # TODO : This if loop is because of an OptimizerGridSeach, where the 'best_result' we do not want to update
         # TODO: the hyper images using.
@@ -29,6 +41,75 @@ class Analysis(af.Analysis):
 
                 self.hyper_model_image = results[-2].hyper_model_image
 
+    def fit(self, instance):
+        """
+        Determine the figure of merit of a model instance's fit to the masked dataset (see \
+        *figure_of_merit_from_instance*).
+
+        If the analysis has a likelihood cache, the figure of merit of an instance whose parameters are identical \
+        to a previously fitted instance (e.g. when a non-linear search is resumed) is reused from the cache (see \
+        *LikelihoodCache*). Figures of merit are cached with the analysis's state (see *likelihood_cache_state*), \
+        such that those of a resumed phase whose dataset or hyper images have changed are not reused.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+
+        if self.likelihood_cache is None:
+            return self.figure_of_merit_from_instance(instance=instance)
+
+        return self.likelihood_cache.figure_of_merit_from_instance(
+            instance=instance,
+            figure_of_merit_from_instance=self.figure_of_merit_from_instance,
+            state_key=self.likelihood_cache_state_key,
+        )
+
+    def likelihood_cache_state(self):
+        """The arrays and values of the analysis which, besides the parameters of a model instance, determine its \
+        figure of merit, and thus whether a cached figure of merit can be reused (see *LikelihoodCache*)."""
+
+        likelihood_cache_state = [repr(self.cosmology)]
+
+        if hasattr(self, "hyper_galaxy_image_path_dict"):
+
+            likelihood_cache_state.append(self.hyper_model_image)
+
+            for galaxy_path in sorted(self.hyper_galaxy_image_path_dict):
+                likelihood_cache_state.append(galaxy_path)
+                likelihood_cache_state.append(
+                    self.hyper_galaxy_image_path_dict[galaxy_path]
+                )
+
+        return likelihood_cache_state
+
+    @property
+    def likelihood_cache_state_key(self):
+        """The hash of the *likelihood_cache_state*, which is fixed for an analysis and thus computed once."""
+
+        if self._likelihood_cache_state_key is None:
+            self._likelihood_cache_state_key = lc.state_key_from_arrays_and_values(
+                arrays_and_values=self.likelihood_cache_state()
+            )
+
+        return self._likelihood_cache_state_key
+
+    def figure_of_merit_from_instance(self, instance):
+        raise NotImplementedError()
+
+    def output_likelihood_cache(self, during_analysis):
+        """Write the likelihood cache to the phase output at the end of the phase (when *during_analysis* is \
+        *False*), such that the figures of merit computed since it was last written (which happens every \
+        *LikelihoodCache.output_interval* misses) are not lost."""
+
+        if (
+            not during_analysis
+            and self.likelihood_cache is not None
+            and self.likelihood_cache.output_path is not None
+        ):
+            self.likelihood_cache.output()
+
     def hyper_image_sky_for_instance(self, instance):
 
         if hasattr(instance, "hyper_image_sky"):
@@ -44,9 +125,43 @@ class Analysis(af.Analysis):
             return None
 
     def tracer_for_instance(self, instance):
-        return ray_tracing.Tracer.from_galaxies(
-            galaxies=instance.galaxies, cosmology=self.cosmology
-        )
+        """Create the tracer of a model instance.
+
+        Tracers whose mass profiles have identical parameters (see *Tracer.mass_profiles_key*) trace every grid to \
+        the same traced grids. The traced grids caches of the *traced_grids_cache_size* most recent mass models are \
+        therefore kept by the analysis and shared with every new tracer of the same mass model, such that \
+        likelihood evaluations where only the source or regularization parameters change (e.g. inversion and hyper \
+        phases where the lens mass is fixed) reuse the traced grids and traced sparse grids of the previous \
+        evaluation instead of recomputing the deflection angles.
+
+        The galaxies of every instance of a phase are in the same order and (unless their redshifts are free \
+        parameters) at the same redshifts, so the tracer is created from a *TracerTemplate* of the phase's plane \
+        structure, computed from the first instance. Instances whose galaxies do not match the template fall back to \
+        *Tracer.from_galaxies*.
+
+        Every tracer uses the analysis's executor, which evaluates the independent calculations of a fit \
+        concurrently if the phase uses more than one thread (see *executor.ThreadedExecutor*).
+        """
+        if self.tracer_template is None:
+            self.tracer_template = ray_tracing.TracerTemplate.from_galaxies(
+                galaxies=instance.galaxies, cosmology=self.cosmology
+            )
+
+        tracer = self.tracer_template.tracer_from_galaxies(galaxies=instance.galaxies)
+        tracer.executor = self.executor
+
+        mass_profiles_key = tracer.mass_profiles_key
+
+        if mass_profiles_key in self.traced_grids_caches:
+            self.traced_grids_caches.move_to_end(mass_profiles_key)
+            tracer.traced_grids_cache = self.traced_grids_caches[mass_profiles_key]
+        else:
+            self.traced_grids_caches[mass_profiles_key] = tracer.traced_grids_cache
+
+            if len(self.traced_grids_caches) > self.traced_grids_cache_size:
+                self.traced_grids_caches.popitem(last=False)
+
+        return tracer
 
     def associate_hyper_images(self, instance: af.ModelInstance) -> af.ModelInstance:
         """
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import numbers
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+def path_parameter_tuples_from_object(obj, path=()):
+    """The (path, value) tuples of every numerical parameter of an object (e.g. a model instance), found by \
+    recursively searching its attributes, lists and tuples. The class names of the objects searched are included \
+    in the paths, such that instances whose profiles have the same parameters but different classes differ.
+
+    Arrays (e.g. hyper images), private attributes and the *id* of model instances are not parameters and are \
+    skipped."""
+
+    if isinstance(obj, numbers.Real):
+        return [(path, float(obj))]
+
+    if isinstance(obj, (list, tuple)):
+        return [
+            path_parameter_tuple
+            for (index, item) in enumerate(obj)
+            for path_parameter_tuple in path_parameter_tuples_from_object(
+                obj=item, path=path + (index,)
+            )
+        ]
+
+    if isinstance(obj, np.ndarray) or not hasattr(obj, "__dict__"):
+        return []
+
+    path = path + (obj.__class__.__name__,)
+
+    return [
+        path_parameter_tuple
+        for (name, value) in sorted(vars(obj).items())
+        if not name.startswith("_") and name not in ("id", "cache")
+        for path_parameter_tuple in path_parameter_tuples_from_object(
+            obj=value, path=path + (name,)
+        )
+    ]
+
+
+def parameters_key_from_instance(instance):
+    """A canonical hash of the numerical parameters of a model instance (see *path_parameter_tuples_from_object*).
+
+    The fixed parameters of a phase's model are the same for every instance, thus two instances have the same key \
+    if and only if their free parameters are identical."""
+
+    return hashlib.sha1(
+        repr(path_parameter_tuples_from_object(obj=instance)).encode()
+    ).hexdigest()
+
+
+def state_key_from_arrays_and_values(arrays_and_values):
+    """A hash of the state of an analysis which, besides the parameters of a model instance, determines its figure \
+    of merit (e.g. the dataset, mask and hyper images), given as a list of arrays and values.
+
+    Arrays are hashed via their shapes and data, and every other value via its *repr*."""
+
+    state_key = hashlib.sha1()
+
+    for array_or_value in arrays_and_values:
+
+        if isinstance(array_or_value, np.ndarray):
+            state_key.update(repr(array_or_value.shape).encode())
+            state_key.update(np.ascontiguousarray(array_or_value).tobytes())
+        else:
+            state_key.update(repr(array_or_value).encode())
+
+    return state_key.hexdigest()
+
+
+class LikelihoodCache:
+
+    # The maximum number of figures of merit cached, where the least recently used is evicted first.
+    cache_size = 10000
+
+    # The cache is written to the phase output every time this many figures of merit have been computed.
+    output_interval = 100
+
+    def __init__(self, output_path=None):
+        """A least-recently-used cache of the figures of merit of the model instances fitted by an analysis, keyed \
+        by a hash of the analysis's state (see *state_key_from_arrays_and_values*) and a canonical hash of their \
+        parameters (see *parameters_key_from_instance*), such that instances with identical parameters which are \
+        fitted to the same state and evaluated again (e.g. by a resumed non-linear search or the re-fit of the \
+        maximum likelihood model) are not fitted again.
+
+        The cache is written to the file 'likelihood_cache.json' in the phase output path every *output_interval* \
+        misses and at the end of the phase, and loaded from it when the phase is resumed (keeping the most \
+        recently used *cache_size* figures of merit). Figures of merit persisted for a different state (e.g. a \
+        resumed phase whose hyper images or mask have changed) therefore never match and are evicted over time. \
+        The number of hits and misses of the cache are written to 'likelihood_cache.info'.
+
+        Parameters
+        ----------
+        output_path : str or None
+            The phase output path the cache is persisted to.
+        """
+        self.output_path = output_path
+
+        self.figures_of_merit = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        if output_path is not None and os.path.isfile(self.file_likelihood_cache):
+            with open(self.file_likelihood_cache, "r") as likelihood_cache:
+                self.figures_of_merit.update(
+                    json.load(likelihood_cache)[-self.cache_size :]
+                )
+
+    @property
+    def file_likelihood_cache(self):
+        return "{}/{}".format(self.output_path, "likelihood_cache.json")
+
+    @property
+    def hit_rate(self):
+        if self.hits + self.misses == 0:
+            return 0.0
+        return self.hits / (self.hits + self.misses)
+
+    def figure_of_merit_from_instance(
+        self, instance, figure_of_merit_from_instance, state_key=""
+    ):
+        """The figure of merit of a model instance, which is computed using the input function only if an \
+        instance with identical parameters fitted to the same analysis state is not in the cache.
+
+        Instances whose fit raises an exception (e.g. a *FitException*) are not cached.
+
+        Parameters
+        ----------
+        instance : af.ModelInstance
+            The model instance that is fitted.
+        figure_of_merit_from_instance : func
+            The function which fits the instance and returns its figure of merit.
+        state_key : str
+            The hash of the analysis state the instance is fitted to (see *state_key_from_arrays_and_values*).
+        """
+
+        key = "{}_{}".format(state_key, parameters_key_from_instance(instance=instance))
+
+        if key in self.figures_of_merit:
+            self.hits += 1
+            self.figures_of_merit.move_to_end(key)
+            return self.figures_of_merit[key]
+
+        self.misses += 1
+
+        figure_of_merit = figure_of_merit_from_instance(instance)
+
+        self.figures_of_merit[key] = float(figure_of_merit)
+
+        if len(self.figures_of_merit) > self.cache_size:
+            self.figures_of_merit.popitem(last=False)
+
+        if self.output_path is not None and self.misses % self.output_interval == 0:
+            self.output()
+
+        return figure_of_merit
+
+    def output(self):
+
+        with open(self.file_likelihood_cache, "w") as likelihood_cache:
+            json.dump(list(self.figures_of_merit.items()), likelihood_cache)
+
+        file_likelihood_cache_info = "{}/{}".format(
+            self.output_path, "likelihood_cache.info"
+        )
+
+        with open(file_likelihood_cache_info, "w") as likelihood_cache_info:
+            likelihood_cache_info.write("Hits = {} \n".format(self.hits))
+            likelihood_cache_info.write("Misses = {} \n".format(self.misses))
+            likelihood_cache_info.write("Hit Rate = {} \n".format(self.hit_rate))
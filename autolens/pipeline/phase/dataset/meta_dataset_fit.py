@@ -1,6 +1,7 @@
 import autofit as af
 import autoarray as aa
 from autolens import exc
+from autolens.pipeline.phase.dataset import likelihood_cache as lc
 from autoarray.operators.inversion import pixelizations as pix
 from autolens.pipeline.phase.dataset.phase import isinstance_or_prior
 
@@ -16,6 +17,8 @@ class MetaDatasetFit:
         inversion_uses_border=True,
         inversion_pixel_limit=None,
         is_hyper_phase=False,
+        uses_likelihood_cache=False,
+        threads=1,
     ):
         self.is_hyper_phase = is_hyper_phase
         self.model = model
@@ -30,6 +33,8 @@ class MetaDatasetFit:
                 "inversion", "inversion_pixel_limit_overall", int
             )
         )
+        self.uses_likelihood_cache = uses_likelihood_cache
+        self.threads = threads
 
     def mask_with_phase_sub_size_from_mask(self, mask):
 
@@ -43,6 +48,13 @@ class MetaDatasetFit:
 
         return mask
 
+    def likelihood_cache_from_output_path(self, output_path):
+
+        if not self.uses_likelihood_cache:
+            return None
+
+        return lc.LikelihoodCache(output_path=output_path)
+
     def check_positions(self, positions):
 
         if self.positions_threshold is not None and positions is None:
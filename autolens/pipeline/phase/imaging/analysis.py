@@ -1,14 +1,33 @@
+import numpy as np
+
 from autoarray.exc import InversionException, GridException
 from autofit.exc import FitException
 from autolens.fit import fit
+from autolens.lens import ray_tracing
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
+from autolens.pipeline.phase.imaging import rejection_cascade as rc
 
 
 class Analysis(analysis_dataset.Analysis):
-    def __init__(self, masked_imaging, cosmology, image_path=None, results=None):
+    def __init__(
+        self,
+        masked_imaging,
+        cosmology,
+        image_path=None,
+        results=None,
+        threads=1,
+        low_resolution_masked_imaging=None,
+        output_path=None,
+        likelihood_cache=None,
+    ):
 
-        super(Analysis, self).__init__(cosmology=cosmology, results=results)
+        super(Analysis, self).__init__(
+            cosmology=cosmology,
+            results=results,
+            threads=threads,
+            likelihood_cache=likelihood_cache,
+        )
 
         self.visualizer = visualizer.PhaseImagingVisualizer(
             masked_dataset=masked_imaging, image_path=image_path, results=results
@@ -16,11 +35,85 @@ class Analysis(analysis_dataset.Analysis):
 
         self.masked_dataset = masked_imaging
 
+        if (
+            getattr(masked_imaging, "blurring_grid", None) is not None
+            and getattr(masked_imaging, "convolver", None) is not None
+        ):
+            self.fixed_galaxy_blurred_images_cache = ray_tracing.FixedGalaxyBlurredImagesCache(
+                grid=masked_imaging.grid,
+                blurring_grid=masked_imaging.blurring_grid,
+                convolver=masked_imaging.convolver,
+            )
+        else:
+            self.fixed_galaxy_blurred_images_cache = None
+
+        self.rejection_cascade = rc.RejectionCascade(
+            masked_imaging=masked_imaging,
+            low_resolution_masked_imaging=low_resolution_masked_imaging,
+            output_path=output_path,
+        )
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
 
+    def tracer_for_instance(self, instance):
+        """Create the tracer of a model instance, which uses the analysis's cache of the blurred images of \
+        image-plane galaxies whose light profiles are fixed (see *FixedGalaxyBlurredImagesCache*)."""
+        tracer = super(Analysis, self).tracer_for_instance(instance=instance)
+        tracer.fixed_galaxy_blurred_images_cache = (
+            self.fixed_galaxy_blurred_images_cache
+        )
+        return tracer
+
+    def likelihood_cache_state(self):
+        """The masked imaging data, noise-map, mask, PSF and settings which the figure of merit of an instance \
+        depends on, in addition to the hyper images (see *Analysis.likelihood_cache_state*)."""
+
+        likelihood_cache_state = super(Analysis, self).likelihood_cache_state()
+
+        for name in (
+            "image",
+            "noise_map",
+            "mask",
+            "psf",
+            "positions",
+            "positions_threshold",
+            "pixel_scale_interpolation_grid",
+            "inversion_pixel_limit",
+            "inversion_uses_border",
+        ):
+            likelihood_cache_state.append(getattr(self.masked_dataset, name, None))
+
+        likelihood_cache_state.append(
+            getattr(self.masked_dataset.grid, "sub_size", None)
+        )
+
+        return likelihood_cache_state
+
     def fit(self, instance):
+        """
+        Determine the figure of merit of a model instance's fit to the masked imaging (see *Analysis.fit*).
+
+        The maximum figure of merit of the rejection cascade is updated by every fit, including those whose \
+        figure of merit is reused from the likelihood cache (e.g. when a non-linear search is resumed), such that \
+        its low resolution stage (if used) compares models to the best fit found so far.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+
+        figure_of_merit = super(Analysis, self).fit(instance=instance)
+
+        self.rejection_cascade.update_maximum_figure_of_merit(
+            figure_of_merit=figure_of_merit
+        )
+
+        return figure_of_merit
+
+    def figure_of_merit_from_instance(self, instance):
         """
         Determine the fit of a lens galaxy and source galaxy to the masked_imaging in this lens.
 
@@ -38,33 +131,139 @@ class Analysis(analysis_dataset.Analysis):
         self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
-        self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer
-        )
-
-        self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
-            tracer=tracer
-        )
-
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
 
         hyper_background_noise = self.hyper_background_noise_for_instance(
             instance=instance
         )
 
+        self.rejection_cascade.check_tracer(
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        # Only the figure of merit is required, thus a full ImagingFit is only created for visualization and results.
+
         try:
-            fit = self.masked_imaging_fit_for_tracer(
+            figure_of_merit = fit.figure_of_merit_from_masked_imaging_and_tracer(
+                masked_imaging=self.masked_dataset,
                 tracer=tracer,
                 hyper_image_sky=hyper_image_sky,
                 hyper_background_noise=hyper_background_noise,
             )
-
-            return fit.figure_of_merit
         except InversionException or GridException as e:
             raise FitException from e
 
+        return figure_of_merit
+
+    def fit_batch(self, instances):
+        """
+        Determine the fit of a batch of model instances (e.g. every walker of an ensemble sampler) to the \
+        masked_imaging in this lens, returning the figure of merit of every instance.
+
+        Instances whose tracers are rejected by the rejection cascade (see *RejectionCascade*) are given a figure \
+        of merit of -inf, as a non-linear search does for a *FitException*. Instances with an inversion are fitted \
+        individually. The remaining tracers are grouped by their plane redshifts into *TracerBatch*'s, whose \
+        deflection angles, model images and likelihoods are computed for the whole batch at once.
+
+        Parameters
+        ----------
+        instances : [ModelInstance]
+            The model instances that are fitted.
+
+        Returns
+        -------
+        figures_of_merit : ndarray
+            The figure of merit of every instance.
+        """
+
+        figures_of_merit = np.full(shape=len(instances), fill_value=-np.inf)
+
+        batches = {}
+
+        for (instance_index, instance) in enumerate(instances):
+
+            self.associate_hyper_images(instance=instance)
+            tracer = self.tracer_for_instance(instance=instance)
+
+            hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+
+            hyper_background_noise = self.hyper_background_noise_for_instance(
+                instance=instance
+            )
+
+            try:
+                self.rejection_cascade.check_tracer(
+                    tracer=tracer,
+                    hyper_image_sky=hyper_image_sky,
+                    hyper_background_noise=hyper_background_noise,
+                )
+            except FitException:
+                continue
+
+            if tracer.has_pixelization:
+
+                try:
+                    figures_of_merit[
+                        instance_index
+                    ] = fit.figure_of_merit_from_masked_imaging_and_tracer(
+                        masked_imaging=self.masked_dataset,
+                        tracer=tracer,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                    )
+                except (InversionException, GridException):
+                    pass
+
+                continue
+
+            image = fit.hyper_image_from_image_and_hyper_image_sky(
+                image=self.masked_dataset.image, hyper_image_sky=hyper_image_sky
+            )
+
+            noise_map = fit.hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+                noise_map=self.masked_dataset.noise_map,
+                tracer=tracer,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+            batch = batches.setdefault(tuple(tracer.plane_redshifts), ([], [], [], []))
+            batch[0].append(instance_index)
+            batch[1].append(tracer)
+            batch[2].append(image.in_1d)
+            batch[3].append(noise_map.in_1d)
+
+        for instance_indexes, tracers, images, noise_maps in batches.values():
+
+            tracer_batch = ray_tracing.TracerBatch(tracers=tracers)
+
+            model_images = tracer_batch.blurred_profile_images_from_grid_and_convolver(
+                grid=self.masked_dataset.grid,
+                convolver=self.masked_dataset.convolver,
+                blurring_grid=self.masked_dataset.blurring_grid,
+            )
+
+            figures_of_merit[
+                instance_indexes
+            ] = fit.likelihoods_from_images_noise_maps_and_model_images(
+                images=np.stack(images),
+                noise_maps=np.stack(noise_maps),
+                model_images=model_images,
+            )
+
+        self.rejection_cascade.update_maximum_figure_of_merit(
+            figure_of_merit=figures_of_merit
+        )
+
+        return figures_of_merit
+
     def masked_imaging_fit_for_tracer(
-        self, tracer, hyper_image_sky, hyper_background_noise
+        self,
+        tracer,
+        hyper_image_sky,
+        hyper_background_noise,
+        record_galaxy_images=False,
     ):
 
         return fit.ImagingFit(
@@ -72,9 +271,13 @@ class Analysis(analysis_dataset.Analysis):
             tracer=tracer,
             hyper_image_sky=hyper_image_sky,
             hyper_background_noise=hyper_background_noise,
+            record_galaxy_images=record_galaxy_images,
         )
 
     def visualize(self, instance, during_analysis):
+
+        self.output_likelihood_cache(during_analysis=during_analysis)
+
         instance = self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
@@ -86,20 +289,17 @@ class Analysis(analysis_dataset.Analysis):
             tracer=tracer,
             hyper_image_sky=hyper_image_sky,
             hyper_background_noise=hyper_background_noise,
+            record_galaxy_images=True,
         )
 
-        if tracer.has_mass_profile:
-
-            visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
-                preloaded_critical_curves=tracer.critical_curves,
-                preloaded_caustics=tracer.caustics,
-            )
-
-        else:
-
-            visualizer = self.visualizer
+        # The critical curves and caustics of the tracer are computed once by the first plot which includes them and
+        # are shared via the critical curves cache, thus they are not preloaded into a copy of the visualizer.
+        visualizer = self.visualizer
 
         visualizer.visualize_ray_tracing(
             tracer=fit.tracer, during_analysis=during_analysis
         )
         visualizer.visualize_fit(fit=fit, during_analysis=during_analysis)
+
+        if self.rejection_cascade.output_path is not None:
+            self.rejection_cascade.output_counters()
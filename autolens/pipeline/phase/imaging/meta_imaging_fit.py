@@ -15,6 +15,10 @@ class MetaImagingFit(dataset.MetaDatasetFit):
         inversion_pixel_limit=None,
         psf_shape_2d=None,
         bin_up_factor=None,
+        ray_tracing_uses_workspace=False,
+        low_resolution_bin_up_factor=None,
+        uses_likelihood_cache=False,
+        threads=1,
     ):
         super().__init__(
             model=model,
@@ -25,9 +29,13 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            uses_likelihood_cache=uses_likelihood_cache,
+            threads=threads,
         )
         self.psf_shape_2d = psf_shape_2d
         self.bin_up_factor = bin_up_factor
+        self.ray_tracing_uses_workspace = ray_tracing_uses_workspace
+        self.low_resolution_bin_up_factor = low_resolution_bin_up_factor
 
     def masked_dataset_from(self, dataset, mask, positions, results, modified_image):
 
@@ -49,6 +57,7 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             inversion_pixel_limit=self.inversion_pixel_limit,
             inversion_uses_border=self.inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            ray_tracing_uses_workspace=self.ray_tracing_uses_workspace,
         )
 
         if self.signal_to_noise_limit is not None:
@@ -62,3 +71,12 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             )
 
         return masked_imaging
+
+    def low_resolution_masked_dataset_from(self, masked_imaging):
+
+        if self.low_resolution_bin_up_factor is None:
+            return None
+
+        return masked_imaging.binned_from_bin_up_factor(
+            bin_up_factor=self.low_resolution_bin_up_factor
+        )
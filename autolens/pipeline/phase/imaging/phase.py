@@ -35,6 +35,10 @@ class PhaseImaging(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        ray_tracing_uses_workspace=False,
+        low_resolution_bin_up_factor=None,
+        uses_likelihood_cache=False,
+        threads=1,
     ):
 
         """
@@ -48,6 +52,23 @@ class PhaseImaging(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        ray_tracing_uses_workspace: bool
+            If *True*, the masked grids are ray-traced into a workspace that is reused by every fit, which avoids \
+            allocating traced grids for every plane each time the likelihood function is called.
+        low_resolution_bin_up_factor: int or None
+            If input, models are first fitted to the masked imaging binned up by this factor and rejected if the \
+            estimate of their figure of merit is far below the best fit so far, before their full fit (see \
+            *RejectionCascade*). The estimate is not a bound and the best fit so far depends on the order models \
+            are fitted in, thus whether a model is rejected is not deterministic. By default (*None*) this stage is \
+            not run and every model's figure of merit is that of its full fit.
+        uses_likelihood_cache: bool
+            If *True*, the figures of merit of the phase's model instances are cached by their parameters and \
+            persisted to the phase output, such that identical instances (e.g. those re-evaluated when the phase \
+            is resumed) are not fitted again (see *LikelihoodCache*).
+        threads: int
+            If above 1, the independent calculations of every fit (the profile images of the planes and the profile \
+            classes of every plane) are evaluated concurrently on a thread pool of this many threads, which is \
+            shared by all phases using the same number of threads.
         """
 
         phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -82,6 +103,10 @@ class PhaseImaging(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            ray_tracing_uses_workspace=ray_tracing_uses_workspace,
+            low_resolution_bin_up_factor=low_resolution_bin_up_factor,
+            uses_likelihood_cache=uses_likelihood_cache,
+            threads=threads,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -141,6 +166,14 @@ class PhaseImaging(dataset.PhaseDataset):
             cosmology=self.cosmology,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            threads=self.meta_imaging_fit.threads,
+            low_resolution_masked_imaging=self.meta_imaging_fit.low_resolution_masked_dataset_from(
+                masked_imaging=masked_imaging
+            ),
+            output_path=self.optimizer.paths.phase_output_path,
+            likelihood_cache=self.meta_imaging_fit.likelihood_cache_from_output_path(
+                output_path=self.optimizer.paths.phase_output_path
+            ),
         )
 
         return analysis
@@ -0,0 +1,215 @@
+import numpy as np
+
+from autolens import exc
+from autolens.fit import fit
+
+
+class RejectionCascade:
+
+    # The stages of the cascade, which are run in order of their cost.
+    stages = ("positions", "inversion_pixel_limit", "low_resolution_likelihood")
+
+    # A model is rejected by the low resolution likelihood stage if the estimate of its figure of merit is this far
+    # below the highest figure of merit of the phase so far. The estimate is not a bound, thus the margin guards
+    # against rejecting models whose full fit would be competitive.
+    low_resolution_likelihood_margin = 100.0
+
+    # The counters of the cascade are written to the phase output every time this many models have been checked.
+    output_interval = 100
+
+    def __init__(
+        self, masked_imaging, low_resolution_masked_imaging=None, output_path=None
+    ):
+        """Rejects the models of a phase which obviously fit the masked imaging poorly before their full fit, by \
+        running checks in order of their cost and stopping at the first which fails:
+
+        - positions: the positions must trace within the positions threshold of one another in the source-plane \
+          (see *MaskedImaging.check_positions_trace_within_threshold_via_tracer*).
+
+        - inversion_pixel_limit: every pixelization must have fewer pixels than the inversion pixel limit (see \
+          *MaskedImaging.check_inversion_pixels_are_below_limit_via_tracer*).
+
+        - low_resolution_likelihood: the model is fitted to a low resolution (binned up) copy of the masked imaging. \
+          Binning averages away the noise but not the residuals of a poor model, therefore the chi-squared of this \
+          fit plus the noise normalization of the full resolution data is an estimate of the model's figure of \
+          merit. It is not a bound: the model image is evaluated on the binned grid rather than binned from the full \
+          resolution model image, and residuals on scales below the binned pixels are averaged away. The model is \
+          rejected if this estimate is *low_resolution_likelihood_margin* below the highest figure of merit of the \
+          phase so far, which stands in for the likelihood threshold of the non-linear search (which is not passed \
+          to the analysis).
+
+          Whether a model is rejected therefore depends on the running maximum figure of merit, and thus on the \
+          order the models are fitted in: the same model can be accepted early in a phase and rejected later, and \
+          a model whose full fit is competitive can (rarely) be rejected. The stage is therefore opt-in, and is \
+          only run if a *low_resolution_masked_imaging* is input (see *PhaseImaging.low_resolution_bin_up_factor*).
+
+        The positions and inversion pixel limit stages are exact, rejecting only models whose full fit would raise \
+        the same exception, such that a cascade without the low resolution likelihood stage (the default) gives \
+        every model the same figure of merit as its full fit, independent of the order models are fitted in.
+
+        The low resolution likelihood stage is skipped for models with an inversion or hyper galaxies, whose \
+        fits depend on full resolution preloads and hyper images.
+
+        The number of models every stage was run on and accepted is counted and written to the file \
+        'rejection_cascade.info' in the phase output path.
+
+        Parameters
+        ----------
+        masked_imaging : MaskedImaging
+            The masked imaging the models of the phase are fitted to.
+        low_resolution_masked_imaging : MaskedImaging or None
+            The binned up masked imaging of the low resolution likelihood stage, which is not run if *None*.
+        output_path : str or None
+            The phase output path the counters are written to.
+        """
+        self.masked_imaging = masked_imaging
+        self.low_resolution_masked_imaging = low_resolution_masked_imaging
+        self.output_path = output_path
+
+        self.maximum_figure_of_merit = -np.inf
+
+        self.total_models = 0
+        self.total_evaluated = {stage: 0 for stage in self.stages}
+        self.total_accepted = {stage: 0 for stage in self.stages}
+
+    def check_tracer(self, tracer, hyper_image_sky=None, hyper_background_noise=None):
+        """Run the stages of the cascade on the tracer of a model, raising a *FitException* if it is rejected.
+
+        Parameters
+        ----------
+        tracer : ray_tracing.Tracer
+            The tracer of the model that is checked.
+        hyper_image_sky : HyperImageSky or None
+            The hyper image sky of the model.
+        hyper_background_noise : HyperBackgroundNoise or None
+            The hyper background noise of the model.
+        """
+
+        self.total_models += 1
+
+        try:
+
+            if (
+                self.masked_imaging.positions is not None
+                and self.masked_imaging.positions_threshold is not None
+            ):
+                self.run_stage(
+                    stage="positions",
+                    check=lambda: self.masked_imaging.check_positions_trace_within_threshold_via_tracer(
+                        tracer=tracer
+                    ),
+                )
+
+            if (
+                self.masked_imaging.inversion_pixel_limit is not None
+                and tracer.has_pixelization
+            ):
+                self.run_stage(
+                    stage="inversion_pixel_limit",
+                    check=lambda: self.masked_imaging.check_inversion_pixels_are_below_limit_via_tracer(
+                        tracer=tracer
+                    ),
+                )
+
+            if (
+                self.low_resolution_masked_imaging is not None
+                and not tracer.has_pixelization
+                and not tracer.has_hyper_galaxy
+            ):
+                self.run_stage(
+                    stage="low_resolution_likelihood",
+                    check=lambda: self.check_low_resolution_likelihood_via_tracer(
+                        tracer=tracer,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                    ),
+                )
+
+        finally:
+
+            if (
+                self.output_path is not None
+                and self.total_models % self.output_interval == 0
+            ):
+                self.output_counters()
+
+    def run_stage(self, stage, check):
+
+        self.total_evaluated[stage] += 1
+        check()
+        self.total_accepted[stage] += 1
+
+    def figure_of_merit_estimate_from_tracer(
+        self, tracer, hyper_image_sky=None, hyper_background_noise=None
+    ):
+        """An estimate of the figure of merit of a tracer's fit to the full resolution masked imaging, from its fit \
+        to the low resolution masked imaging (see *RejectionCascade*)."""
+
+        low_resolution_masked_imaging = self.low_resolution_masked_imaging
+
+        image = fit.hyper_image_from_image_and_hyper_image_sky(
+            image=low_resolution_masked_imaging.image, hyper_image_sky=hyper_image_sky
+        )
+
+        noise_map = fit.hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+            noise_map=low_resolution_masked_imaging.noise_map,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
+            grid=low_resolution_masked_imaging.grid,
+            convolver=low_resolution_masked_imaging.convolver,
+            blurring_grid=low_resolution_masked_imaging.blurring_grid,
+        )
+
+        chi_squared, _ = fit.chi_squared_and_noise_normalization_from_image_noise_map_and_model_image(
+            image=image, noise_map=noise_map, model_image=blurred_profile_image
+        )
+
+        noise_map = fit.hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+            noise_map=self.masked_imaging.noise_map,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        noise_normalization = np.sum(
+            np.log(2 * np.pi * np.square(np.asarray(noise_map)))
+        )
+
+        return -0.5 * (chi_squared + noise_normalization)
+
+    def check_low_resolution_likelihood_via_tracer(
+        self, tracer, hyper_image_sky=None, hyper_background_noise=None
+    ):
+
+        if (
+            self.figure_of_merit_estimate_from_tracer(
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+            < self.maximum_figure_of_merit - self.low_resolution_likelihood_margin
+        ):
+            raise exc.LikelihoodBoundException
+
+    def update_maximum_figure_of_merit(self, figure_of_merit):
+        self.maximum_figure_of_merit = max(
+            self.maximum_figure_of_merit, np.max(figure_of_merit)
+        )
+
+    def output_counters(self):
+
+        file_rejection_cascade_info = "{}/{}".format(
+            self.output_path, "rejection_cascade.info"
+        )
+
+        with open(file_rejection_cascade_info, "w") as rejection_cascade_info:
+            rejection_cascade_info.write("Models = {} \n".format(self.total_models))
+
+            for stage in self.stages:
+                rejection_cascade_info.write(
+                    "{} = {} accepted of {} \n".format(
+                        stage, self.total_accepted[stage], self.total_evaluated[stage]
+                    )
+                )
@@ -22,6 +22,7 @@ class Result(dataset.Result):
             tracer=self.most_likely_tracer,
             hyper_image_sky=hyper_image_sky,
             hyper_background_noise=hyper_background_noise,
+            record_galaxy_images=True,
         )
 
     @property
@@ -56,8 +57,10 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model images of those galaxies
         """
+        galaxy_model_image_dict = self.most_likely_fit.galaxy_model_image_dict
+
         return {
-            galaxy_path: self.image_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_image_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
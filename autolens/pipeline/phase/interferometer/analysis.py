@@ -8,9 +8,22 @@ from autolens.pipeline.phase.dataset import analysis as analysis_data
 
 
 class Analysis(analysis_data.Analysis):
-    def __init__(self, masked_interferometer, cosmology, image_path=None, results=None):
-
-        super(Analysis, self).__init__(cosmology=cosmology, results=results)
+    def __init__(
+        self,
+        masked_interferometer,
+        cosmology,
+        image_path=None,
+        results=None,
+        threads=1,
+        likelihood_cache=None,
+    ):
+
+        super(Analysis, self).__init__(
+            cosmology=cosmology,
+            results=results,
+            threads=threads,
+            likelihood_cache=likelihood_cache,
+        )
 
         self.visualizer = visualizer.PhaseInterferometerVisualizer(
             masked_dataset=masked_interferometer, image_path=image_path
@@ -30,7 +43,51 @@ class Analysis(analysis_data.Analysis):
     def masked_interferometer(self):
         return self.masked_dataset
 
-    def fit(self, instance):
+    def likelihood_cache_state(self):
+        """The masked interferometer visibilities, noise-map, uv-wavelengths, masks and settings which the figure \
+        of merit of an instance depends on, in addition to the hyper images and visibilities (see \
+        *Analysis.likelihood_cache_state*)."""
+
+        likelihood_cache_state = super(Analysis, self).likelihood_cache_state()
+
+        for name in (
+            "visibilities",
+            "noise_map",
+            "visibilities_mask",
+            "primary_beam",
+            "mask",
+            "positions",
+            "positions_threshold",
+            "pixel_scale_interpolation_grid",
+            "inversion_pixel_limit",
+            "inversion_uses_border",
+        ):
+            likelihood_cache_state.append(getattr(self.masked_dataset, name, None))
+
+        likelihood_cache_state.append(
+            getattr(
+                getattr(self.masked_dataset, "interferometer", None),
+                "uv_wavelengths",
+                None,
+            )
+        )
+        likelihood_cache_state.append(
+            getattr(self.masked_dataset.grid, "sub_size", None)
+        )
+
+        if hasattr(self, "hyper_galaxy_visibilities_path_dict"):
+
+            likelihood_cache_state.append(self.hyper_model_visibilities)
+
+            for galaxy_path in sorted(self.hyper_galaxy_visibilities_path_dict):
+                likelihood_cache_state.append(galaxy_path)
+                likelihood_cache_state.append(
+                    self.hyper_galaxy_visibilities_path_dict[galaxy_path]
+                )
+
+        return likelihood_cache_state
+
+    def figure_of_merit_from_instance(self, instance):
         """
         Determine the fit of a lens galaxy and source galaxy to the masked_interferometer in this lens.
 
@@ -115,6 +172,9 @@ class Analysis(analysis_data.Analysis):
         )
 
     def visualize(self, instance, during_analysis):
+
+        self.output_likelihood_cache(during_analysis=during_analysis)
+
         instance = self.associate_hyper_visibilities(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
         hyper_background_noise = self.hyper_background_noise_for_instance(
@@ -125,10 +185,9 @@ class Analysis(analysis_data.Analysis):
             tracer=tracer, hyper_background_noise=hyper_background_noise
         )
 
-        visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
-            preloaded_critical_curves=tracer.critical_curves,
-            preloaded_caustics=tracer.caustics,
-        )
+        # The critical curves and caustics of the tracer are computed once by the first plot which includes them and
+        # are shared via the critical curves cache, thus they are not preloaded into a copy of the visualizer.
+        visualizer = self.visualizer
 
         visualizer.visualize_ray_tracing(
             tracer=fit.tracer, during_analysis=during_analysis
@@ -15,6 +15,8 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
         inversion_pixel_limit=None,
         primary_beam_shape_2d=None,
         bin_up_factor=None,
+        uses_likelihood_cache=False,
+        threads=1,
     ):
         super().__init__(
             model=model,
@@ -24,6 +26,8 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            uses_likelihood_cache=uses_likelihood_cache,
+            threads=threads,
         )
         self.real_space_mask = real_space_mask
         self.primary_beam_shape_2d = primary_beam_shape_2d
@@ -34,6 +34,8 @@ class PhaseInterferometer(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        uses_likelihood_cache=False,
+        threads=1,
     ):
 
         """
@@ -47,6 +49,14 @@ class PhaseInterferometer(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        uses_likelihood_cache: bool
+            If *True*, the figures of merit of the phase's model instances are cached by their parameters and \
+            persisted to the phase output, such that identical instances (e.g. those re-evaluated when the phase \
+            is resumed) are not fitted again (see *LikelihoodCache*).
+        threads: int
+            If above 1, the independent calculations of every fit (the profile images of the planes and the profile \
+            classes of every plane) are evaluated concurrently on a thread pool of this many threads, which is \
+            shared by all phases using the same number of threads.
         """
 
         paths.phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -78,6 +88,8 @@ class PhaseInterferometer(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            uses_likelihood_cache=uses_likelihood_cache,
+            threads=threads,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -139,6 +151,10 @@ class PhaseInterferometer(dataset.PhaseDataset):
             cosmology=self.cosmology,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            threads=self.meta_interferometer_fit.threads,
+            likelihood_cache=self.meta_interferometer_fit.likelihood_cache_from_output_path(
+                output_path=self.optimizer.paths.phase_output_path
+            ),
         )
 
         return analysis
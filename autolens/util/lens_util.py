@@ -1,9 +1,19 @@
+from collections import OrderedDict
+
 from autoarray.structures import grids
+from autoastro.util import cosmology_util
 from autolens import exc
 from autolens.lens import plane as pl
 
 import numpy as np
 
+# The maximum number of scaling factors held by each of the scaling factors caches, after which the least recently
+# used are discarded (e.g. when a phase fits the redshift of a galaxy, every walker has different plane redshifts).
+scaling_factors_cache_size = 128
+
+scaling_factors_cache = OrderedDict()
+scaling_factors_to_redshift_cache = OrderedDict()
+
 
 def plane_image_of_galaxies_from_grid(shape, grid, galaxies, buffer=1.0e-2):
 
@@ -37,19 +47,183 @@ def ordered_plane_redshifts_from_galaxies(galaxies):
     galaxies : [Galaxy]
         The list of galaxies in the ray-tracing calculation.
     """
-    ordered_galaxies = sorted(
-        galaxies, key=lambda galaxy: galaxy.redshift, reverse=False
+    return sorted(set(galaxy.redshift for galaxy in galaxies))
+
+
+def scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+    plane_redshifts, cosmology
+):
+    """Given the redshifts of every plane in a multi-plane lens system, return the (total_planes, total_planes) \
+    matrix of scaling factors used to rescale deflection-angles between planes during multi-plane ray-tracing.
+
+    Entry [i, j] is the scaling factor of the deflection-angles of plane i when tracing to plane j, where the final \
+    redshift is that of the last plane. Entries where i >= j are not used by ray-tracing and are zero.
+
+    Computing each scaling factor requires astropy distance integrals, whereas plane redshifts do not change within \
+    a phase. The matrix is therefore cached on the plane redshifts and cosmology and shared by every tracer with \
+    identical values, so it is read-only. The *scaling_factors_cache_size* most recently used matrices are cached.
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes in ascending redshift order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+
+    key = (tuple(plane_redshifts), repr(cosmology))
+
+    if key in scaling_factors_cache:
+        scaling_factors_cache.move_to_end(key)
+        return scaling_factors_cache[key]
+
+    total_planes = len(plane_redshifts)
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factors[
+                previous_plane_index, plane_index
+            ] = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=plane_redshifts[previous_plane_index],
+                redshift_1=plane_redshifts[plane_index],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology,
+            )
+
+    scaling_factors.flags.writeable = False
+
+    scaling_factors_cache[key] = scaling_factors
+
+    while len(scaling_factors_cache) > scaling_factors_cache_size:
+        scaling_factors_cache.popitem(last=False)
+
+    return scaling_factors
+
+
+def scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+    plane_redshifts, redshift, cosmology
+):
+    """Given the redshifts of every plane in a multi-plane lens system, return the scaling factors of the \
+    deflection-angles of every plane when tracing to an input redshift, which need not be the redshift of a plane.
+
+    Entry [i] is the scaling factor of plane i, where the final redshift is that of the last plane. Entries of \
+    planes at or above the input redshift do not deflect light to it and are zero.
+
+    Like the scaling factors between planes (see *scaling_factors_of_planes_from_plane_redshifts_and_cosmology*), \
+    the factors are cached on the plane redshifts, input redshift and cosmology and are read-only.
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes in ascending redshift order.
+    redshift : float
+        The redshift the deflection-angles are scaled to.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+
+    key = (tuple(plane_redshifts), redshift, repr(cosmology))
+
+    if key in scaling_factors_to_redshift_cache:
+        scaling_factors_to_redshift_cache.move_to_end(key)
+        return scaling_factors_to_redshift_cache[key]
+
+    scaling_factors = np.array(
+        [
+            cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=plane_redshift,
+                redshift_1=redshift,
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology,
+            )
+            if plane_redshift < redshift
+            else 0.0
+            for plane_redshift in plane_redshifts
+        ]
+    )
+
+    scaling_factors.flags.writeable = False
+
+    scaling_factors_to_redshift_cache[key] = scaling_factors
+
+    while len(scaling_factors_to_redshift_cache) > scaling_factors_cache_size:
+        scaling_factors_to_redshift_cache.popitem(last=False)
+
+    return scaling_factors
+
+
+def profiles_key_from_profiles(profiles):
+    """Given a list of light or mass profiles, return a hashable key of the class and parameters of every profile, \
+    such that two lists of profiles with equal keys compute identical quantities.
+
+    The *cache* attribute of a profile, which memoizes profile calculations, is not a parameter and is omitted.
+
+    Parameters
+    -----------
+    profiles : [LightProfile] or [MassProfile]
+        The profiles whose key is returned.
+    """
+    return tuple(
+        (
+            profile.__class__.__name__,
+            tuple(
+                (name, repr(value))
+                for name, value in sorted(vars(profile).items())
+                if name != "cache"
+            ),
+        )
+        for profile in profiles
+    )
+
+
+def mass_profiles_key_from_planes(planes):
+    """Given the planes of a lens system, return a hashable key of the redshift of every plane and the class and \
+    parameters of every mass profile in every plane.
+
+    Two lens systems with equal keys deflect light identically, such that an image-plane grid traces to the same \
+    grids in both. The key therefore allows traced grids to be reused across tracers whose mass profiles are \
+    unchanged (e.g. when only the source or regularization parameters of a model vary).
+
+    Parameters
+    -----------
+    planes : [Plane]
+        The planes of the lens system, in ascending redshift order, where a plane whose galaxies are *None* has no \
+        mass profiles.
+    """
+    return tuple(
+        (
+            plane.redshift,
+            profiles_key_from_profiles(
+                profiles=[
+                    mass_profile
+                    for galaxy in plane.galaxies or []
+                    for mass_profile in galaxy.mass_profiles
+                ]
+            ),
+        )
+        for plane in planes
     )
 
-    # Ideally we'd extract the planes_red_Shfit order from the list above. However, I dont know how to extract it
-    # Using a list of class attributes so make a list of redshifts for now.
 
-    galaxy_redshifts = list(map(lambda galaxy: galaxy.redshift, ordered_galaxies))
-    return [
-        redshift
-        for i, redshift in enumerate(galaxy_redshifts)
-        if redshift not in galaxy_redshifts[:i]
-    ]
+def fused_grid_from_grid_and_blurring_grid(grid, blurring_grid):
+    """Concatenate a (sub-)grid and its blurring grid into a single irregular grid of (y,x) coordinates, whose \
+    first *grid.sub_shape_1d* coordinates are the grid and remaining coordinates the blurring grid.
+
+    This allows the grid and blurring grid to be ray-traced and have their light profiles evaluated in one pass, \
+    with the values split back into the grid and blurring grid only when they are convolved with the PSF.
+
+    Parameters
+    -----------
+    grid : aa.Grid
+        The (sub-)grid of (y,x) arc-second coordinates that is fused first.
+    blurring_grid : aa.Grid
+        The blurring grid of (y,x) arc-second coordinates that is fused second.
+    """
+    return grids.GridIrregular(
+        grid=np.concatenate((np.asarray(grid), np.asarray(blurring_grid)), axis=0)
+    )
 
 
 def ordered_plane_redshifts_from_lens_source_plane_redshifts_and_slice_sizes(
@@ -123,9 +297,11 @@ def galaxies_in_redshift_ordered_planes_from_galaxies(galaxies, plane_redshifts)
 
     galaxies_in_redshift_ordered_planes = [[] for i in range(len(plane_redshifts))]
 
+    plane_redshifts = np.asarray(plane_redshifts)
+
     for galaxy in galaxies:
 
-        index = (np.abs(np.asarray(plane_redshifts) - galaxy.redshift)).argmin()
+        index = (np.abs(plane_redshifts - galaxy.redshift)).argmin()
 
         galaxies_in_redshift_ordered_planes[index].append(galaxy)
 
@@ -0,0 +1,122 @@
+import time
+
+import numpy as np
+
+import autolens as al
+from autolens.lens import compiled_plane as cp
+
+# This profiling script compares the deflection angles of a plane of line-of-sight halos computed using a Barnes-Hut
+# tree (see compiled_plane.DeflectionsTree) to the exact sum over every halo, reporting the maximum error and the
+# speedup of the tree for a range of opening angles.
+#
+# The first call builds the tree, and is timed with its evaluation. Later calls, as in a model-fit where the halo
+# positions are fixed and only their parameters change, reuse the cached tree and only update its monopoles.
+
+total_halos = 5000
+halo_field_of_view = 30.0
+repeats = 3
+
+opening_angles = [0.2, 0.3, 0.5, 0.7, 1.0]
+
+mask = al.mask.circular(shape_2d=(200, 200), pixel_scales=0.05, sub_size=2, radius=3.0)
+
+grid = al.masked.grid.from_mask(mask=mask)
+
+random = np.random.RandomState(seed=1)
+
+line_of_sight_galaxies = [
+    al.Galaxy(
+        redshift=0.5,
+        mass=al.mp.SphericalNFW(
+            centre=tuple(random.uniform(-halo_field_of_view, halo_field_of_view, 2)),
+            kappa_s=random.uniform(0.005, 0.05),
+            scale_radius=random.uniform(0.5, 2.0),
+        ),
+    )
+    for _ in range(total_halos)
+]
+
+
+def line_of_sight_galaxies_from_kappa_s_factor(kappa_s_factor):
+
+    return [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.SphericalNFW(
+                centre=galaxy.mass.centre,
+                kappa_s=kappa_s_factor * galaxy.mass.kappa_s,
+                scale_radius=galaxy.mass.scale_radius,
+            ),
+        )
+        for galaxy in line_of_sight_galaxies
+    ]
+
+
+def deflections_from_galaxies_and_opening_angle(galaxies, opening_angle):
+
+    compiled_plane = al.Plane(galaxies=galaxies, redshift=0.5).compiled_plane
+
+    compiled_plane.opening_angle = opening_angle
+
+    return compiled_plane.deflections_from_grid(grid=grid)
+
+
+def deflections_and_time_from_opening_angle(opening_angle):
+
+    cp.deflections_trees_cache.clear()
+
+    # The first call compiles the profiles, builds the tree and evaluates it.
+    start = time.time()
+    deflections_from_galaxies_and_opening_angle(
+        galaxies=line_of_sight_galaxies, opening_angle=opening_angle
+    )
+    build_and_evaluation_time = time.time() - start
+
+    # Later calls use new planes of halos at the same positions with different parameters, ending with the
+    # original parameters whose deflection angles are returned.
+    galaxies_of_repeats = [
+        line_of_sight_galaxies_from_kappa_s_factor(kappa_s_factor=1.0 + 0.01 * repeat)
+        for repeat in range(1, repeats)
+    ] + [line_of_sight_galaxies]
+
+    start = time.time()
+    for galaxies in galaxies_of_repeats:
+        deflections = deflections_from_galaxies_and_opening_angle(
+            galaxies=galaxies, opening_angle=opening_angle
+        )
+    reused_time = (time.time() - start) / len(galaxies_of_repeats)
+
+    return deflections, build_and_evaluation_time, reused_time
+
+
+print("Deflections of {} halos on {} sub-pixels".format(total_halos, grid.shape[0]))
+
+exact_deflections, _, exact_time = deflections_and_time_from_opening_angle(
+    opening_angle=None
+)
+
+exact_magnitudes = np.hypot(exact_deflections[:, 0], exact_deflections[:, 1])
+
+print("Exact sum: {:.4f}s".format(exact_time))
+
+for opening_angle in opening_angles:
+
+    deflections, build_and_evaluation_time, reused_time = deflections_and_time_from_opening_angle(
+        opening_angle=opening_angle
+    )
+
+    errors = np.hypot(*(deflections - exact_deflections).T)
+
+    print(
+        "Opening angle {:.1f}: build + evaluation {:.4f}s (speedup = {:.1f}x), "
+        "reused tree {:.4f}s (speedup = {:.1f}x), max error = {:.2e}, "
+        "max relative error = {:.2e}".format(
+            opening_angle,
+            build_and_evaluation_time,
+            exact_time / build_and_evaluation_time,
+            reused_time,
+            exact_time / reused_time,
+            np.max(errors),
+            np.max(errors) / np.max(exact_magnitudes),
+        )
+    )
@@ -1,7 +1,12 @@
 from autoarray.operators.inversion import inversions
 from autoarray.operators import transformer as trans
 import autolens as al
-from autolens.fit.fit import ImagingFit, InterferometerFit
+from autolens.fit.fit import (
+    ImagingFit,
+    InterferometerFit,
+    figure_of_merit_from_masked_imaging_and_tracer,
+    squared_maximum_separations_from_position_sets,
+)
 import numpy as np
 import pytest
 
@@ -708,6 +713,62 @@ class TestImagingFit:
                 1.0e-4,
             )
 
+        def test___record_galaxy_images__galaxy_and_plane_images_match_fit_without_recording(
+            self, masked_imaging_7x7
+        ):
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+            g2 = al.Galaxy(redshift=1.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            fit_recorded = ImagingFit(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                record_galaxy_images=True,
+            )
+
+            assert fit_recorded.model_image.in_2d == pytest.approx(
+                fit.model_image.in_2d, 1.0e-4
+            )
+            assert fit_recorded.likelihood == pytest.approx(fit.likelihood, 1.0e-4)
+
+            for galaxy in [g0, g1, g2]:
+                assert fit_recorded.galaxy_model_image_dict[
+                    galaxy
+                ].in_2d == pytest.approx(
+                    fit.galaxy_model_image_dict[galaxy].in_2d, 1.0e-4
+                )
+
+            for plane_index in range(2):
+                assert fit_recorded.model_images_of_planes[
+                    plane_index
+                ].in_2d == pytest.approx(
+                    fit.model_images_of_planes[plane_index].in_2d, 1.0e-4
+                )
+
+            profile_images_of_planes = tracer.profile_images_of_planes_from_grid(
+                grid=masked_imaging_7x7.grid
+            )
+
+            assert fit_recorded.profile_images_of_planes[1] == pytest.approx(
+                profile_images_of_planes[1], 1.0e-4
+            )
+            assert fit_recorded.profile_images_of_planes_and_galaxies[1][
+                0
+            ] == pytest.approx(profile_images_of_planes[1], 1.0e-4)
+            assert (
+                fit_recorded.profile_images_of_planes_and_galaxies[1][1] == 0.0
+            ).all()
+
         def test___all_lens_fit_quantities__including_hyper_methods(
             self, masked_imaging_7x7
         ):
@@ -1490,6 +1551,135 @@ class TestImagingFit:
                 fit.model_images_of_planes[1].in_2d, 1.0e-4
             )
 
+        def test___record_galaxy_images__model_images_of_planes_include_inversion_without_modifying_records(
+            self, masked_imaging_7x7
+        ):
+            g0 = al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+            galaxy_pix = al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=1.0),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, galaxy_pix])
+
+            fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            fit_recorded = ImagingFit(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                record_galaxy_images=True,
+            )
+
+            assert fit_recorded.evidence == pytest.approx(fit.evidence, 1.0e-4)
+
+            for _ in range(2):
+                assert fit_recorded.model_images_of_planes[1].in_2d == pytest.approx(
+                    fit.model_images_of_planes[1].in_2d, 1.0e-4
+                )
+
+            assert (fit_recorded.blurred_profile_images_of_planes[1] == 0.0).all()
+            assert fit_recorded.galaxy_model_image_dict[
+                galaxy_pix
+            ].in_2d == pytest.approx(
+                fit.inversion.mapped_reconstructed_image.in_2d, 1.0e-4
+            )
+
+        def test___inversion_fitted_twice_with_border__memoized_traced_grids_unchanged(
+            self, masked_imaging_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+
+            pix = al.pix.Rectangular(shape=(3, 3))
+            reg = al.reg.Constant(coefficient=1.0)
+            galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, galaxy_pix])
+
+            fit_0 = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+            fit_1 = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert fit_1.evidence == fit_0.evidence
+            assert (
+                fit_1.inversion.reconstruction == fit_0.inversion.reconstruction
+            ).all()
+
+            traced_grids = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=masked_imaging_7x7.grid
+            )
+
+            fresh_traced_grids = al.Tracer.from_galaxies(
+                galaxies=[g0, galaxy_pix]
+            ).traced_grids_of_planes_from_grid(grid=masked_imaging_7x7.grid)
+
+            assert (traced_grids[1] == fresh_traced_grids[1]).all()
+            assert not traced_grids[1].flags.writeable
+
+
+class TestFigureOfMeritFromMaskedImagingAndTracer:
+    def test__profiles_and_hyper_noise__same_as_imaging_fit(self, masked_imaging_7x7):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=np.ones(9),
+            hyper_galaxy_image=np.ones(9),
+            hyper_minimum_value=0.0,
+        )
+        g1 = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        fit = ImagingFit(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert figure_of_merit_from_masked_imaging_and_tracer(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        ) == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+    def test__profiles_and_inversion__same_as_imaging_fit_evidence(
+        self, masked_imaging_7x7
+    ):
+
+        g0 = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+        galaxy_pix = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, galaxy_pix])
+
+        fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert figure_of_merit_from_masked_imaging_and_tracer(
+            masked_imaging=masked_imaging_7x7, tracer=tracer
+        ) == pytest.approx(fit.evidence, 1.0e-8)
+
 
 class TestInterferometerFit:
     class TestFitProperties:
@@ -2536,6 +2726,32 @@ class TestPositionsFit:
         assert fit.maximum_separations[1] == np.sqrt(18)
         assert fit.maximum_separations[2] == np.sqrt(18)
 
+    def test__sets_of_different_lengths__separations_computed_in_one_batch(self):
+
+        squared_maximum_separations = squared_maximum_separations_from_position_sets(
+            position_sets=[
+                np.array([[0.0, 0.0], [0.0, 1.0]]),
+                np.array([[0.0, 0.0], [1.0, 1.0], [3.0, 3.0], [-1.0, 0.0]]),
+                np.array([[5.0, 5.0]]),
+            ]
+        )
+
+        assert squared_maximum_separations == pytest.approx([1.0, 25.0, 0.0], 1e-8)
+
+        positions = al.coordinates(
+            [
+                [(0.0, 0.0), (0.0, 1.0)],
+                [(0.0, 0.0), (1.0, 1.0), (3.0, 3.0), (-1.0, 0.0)],
+            ]
+        )
+        tracer = MockTracerPositions(positions=positions)
+
+        fit = al.fit_positions(positions=positions, tracer=tracer, noise_map=1.0)
+
+        assert fit.maximum_separations == pytest.approx([1.0, 5.0], 1e-8)
+        assert fit.maximum_separation_within_threshold(threshold=5.0)
+        assert not fit.maximum_separation_within_threshold(threshold=4.9)
+
     def test__likelihood__is_sum_of_separations_divided_by_noise(self):
         positions = al.coordinates(
             [
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import adaptive_sub_grid as asg
+
+
+def tracer_from_einstein_radius(einstein_radius):
+
+    return al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.SphericalSersic(
+                    centre=(0.05, 0.02),
+                    intensity=1.0,
+                    effective_radius=0.1,
+                    sersic_index=1.0,
+                ),
+            ),
+        ]
+    )
+
+
+@pytest.fixture(name="mask_adaptive")
+def make_mask_adaptive():
+    return al.mask.circular(shape_2d=(30, 30), pixel_scales=0.1, sub_size=1, radius=1.4)
+
+
+class TestAdaptiveSubGrid:
+    def test__converged_image_matches_high_uniform_sub_size_with_fewer_sub_pixels(
+        self, mask_adaptive
+    ):
+
+        tracer = tracer_from_einstein_radius(einstein_radius=1.0)
+
+        adaptive_sub_grid = asg.AdaptiveSubGrid(
+            grid=al.masked.grid.from_mask(mask=mask_adaptive), tolerance=1.0e-3
+        )
+
+        profile_image = tracer.profile_image_from_adaptive_sub_grid(
+            adaptive_sub_grid=adaptive_sub_grid
+        )
+
+        uniform_mask = al.mask.circular(
+            shape_2d=(30, 30), pixel_scales=0.1, sub_size=16, radius=1.4
+        )
+
+        uniform_profile_image = tracer.profile_image_from_grid(
+            grid=al.masked.grid.from_mask(mask=uniform_mask)
+        )
+
+        assert profile_image.in_1d == pytest.approx(
+            uniform_profile_image.in_1d_binned,
+            abs=adaptive_sub_grid.tolerance * np.max(profile_image),
+        )
+
+        assert adaptive_sub_grid.total_sub_pixels < uniform_mask.sub_pixels_in_mask
+        assert np.max(adaptive_sub_grid.layout) > np.min(adaptive_sub_grid.layout)
+
+    def test__layout_reused_only_if_mass_model_barely_changes(self, mask_adaptive):
+
+        adaptive_sub_grid = asg.AdaptiveSubGrid(
+            grid=al.masked.grid.from_mask(mask=mask_adaptive), tolerance=1.0e-3
+        )
+
+        adaptive_sub_grid.profile_image_from_tracer(
+            tracer=tracer_from_einstein_radius(einstein_radius=1.0)
+        )
+
+        assert adaptive_sub_grid.layout_reused is False
+
+        layout = adaptive_sub_grid.layout
+
+        adaptive_sub_grid.profile_image_from_tracer(
+            tracer=tracer_from_einstein_radius(einstein_radius=1.001)
+        )
+
+        assert adaptive_sub_grid.layout_reused is True
+        assert adaptive_sub_grid.layout is layout
+        assert adaptive_sub_grid.total_sub_pixels == np.sum(layout ** 2)
+
+        adaptive_sub_grid.profile_image_from_tracer(
+            tracer=tracer_from_einstein_radius(einstein_radius=1.1)
+        )
+
+        assert adaptive_sub_grid.layout_reused is False
+
+    def test__magnification_mode__pixels_near_critical_curve_have_larger_sub_size(
+        self, mask_adaptive
+    ):
+
+        adaptive_sub_grid = asg.AdaptiveSubGrid(
+            grid=al.masked.grid.from_mask(mask=mask_adaptive),
+            magnification_sub_size_factor=1.0,
+        )
+
+        adaptive_sub_grid.profile_image_from_tracer(
+            tracer=tracer_from_einstein_radius(einstein_radius=1.0)
+        )
+
+        radii = np.hypot(*adaptive_sub_grid.pixel_centres.T)
+
+        near_critical_curve = np.abs(radii - 1.0) < 0.03
+        far_from_critical_curve = radii > 1.3
+
+        assert np.min(adaptive_sub_grid.layout[near_critical_curve]) > np.max(
+            adaptive_sub_grid.layout[far_from_critical_curve]
+        )
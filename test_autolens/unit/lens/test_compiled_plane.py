@@ -0,0 +1,629 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens import exc
+from autolens.lens import compiled_plane
+from autolens.lens import executor as ex
+
+
+class TestCompiledProfiles:
+    def test__parameters_of_profiles_packed_into_arrays(self):
+
+        compiled_profiles = compiled_plane.CompiledProfiles(
+            profiles=[
+                al.mp.SphericalIsothermal(centre=(1.0, 2.0), einstein_radius=1.0),
+                al.mp.SphericalIsothermal(centre=(3.0, 4.0), einstein_radius=2.0),
+            ],
+            parameter_names=("einstein_radius",),
+        )
+
+        assert compiled_profiles.profile_class is al.mp.SphericalIsothermal
+        assert compiled_profiles.total_profiles == 2
+        assert (compiled_profiles.centres == np.array([[1.0, 2.0], [3.0, 4.0]])).all()
+        assert (compiled_profiles.parameters == np.array([[1.0], [2.0]])).all()
+        assert compiled_profiles.radial_minimum == 1.0e-8
+
+
+class TestCompiledPlane:
+    def test__profile_image__same_as_summed_galaxy_images(self, sub_grid_7x7):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light_0=al.lp.EllipticalSersic(
+                    centre=(0.1, 0.2), axis_ratio=0.7, phi=30.0, intensity=1.0
+                ),
+                light_1=al.lp.SphericalExponential(centre=(-0.1, 0.0), intensity=2.0),
+            ),
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(
+                    axis_ratio=0.5, phi=100.0, intensity=3.0, sersic_index=2.0
+                ),
+                gaussian=al.lp.EllipticalGaussian(intensity=1.0, sigma=0.5),
+            ),
+        ]
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies)
+
+        profile_image = compiled.profile_image_from_grid(grid=sub_grid_7x7)
+
+        assert profile_image == pytest.approx(
+            sum(
+                galaxy.profile_image_from_grid(grid=sub_grid_7x7) for galaxy in galaxies
+            ),
+            1.0e-8,
+        )
+
+    def test__convergence_and_deflections__same_as_summed_galaxy_quantities(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass_0=al.mp.SphericalIsothermal(
+                    centre=(0.1, 0.2), einstein_radius=1.0
+                ),
+                mass_1=al.mp.EllipticalIsothermal(
+                    centre=(-0.1, 0.0), axis_ratio=0.6, phi=45.0, einstein_radius=1.5
+                ),
+            ),
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalNFW(
+                    centre=(0.3, -0.2), kappa_s=0.1, scale_radius=2.0
+                ),
+                shear=al.mp.ExternalShear(magnitude=0.05, phi=20.0),
+            ),
+        ]
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies)
+
+        convergence = compiled.convergence_from_grid(grid=sub_grid_7x7)
+
+        assert convergence == pytest.approx(
+            sum(galaxy.convergence_from_grid(grid=sub_grid_7x7) for galaxy in galaxies),
+            1.0e-8,
+        )
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert deflections == pytest.approx(
+            np.asarray(
+                sum(
+                    galaxy.deflections_from_grid(grid=sub_grid_7x7)
+                    for galaxy in galaxies
+                )
+            ),
+            1.0e-8,
+        )
+
+    def test__output_array_input__quantities_accumulated_into_it(self, sub_grid_7x7):
+
+        galaxy = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+
+        compiled = compiled_plane.CompiledPlane(galaxies=[galaxy])
+
+        out = np.ones((sub_grid_7x7.shape[0], 2))
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7, out=out)
+
+        assert deflections is out
+        assert deflections == pytest.approx(
+            np.asarray(galaxy.deflections_from_grid(grid=sub_grid_7x7)) + 1.0, 1.0e-8
+        )
+
+    def test__plane_uses_compiled_plane_of_its_galaxies(self, sub_grid_7x7):
+
+        galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=1.0),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+
+        plane = al.Plane(galaxies=[galaxy], redshift=0.5)
+
+        assert plane.compiled_plane is plane.compiled_plane
+        assert plane.compiled_plane.light_profiles == [galaxy.light]
+        assert plane.compiled_plane.mass_profiles == [galaxy.mass]
+
+        assert plane.profile_image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            galaxy.profile_image_from_grid(grid=sub_grid_7x7), 1.0e-8
+        )
+        assert plane.deflections_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            galaxy.deflections_from_grid(grid=sub_grid_7x7), 1.0e-8
+        )
+
+    def test__few_profiles_of_a_class__evaluated_by_profiles_and_identical_to_galaxies(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.1 * index, 0.0), einstein_radius=1.0
+                ),
+            )
+            for index in range(2)
+        ]
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies)
+
+        assert (
+            compiled.deflections_from_grid(grid=sub_grid_7x7)
+            == sum(
+                galaxy.deflections_from_grid(grid=sub_grid_7x7) for galaxy in galaxies
+            )
+        ).all()
+
+    def test__profiles_changed_in_place__changed_parameters_used(self, sub_grid_7x7):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(centre=(0.1 * index, 0.0), intensity=1.0),
+            )
+            for index in range(5)
+        ]
+
+        plane = al.Plane(galaxies=galaxies, redshift=0.5)
+
+        compiled = plane.compiled_plane
+
+        plane.profile_image_from_grid(grid=sub_grid_7x7)
+
+        galaxies[0].light.intensity = 2.0
+
+        assert plane.compiled_plane is compiled
+        assert plane.profile_image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            sum(
+                galaxy.profile_image_from_grid(grid=sub_grid_7x7) for galaxy in galaxies
+            ),
+            1.0e-8,
+        )
+
+    def test__profile_quantity_without_value_per_coordinate__plane_sums_galaxies(
+        self, sub_grid_7x7
+    ):
+        class FixedLightProfile(al.lp.LightProfile):
+            def profile_image_from_grid(self, grid):
+                return np.array([1.0, 2.0])
+
+        galaxy = al.Galaxy(redshift=0.5, light=FixedLightProfile())
+
+        with pytest.raises(exc.CompiledPlaneException):
+            compiled_plane.CompiledPlane(galaxies=[galaxy]).profile_image_from_grid(
+                grid=sub_grid_7x7
+            )
+
+        plane = al.Plane(galaxies=[galaxy], redshift=0.5)
+
+        assert (
+            plane.sub_array_accumulated_from_grid(
+                grid=sub_grid_7x7,
+                compiled_plane_func=compiled_plane.CompiledPlane.profile_image_from_grid,
+            )
+            == np.array([1.0, 2.0])
+        ).all()
+
+
+class TestKernels:
+    def quantity_of_profiles_and_compiled_plane(
+        self, profiles, func_name, grid, memory_budget=None
+    ):
+
+        compiled = compiled_plane.CompiledPlane(
+            galaxies=[al.Galaxy(redshift=0.5, profile=profile) for profile in profiles],
+            memory_budget=memory_budget,
+        )
+
+        return (
+            np.asarray(
+                sum(getattr(profile, func_name)(grid=grid) for profile in profiles)
+            ),
+            getattr(compiled, func_name)(grid=grid),
+        )
+
+    def test__sersic_and_gaussian_profile_image_kernels__same_as_profiles(
+        self, sub_grid_7x7
+    ):
+
+        for profile_class, kwargs in (
+            (al.lp.EllipticalSersic, dict(axis_ratio=0.6, sersic_index=2.5)),
+            (al.lp.SphericalSersic, dict(sersic_index=1.5)),
+            (al.lp.EllipticalExponential, dict(axis_ratio=0.8)),
+            (al.lp.SphericalExponential, dict()),
+            (al.lp.EllipticalDevVaucouleurs, dict(axis_ratio=0.7)),
+            (al.lp.SphericalDevVaucouleurs, dict()),
+            (al.lp.EllipticalGaussian, dict(axis_ratio=0.5, sigma=0.7)),
+            (al.lp.SphericalGaussian, dict(sigma=0.3)),
+        ):
+
+            profiles = [
+                profile_class(
+                    centre=(0.2 * index - 0.4, 0.1 * index),
+                    intensity=0.5 * index + 0.5,
+                    **kwargs,
+                    **(dict(phi=25.0 * index) if "axis_ratio" in kwargs else dict()),
+                )
+                for index in range(6)
+            ]
+
+            profile_image, compiled_profile_image = self.quantity_of_profiles_and_compiled_plane(
+                profiles=profiles,
+                func_name="profile_image_from_grid",
+                grid=sub_grid_7x7,
+                memory_budget=1,
+            )
+
+            assert compiled_profile_image == pytest.approx(profile_image, 1.0e-8)
+
+    def test__power_law_convergence_kernels__same_as_profiles(self, sub_grid_7x7):
+
+        for profile_class, kwargs in (
+            (
+                al.mp.EllipticalCoredPowerLaw,
+                dict(axis_ratio=0.7, slope=2.3, core_radius=0.2),
+            ),
+            (al.mp.SphericalCoredPowerLaw, dict(slope=1.7, core_radius=0.1)),
+            (al.mp.EllipticalCoredIsothermal, dict(axis_ratio=0.6, core_radius=0.3)),
+            (al.mp.SphericalCoredIsothermal, dict(core_radius=0.05)),
+            (al.mp.EllipticalPowerLaw, dict(axis_ratio=0.8, slope=2.2)),
+            (al.mp.SphericalPowerLaw, dict(slope=1.9)),
+            (al.mp.EllipticalIsothermal, dict(axis_ratio=0.5)),
+            (al.mp.SphericalIsothermal, dict()),
+        ):
+
+            profiles = [
+                profile_class(
+                    centre=(0.2 * index - 0.3, 0.15 * index + 0.05),
+                    einstein_radius=0.2 * index + 0.5,
+                    **kwargs,
+                    **(dict(phi=30.0 * index) if "axis_ratio" in kwargs else dict()),
+                )
+                for index in range(5)
+            ]
+
+            convergence, compiled_convergence = self.quantity_of_profiles_and_compiled_plane(
+                profiles=profiles, func_name="convergence_from_grid", grid=sub_grid_7x7
+            )
+
+            assert compiled_convergence == pytest.approx(convergence, 1.0e-8)
+
+    def test__isothermal_potential_and_deflections_kernels__same_as_profiles(
+        self, sub_grid_7x7
+    ):
+
+        profiles = [
+            al.mp.SphericalIsothermal(
+                centre=(0.2 * index - 0.3, 0.1 * index),
+                einstein_radius=0.3 * index + 0.5,
+            )
+            for index in range(5)
+        ]
+
+        potential, compiled_potential = self.quantity_of_profiles_and_compiled_plane(
+            profiles=profiles, func_name="potential_from_grid", grid=sub_grid_7x7
+        )
+
+        assert compiled_potential == pytest.approx(potential, 1.0e-8)
+
+        profiles = [
+            al.mp.EllipticalIsothermal(
+                centre=(0.2 * index - 0.3, 0.1 * index),
+                axis_ratio=0.9 - 0.1 * index,
+                phi=40.0 * index,
+                einstein_radius=0.3 * index + 0.5,
+            )
+            for index in range(5)
+        ]
+
+        deflections, compiled_deflections = self.quantity_of_profiles_and_compiled_plane(
+            profiles=profiles,
+            func_name="deflections_from_grid",
+            grid=sub_grid_7x7,
+            memory_budget=1,
+        )
+
+        assert compiled_deflections == pytest.approx(deflections, 1.0e-8)
+
+    def test__coordinate_at_profile_centre__moved_to_radial_minimum_as_by_profiles(
+        self
+    ):
+
+        grid = al.grid.manual_2d([[[0.0, 0.0], [0.5, 0.5]]], pixel_scales=(1.0, 1.0))
+
+        profiles = [
+            al.mp.EllipticalIsothermal(axis_ratio=0.8, phi=20.0 * index)
+            for index in range(5)
+        ]
+
+        for func_name in ("convergence_from_grid", "deflections_from_grid"):
+
+            quantity, compiled_quantity = self.quantity_of_profiles_and_compiled_plane(
+                profiles=profiles, func_name=func_name, grid=grid
+            )
+
+            assert np.isfinite(compiled_quantity).all()
+            assert compiled_quantity == pytest.approx(quantity, 1.0e-8)
+
+
+class TestBroadcastDeflections:
+    def test__many_spherical_profiles__chunked_broadcast_same_as_summed_galaxy_deflections(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.2 * index - 1.0, 1.0 - 0.1 * index),
+                    einstein_radius=0.1 * index + 0.1,
+                ),
+            )
+            for index in range(10)
+        ] + [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalNFW(
+                    centre=(0.1 * index, -0.3 * index),
+                    kappa_s=0.05,
+                    scale_radius=0.5 * index + 1.0,
+                ),
+            )
+            for index in range(10)
+        ]
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies, memory_budget=1)
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert deflections == pytest.approx(
+            np.asarray(
+                sum(
+                    galaxy.deflections_from_grid(grid=sub_grid_7x7)
+                    for galaxy in galaxies
+                )
+            ),
+            1.0e-8,
+        )
+        assert compiled.deflections_cutoff_error == 0.0
+
+    def test__cutoff_radius__distant_profiles_approximated_and_error_reported(
+        self, sub_grid_7x7
+    ):
+
+        near_galaxy = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+        far_galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(30.0, 10.0 * index), einstein_radius=0.5
+                ),
+            )
+            for index in range(5)
+        ]
+
+        galaxies = [near_galaxy] + far_galaxies
+
+        exact_deflections = np.asarray(
+            sum(galaxy.deflections_from_grid(grid=sub_grid_7x7) for galaxy in galaxies)
+        )
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies, cutoff_radius=10.0)
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+        errors = np.hypot(*(deflections - exact_deflections).T)
+
+        assert 0.0 < compiled.deflections_cutoff_error < 5.0e-2
+        assert np.max(errors) <= 2.0 * compiled.deflections_cutoff_error
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies, cutoff_radius=50.0)
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert deflections == pytest.approx(exact_deflections, 1.0e-8)
+        assert compiled.deflections_cutoff_error == 0.0
+
+
+class TestDeflectionsTree:
+    def test__opening_angle_0__every_node_opened_and_deflections_exact(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalNFW(
+                    centre=(0.7 * index - 10.0, 10.0 - 0.4 * index),
+                    kappa_s=0.05,
+                    scale_radius=0.1 * index + 1.0,
+                ),
+            )
+            for index in range(40)
+        ]
+
+        compiled = compiled_plane.CompiledPlane(galaxies=galaxies, opening_angle=0.0)
+
+        deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert deflections == pytest.approx(
+            np.asarray(
+                sum(
+                    galaxy.deflections_from_grid(grid=sub_grid_7x7)
+                    for galaxy in galaxies
+                )
+            ),
+            1.0e-8,
+        )
+
+    def test__opening_angle__distant_halos_approximated_with_error_decreasing_with_angle(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(20.0 * np.sin(1.3 * index), 20.0 * np.cos(0.7 * index)),
+                    einstein_radius=0.01 * (index % 5) + 0.01,
+                ),
+            )
+            for index in range(100)
+        ]
+
+        exact_deflections = np.asarray(
+            sum(galaxy.deflections_from_grid(grid=sub_grid_7x7) for galaxy in galaxies)
+        )
+
+        errors = []
+
+        for opening_angle in (0.1, 0.5):
+
+            compiled = compiled_plane.CompiledPlane(
+                galaxies=galaxies, opening_angle=opening_angle
+            )
+
+            deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+            errors.append(np.max(np.hypot(*(deflections - exact_deflections).T)))
+
+        assert (
+            0.0 < errors[0] < errors[1] < 0.05 * np.max(np.hypot(*exact_deflections.T))
+        )
+
+    def test__same_halo_centres__tree_reused_across_planes_and_updated_with_parameters(
+        self, sub_grid_7x7
+    ):
+        def galaxies_from_kappa_s_cycle(kappa_s_cycle, offset=0.0):
+            return [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalNFW(
+                        centre=(
+                            10.0 * np.sin(1.3 * index) + offset,
+                            10.0 * np.cos(0.7 * index),
+                        ),
+                        kappa_s=0.01 * (index % kappa_s_cycle + 1),
+                    ),
+                )
+                for index in range(30)
+            ]
+
+        def tree_and_deflections_from_galaxies(galaxies):
+
+            compiled = compiled_plane.CompiledPlane(
+                galaxies=galaxies, opening_angle=0.5
+            )
+
+            deflections = compiled.deflections_from_grid(grid=sub_grid_7x7)
+
+            compiled_profiles = compiled.compiled_and_other_profiles_from_profiles_and_kernels(
+                profiles=compiled.mass_profiles,
+                kernels=compiled_plane.broadcast_deflections_kernels,
+            )[
+                0
+            ][
+                0
+            ][
+                1
+            ]
+
+            return (
+                compiled_plane.deflections_tree_from_compiled_profiles_and_opening_angle(
+                    compiled_profiles=compiled_profiles,
+                    radial_deflections_func=None,
+                    opening_angle=0.5,
+                ),
+                deflections,
+            )
+
+        compiled_plane.deflections_trees_cache.clear()
+
+        tree, _ = tree_and_deflections_from_galaxies(
+            galaxies=galaxies_from_kappa_s_cycle(kappa_s_cycle=3)
+        )
+
+        tree_reused, deflections = tree_and_deflections_from_galaxies(
+            galaxies=galaxies_from_kappa_s_cycle(kappa_s_cycle=4)
+        )
+
+        assert tree_reused is tree
+        assert len(compiled_plane.deflections_trees_cache) == 1
+
+        compiled_plane.deflections_trees_cache.clear()
+
+        _, deflections_of_new_tree = tree_and_deflections_from_galaxies(
+            galaxies=galaxies_from_kappa_s_cycle(kappa_s_cycle=4)
+        )
+
+        assert deflections == pytest.approx(deflections_of_new_tree, 1.0e-12)
+
+        tree_moved, _ = tree_and_deflections_from_galaxies(
+            galaxies=galaxies_from_kappa_s_cycle(kappa_s_cycle=4, offset=0.1)
+        )
+
+        assert tree_moved is not tree_reused
+        assert len(compiled_plane.deflections_trees_cache) == 2
+
+    def test__sliced_tracer__opening_angle_passed_to_compiled_planes(self):
+
+        tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+            lens_galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                )
+            ],
+            line_of_sight_galaxies=[
+                al.Galaxy(
+                    redshift=0.2,
+                    mass=al.mp.SphericalNFW(centre=(5.0, 5.0), kappa_s=0.01),
+                )
+            ],
+            source_galaxies=[al.Galaxy(redshift=1.0)],
+            planes_between_lenses=[1, 1],
+            opening_angle=0.5,
+        )
+
+        assert all(plane.compiled_plane.opening_angle == 0.5 for plane in tracer.planes)
+
+
+class TestExecutor:
+    def test__threaded_executor__deterministic_and_same_as_serial(self, sub_grid_7x7):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(intensity=1.0),
+                gaussian=al.lp.EllipticalGaussian(intensity=1.0, sigma=0.5),
+                mass=al.mp.EllipticalIsothermal(
+                    axis_ratio=0.6, phi=45.0, einstein_radius=1.5
+                ),
+                nfw=al.mp.SphericalNFW(centre=(0.3, -0.2), kappa_s=0.1),
+                shear=al.mp.ExternalShear(magnitude=0.05, phi=20.0),
+            )
+        ]
+
+        serial = compiled_plane.CompiledPlane(galaxies=galaxies)
+        threaded = compiled_plane.CompiledPlane(
+            galaxies=galaxies, executor=ex.ThreadedExecutor(threads=4)
+        )
+
+        for func_name in ("profile_image_from_grid", "deflections_from_grid"):
+
+            threaded_quantity = getattr(threaded, func_name)(grid=sub_grid_7x7)
+
+            assert (
+                getattr(threaded, func_name)(grid=sub_grid_7x7) == threaded_quantity
+            ).all()
+            assert threaded_quantity == pytest.approx(
+                getattr(serial, func_name)(grid=sub_grid_7x7), 1.0e-8
+            )
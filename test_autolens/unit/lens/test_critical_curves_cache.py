@@ -0,0 +1,91 @@
+import autofit as af
+import autolens as al
+from autolens.lens import critical_curves_cache as ccc
+
+
+def tracer_from_einstein_radius(einstein_radius):
+
+    return al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+    )
+
+
+class TestCriticalCurvesCache:
+    def test__entry_from_key__counts_hits_and_misses_and_evicts_least_recently_used(
+        self
+    ):
+
+        cache = ccc.CriticalCurvesCache()
+        cache.max_size = 2
+
+        entry_0 = cache.entry_from_key(key=0)
+        cache.entry_from_key(key=1)
+
+        assert cache.entry_from_key(key=0) is entry_0
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        cache.entry_from_key(key=2)
+
+        assert list(cache.critical_curves_and_caustics.keys()) == [0, 2]
+
+        cache.clear()
+
+        assert len(cache.critical_curves_and_caustics) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test__tracers_with_same_mass_model_share_critical_curves_and_caustics(self):
+
+        ccc.critical_curves_cache.clear()
+
+        tracer_0 = tracer_from_einstein_radius(einstein_radius=1.0)
+        tracer_1 = tracer_from_einstein_radius(einstein_radius=1.0)
+
+        critical_curves = tracer_0.critical_curves
+
+        assert tracer_1.critical_curves is critical_curves
+        assert tracer_1.tangential_critical_curve is critical_curves[0]
+        assert tracer_1.caustics is tracer_0.caustics
+        assert ccc.critical_curves_cache.misses == 1
+
+        tracer_2 = tracer_from_einstein_radius(einstein_radius=2.0)
+
+        assert tracer_2.critical_curves is not critical_curves
+        assert ccc.critical_curves_cache.misses == 2
+
+    def test__calculation_grid_config_changed__critical_curves_recomputed(
+        self, monkeypatch
+    ):
+
+        ccc.critical_curves_cache.clear()
+
+        tracer = tracer_from_einstein_radius(einstein_radius=1.0)
+
+        critical_curves = tracer.critical_curves
+
+        get = af.conf.instance.general.get
+
+        def get_with_fewer_pixels(section, name, cast):
+            if (section, name) == ("calculation_grid", "pixels"):
+                return 201
+            return get(section, name, cast)
+
+        monkeypatch.setattr(af.conf.instance.general, "get", get_with_fewer_pixels)
+
+        assert tracer.critical_curves is not critical_curves
+        assert ccc.critical_curves_cache.misses == 2
+
+    def test__tracer_and_plane_keys_differ(self):
+
+        tracer = tracer_from_einstein_radius(einstein_radius=1.0)
+
+        assert tracer.critical_curves_key != tracer.image_plane.critical_curves_key
+        assert (
+            tracer.critical_curves_key
+            == tracer_from_einstein_radius(einstein_radius=1.0).critical_curves_key
+        )
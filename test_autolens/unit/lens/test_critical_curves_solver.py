@@ -0,0 +1,215 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autoastro import lensing
+from autolens.lens import critical_curves_solver
+
+
+@pytest.fixture(name="grid_calculation")
+def make_grid_calculation():
+    return al.grid.bounding_box(
+        bounding_box=[-2.0, 2.0, -2.0, 2.0],
+        shape_2d=(51, 51),
+        buffer_around_corners=True,
+    )
+
+
+class TestJacobian:
+    def test__sis__determinant_and_eigen_values_match_analytic_values(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        determinants, tangential_eigen_values, radial_eigen_values = critical_curves_solver.jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+            tracer=tracer, grid=np.array([[0.0, 0.5], [2.0, 0.0]]), step=1.0e-4
+        )
+
+        assert tangential_eigen_values == pytest.approx([-1.0, 0.5], 1.0e-4)
+        assert radial_eigen_values == pytest.approx([1.0, 1.0], 1.0e-4)
+        assert determinants == pytest.approx([-1.0, 0.5], 1.0e-4)
+
+
+class TestCriticalCurvesFinder:
+    def test__sis__tangential_critical_curve_is_einstein_ring_to_tolerance(
+        self, grid_calculation
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        finder = critical_curves_solver.CriticalCurvesFinder(
+            grid=grid_calculation, pixel_scale_precision=0.02, tolerance=1.0e-4
+        )
+
+        tangential_critical_curve, radial_critical_curve = finder.critical_curves_from_tracer(
+            tracer=tracer
+        )
+
+        radii = np.hypot(*np.asarray(tangential_critical_curve).T)
+
+        assert radii == pytest.approx(np.ones(radii.shape), abs=1.0e-4)
+        assert tangential_critical_curve[0] == pytest.approx(
+            tangential_critical_curve[-1]
+        )
+        assert radial_critical_curve == []
+
+        assert finder.einstein_radius_from_critical_curve(
+            critical_curve=tangential_critical_curve
+        ) == pytest.approx(1.0, 1.0e-3)
+
+        tangential_caustic, radial_caustic = finder.caustics_from_tracer_and_critical_curves(
+            tracer=tracer, critical_curves=[tangential_critical_curve, []]
+        )
+
+        assert np.max(np.abs(tangential_caustic)) < 1.0e-3
+        assert radial_caustic == []
+
+    def test__cored_isothermal__radial_critical_curve_is_found_where_radial_eigen_value_is_zero(
+        self, grid_calculation
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        einstein_radius=1.0, core_radius=0.2
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        finder = critical_curves_solver.CriticalCurvesFinder(grid=grid_calculation)
+
+        tangential_critical_curve, radial_critical_curve = finder.critical_curves_from_tracer(
+            tracer=tracer
+        )
+
+        _, _, radial_eigen_values = critical_curves_solver.jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+            tracer=tracer, grid=np.asarray(radial_critical_curve), step=1.0e-4
+        )
+
+        assert len(tangential_critical_curve) > 0
+        assert np.max(np.abs(radial_eigen_values)) < 1.0e-2
+        assert np.max(np.hypot(*np.asarray(radial_critical_curve).T)) < np.min(
+            np.hypot(*np.asarray(tangential_critical_curve).T)
+        )
+
+    def test__multi_plane_tracer__determinant_is_zero_along_critical_curve_and_caustic_is_traced(
+        self, grid_calculation
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=0.8)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.2), einstein_radius=0.4
+                    ),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+        )
+
+        finder = critical_curves_solver.CriticalCurvesFinder(grid=grid_calculation)
+
+        tangential_critical_curve, _ = finder.critical_curves_from_tracer(tracer=tracer)
+
+        determinants, _, _ = critical_curves_solver.jacobian_determinants_and_eigen_values_from_tracer_and_grid(
+            tracer=tracer, grid=np.asarray(tangential_critical_curve), step=1.0e-4
+        )
+
+        assert np.max(np.abs(determinants)) < 1.0e-2
+
+        tangential_caustic, _ = finder.caustics_from_tracer_and_critical_curves(
+            tracer=tracer, critical_curves=[tangential_critical_curve, []]
+        )
+
+        assert np.asarray(tangential_caustic) == pytest.approx(
+            np.asarray(
+                tracer.traced_grids_of_planes_from_grid(
+                    grid=al.grid_irregular.manual_1d(grid=tangential_critical_curve)
+                )[-1]
+            )
+        )
+
+
+class TestTracer:
+    def test__critical_curves_and_einstein_radius_use_finder(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.5)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        tangential_critical_curve, _ = tracer.critical_curves_finder.critical_curves_from_tracer(
+            tracer=tracer
+        )
+
+        assert np.asarray(tracer.tangential_critical_curve) == pytest.approx(
+            np.asarray(tangential_critical_curve)
+        )
+        assert tracer.einstein_radius_via_tangential_critical_curve == pytest.approx(
+            1.5, 1.0e-2
+        )
+
+    def test__cored_isothermal__critical_curves_same_as_contours_of_eigen_value_maps(
+        self
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        centre=(0.1, -0.05), einstein_radius=1.2, core_radius=0.2
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        pixel_scale = np.max(tracer.calculation_grid.pixel_scales)
+
+        critical_curves = tracer.critical_curves_finder.critical_curves_from_tracer(
+            tracer=tracer
+        )
+
+        critical_curves_of_eigen_value_maps = [
+            lensing.LensingObject.tangential_critical_curve.fget(tracer),
+            lensing.LensingObject.radial_critical_curve.fget(tracer),
+        ]
+
+        for critical_curve, critical_curve_of_eigen_value_map in zip(
+            critical_curves, critical_curves_of_eigen_value_maps
+        ):
+
+            distances = np.linalg.norm(
+                np.asarray(critical_curve)[:, np.newaxis, :]
+                - np.asarray(critical_curve_of_eigen_value_map)[np.newaxis, :, :],
+                axis=2,
+            )
+
+            assert np.max(np.min(distances, axis=1)) < pixel_scale
+            assert np.max(np.min(distances, axis=0)) < pixel_scale
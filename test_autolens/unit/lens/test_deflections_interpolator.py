@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import deflections_interpolator as di
+
+
+@pytest.fixture(name="plane_sie")
+def make_plane_sie():
+    return al.Plane(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.01, 0.01), axis_ratio=0.8, einstein_radius=1.0
+                ),
+            )
+        ],
+        redshift=0.5,
+    )
+
+
+@pytest.fixture(name="coordinates")
+def make_coordinates():
+    return np.random.RandomState(seed=1).uniform(-3.0, 3.0, size=(2000, 2))
+
+
+class TestDeflectionsInterpolator:
+    def test__error_of_interpolated_deflections_is_controlled_by_tolerance(
+        self, plane_sie, coordinates
+    ):
+
+        exact_deflections = np.asarray(
+            plane_sie.deflections_from_grid(
+                grid=al.grid_irregular.manual_1d(grid=coordinates)
+            )
+        )
+
+        for tolerance in [1.0e-2, 1.0e-3]:
+
+            interpolator = di.DeflectionsInterpolator(
+                pixel_scale_interpolation_grid=0.1, tolerance=tolerance
+            )
+
+            deflections = interpolator.deflections_from_plane_and_grid(
+                plane=plane_sie, grid=coordinates
+            )
+
+            errors = np.hypot(*(deflections - exact_deflections).T)
+
+            assert np.max(errors) < 2.0 * tolerance
+            assert 0 < interpolator.total_exact < coordinates.shape[0]
+            assert (
+                interpolator.total_exact + interpolator.total_interpolated
+                == coordinates.shape[0]
+            )
+
+    def test__no_tolerance__every_coordinate_interpolated(self, plane_sie, coordinates):
+
+        interpolator = di.DeflectionsInterpolator(
+            pixel_scale_interpolation_grid=0.1, tolerance=None
+        )
+
+        interpolator.deflections_from_plane_and_grid(plane=plane_sie, grid=coordinates)
+
+        assert interpolator.total_exact == 0
+        assert interpolator.total_interpolated == coordinates.shape[0]
+
+    def test__plane_without_mass__zero_deflections(self, coordinates):
+
+        interpolator = di.DeflectionsInterpolator(
+            pixel_scale_interpolation_grid=0.1, tolerance=1.0e-3
+        )
+
+        deflections = interpolator.deflections_from_plane_and_grid(
+            plane=al.Plane(redshift=1.0), grid=coordinates
+        )
+
+        assert (deflections == 0.0).all()
@@ -0,0 +1,41 @@
+import threading
+
+from autolens.lens import executor as ex
+
+
+class TestExecutorFromThreads:
+    def test__threads_1_or_none__serial_executor(self):
+
+        assert ex.executor_from_threads(threads=None) is ex.serial_executor
+        assert ex.executor_from_threads(threads=1) is ex.serial_executor
+
+    def test__threads_above_1__threaded_executors_share_thread_pool(self):
+
+        executor_0 = ex.executor_from_threads(threads=2)
+        executor_1 = ex.executor_from_threads(threads=2)
+
+        assert isinstance(executor_0, ex.ThreadedExecutor)
+        assert executor_0.threads == 2
+        assert executor_0.thread_pool is executor_1.thread_pool
+
+
+class TestThreadedExecutor:
+    def test__map__results_in_order_of_items(self):
+
+        executor = ex.ThreadedExecutor(threads=4)
+
+        assert executor.map(lambda item: item ** 2, range(20)) == [
+            item ** 2 for item in range(20)
+        ]
+
+    def test__map_called_from_worker__evaluated_serially_in_worker(self):
+
+        executor = ex.ThreadedExecutor(threads=2)
+
+        def nested_thread_names(item):
+            return executor.map(
+                lambda nested_item: threading.current_thread().name, range(3)
+            )
+
+        for thread_names in executor.map(nested_thread_names, range(4)):
+            assert len(set(thread_names)) == 1
@@ -248,6 +248,37 @@ class TestAbstractPlane:
             )
             assert plane.has_mass_profile is True
 
+        def test__metadata__recomputed_when_galaxies_are_set(self):
+            plane = al.Plane(galaxies=[al.Galaxy(redshift=0.5)], redshift=None)
+
+            assert plane.has_light_profile is False
+            assert plane.galaxies_with_light_profile == []
+
+            galaxy = al.Galaxy(redshift=0.5, light_profile=al.lp.EllipticalSersic())
+
+            plane.galaxies = [galaxy]
+
+            assert plane.has_light_profile is True
+            assert plane.galaxies_with_light_profile == [galaxy]
+            assert plane.light_profile_centres == [(0.0, 0.0)]
+
+            plane = al.Plane(redshift=0.5)
+
+            assert plane.has_light_profile is None
+            assert plane.has_pixelization is False
+
+        def test__light_profile_without_centre__plane_and_tracer_created(self):
+
+            galaxy = al.Galaxy(redshift=0.5, light_profile=al.lp.LightProfile())
+
+            plane = al.Plane(galaxies=[galaxy], redshift=None)
+
+            assert plane.has_light_profile is True
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy])
+
+            assert tracer.upper_plane_index_with_light_profile == 0
+
         def test__has_pixelization(self):
             plane = al.Plane(galaxies=[al.Galaxy(redshift=0.5)], redshift=None)
             assert plane.has_pixelization is False
@@ -1029,6 +1060,49 @@ class TestAbstractPlaneLensing:
 
             assert convergence.shape_2d == (7, 7)
 
+    class TestAccumulation:
+        def test__quantities_added_in_place_to_output_array(self, sub_grid_7x7):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(
+                    einstein_radius=1.0, centre=(1.0, 0.0)
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(
+                    einstein_radius=2.0, centre=(1.0, 1.0)
+                ),
+            )
+
+            plane = al.Plane(galaxies=[g0, g1], redshift=None)
+
+            for func_name, shape in [
+                ("profile_image_from_grid", (sub_grid_7x7.sub_shape_1d,)),
+                ("convergence_from_grid", (sub_grid_7x7.sub_shape_1d,)),
+                ("potential_from_grid", (sub_grid_7x7.sub_shape_1d,)),
+                ("deflections_from_grid", (sub_grid_7x7.sub_shape_1d, 2)),
+            ]:
+
+                values = getattr(plane, func_name)(grid=sub_grid_7x7)
+
+                out = np.ones(shape)
+
+                values_accumulated = getattr(plane, func_name)(
+                    grid=sub_grid_7x7, out=out
+                )
+
+                assert out == pytest.approx(np.asarray(values) + 1.0, 1.0e-4)
+                assert np.asarray(values_accumulated) == pytest.approx(out, 1.0e-4)
+
+            out = np.ones(sub_grid_7x7.sub_shape_1d)
+
+            al.Plane(redshift=0.5).convergence_from_grid(grid=sub_grid_7x7, out=out)
+
+            assert (out == 1.0).all()
+
     class TestPotential:
         def test__potential_same_as_multiple_galaxies__include_reshape_mapping(
             self, sub_grid_7x7
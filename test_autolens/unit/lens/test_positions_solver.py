@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import positions_solver
+
+
+class TestSourceInTriangles:
+    def test__coordinate_inside_and_outside_triangles__weights_and_inside_flags(self):
+
+        weights, inside = positions_solver.source_in_triangles_from_corners(
+            corners_0=np.array([[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]]),
+            corners_1=np.array([[0.0, 2.0], [0.0, 2.0], [0.0, 2.0]]),
+            corners_2=np.array([[2.0, 0.0], [-2.0, 0.0], [0.0, 4.0]]),
+            coordinate=np.array([0.5, 0.5]),
+        )
+
+        assert weights[0] == pytest.approx(np.array([0.5, 0.25, 0.25]), 1.0e-8)
+        assert (inside == np.array([True, False, False])).all()
+
+
+class TestPositionsFinder:
+    def test__spherical_isothermal__two_images_either_side_of_lens_at_einstein_radius(
+        self
+    ):
+
+        grid = al.grid.uniform(shape_2d=(60, 60), pixel_scales=0.05, sub_size=1)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        positions_finder = positions_solver.PositionsFinder(
+            grid=grid, pixel_scale_precision=1.0e-4
+        )
+
+        positions = positions_finder.image_plane_positions_from_tracer_and_source_plane_coordinate(
+            tracer=tracer, source_plane_coordinate=(0.0, 0.1)
+        )
+
+        assert np.asarray(positions) == pytest.approx(
+            np.array([[0.0, -0.9], [0.0, 1.1]]), abs=1.0e-6
+        )
+
+    def test__coarse_pixel_scale__defaults_to_factor_of_grid_pixel_scale(self):
+
+        grid = al.grid.uniform(shape_2d=(60, 60), pixel_scales=0.05, sub_size=1)
+
+        positions_finder = positions_solver.PositionsFinder(
+            grid=grid, pixel_scale_precision=1.0e-4
+        )
+
+        assert positions_finder.coarse_pixel_scale == pytest.approx(0.5, 1.0e-8)
+
+        positions_finder = positions_solver.PositionsFinder(
+            grid=grid, pixel_scale_precision=1.0e-4, coarse_pixel_scale=0.2
+        )
+
+        assert positions_finder.coarse_pixel_scale == 0.2
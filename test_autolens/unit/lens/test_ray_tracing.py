@@ -1,4 +1,7 @@
 import autolens as al
+from autolens import exc
+from autolens.lens import ray_tracing
+from autolens.lens import compiled_plane
 from skimage import measure
 import numpy as np
 import pytest
@@ -324,6 +327,51 @@ class TestAbstractTracer:
 
             assert tracer.upper_plane_index_with_light_profile == 2
 
+        def test__metadata__computed_once_and_recomputed_by_invalidate_metadata(self):
+
+            g0 = al.Galaxy(redshift=0.5)
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(centre=(1.0, 2.0))
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            assert tracer.galaxies is tracer.galaxies
+            assert tracer.light_profile_centres == [(1.0, 2.0)]
+            assert tracer.upper_plane_index_with_light_profile == 1
+            assert tracer.has_mass_profile is False
+
+            g0.mass_profile = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+            assert tracer.has_mass_profile is False
+
+            tracer.invalidate_metadata()
+
+            assert tracer.has_mass_profile is True
+            assert tracer.image_plane.galaxies_with_mass_profile == [g0]
+
+            tracer.source_plane.galaxies = [al.Galaxy(redshift=1.0)]
+
+            assert tracer.source_plane.has_light_profile is False
+
+        def test__attributes_stored_in_slots__instance_dictionaries_empty(
+            self, sub_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(redshift=1.0, light_profile=al.lp.EllipticalSersic())
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            tracer.profile_image_from_grid(grid=sub_grid_7x7)
+
+            assert tracer.scaling_factors_of_planes is tracer.scaling_factors_of_planes
+            assert tracer.__dict__ == {}
+            assert [plane.__dict__ for plane in tracer.planes] == [{}, {}]
+
         def test__hyper_model_image_of_galaxy_with_pixelization(self, sub_grid_7x7):
 
             gal = al.Galaxy(redshift=0.5)
@@ -1153,6 +1201,36 @@ class TestAbstractTracerCosmology:
         assert tracer.planes[2].galaxies == [g0, g1]
         assert tracer.planes[3].galaxies == [g3, g5]
 
+    def test__scaling_factors_of_planes__matches_scaling_factor_between_planes(self):
+
+        g0 = al.Galaxy(redshift=0.1)
+        g1 = al.Galaxy(redshift=1.0)
+        g2 = al.Galaxy(redshift=2.0)
+        g3 = al.Galaxy(redshift=3.0)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+        )
+
+        scaling_factors = tracer.scaling_factors_of_planes
+
+        assert scaling_factors.shape == (4, 4)
+
+        for j in range(4):
+            for i in range(4):
+                if i < j:
+                    assert scaling_factors[i, j] == pytest.approx(
+                        tracer.scaling_factor_between_planes(i=i, j=j), 1e-8
+                    )
+                else:
+                    assert scaling_factors[i, j] == 0.0
+
+        tracer_same_redshifts = al.Tracer.from_galaxies(
+            galaxies=[g3, g2, g1, g0], cosmology=cosmo.Planck15
+        )
+
+        assert tracer_same_redshifts.scaling_factors_of_planes is scaling_factors
+
 
 class TestAbstractTracerLensing:
     class TestTracedGridsFromGrid:
@@ -1657,6 +1735,220 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__same_grid_traced_twice__traced_grids_reused_from_cache(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_cached = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_cached is not traced_grids_of_planes
+            assert traced_grids_of_planes_cached[0] is traced_grids_of_planes[0]
+            assert traced_grids_of_planes_cached[1] is traced_grids_of_planes[1]
+
+            traced_grids_of_planes_limit = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            assert len(traced_grids_of_planes_limit) == 1
+            assert traced_grids_of_planes_limit[0] is not traced_grids_of_planes[0]
+
+            grid_copy = sub_grid_7x7.copy()
+
+            traced_grids_of_planes_copy = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=grid_copy
+            )
+
+            assert traced_grids_of_planes_copy[1] is not traced_grids_of_planes[1]
+            assert (traced_grids_of_planes_copy[1] == traced_grids_of_planes[1]).all()
+
+        def test__cache_is_bounded__oldest_grids_evicted(self, sub_grid_7x7, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            grids_traced = [
+                sub_grid_7x7.copy() for _ in range(tracer.traced_grids_cache_size + 1)
+            ]
+
+            traced_grids_of_planes = [
+                tracer.memoized_traced_grids_of_planes_from_grid(grid=grid)
+                for grid in grids_traced
+            ]
+
+            assert len(tracer._traced_grids_cache) == tracer.traced_grids_cache_size
+
+            assert (
+                tracer.memoized_traced_grids_of_planes_from_grid(grid=grids_traced[-1])[
+                    1
+                ]
+                is traced_grids_of_planes[-1][1]
+            )
+            assert (
+                tracer.memoized_traced_grids_of_planes_from_grid(grid=grids_traced[0])[
+                    1
+                ]
+                is not traced_grids_of_planes[0][1]
+            )
+
+        def test__traced_grids_returned_to_caller__writeable_copies_of_memoized_grids(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            memoized_traced_grids = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert not memoized_traced_grids[1].flags.writeable
+            assert traced_grids[1].flags.writeable
+            assert traced_grids[1] is not memoized_traced_grids[1]
+            assert (traced_grids[1] == memoized_traced_grids[1]).all()
+
+            traced_grids[1][0] = 100.0
+
+            assert (
+                tracer.memoized_traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1][
+                    0
+                ]
+                != 100.0
+            ).all()
+
+        def test__grid_with_workspace__traced_into_reused_buffer__same_as_without_workspace(
+            self, sub_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=2.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=2.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g2 = al.Galaxy(
+                redshift=0.1,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g3 = al.Galaxy(
+                redshift=3.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            grid_workspace = ray_tracing.TracedGridsWorkspace.attach_to_grid(
+                grid=sub_grid_7x7.copy()
+            )
+
+            traced_grids_of_planes_workspace = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=grid_workspace
+            )
+
+            workspace_grids = grid_workspace.traced_grids_workspace.traced_grids_from_grid_and_total_planes(
+                grid=grid_workspace, total_planes=3
+            )
+
+            for plane_index in range(3):
+                assert traced_grids_of_planes_workspace[plane_index] == pytest.approx(
+                    traced_grids_of_planes[plane_index], 1.0e-8
+                )
+                assert traced_grids_of_planes_workspace[plane_index].base is not None
+                assert (
+                    traced_grids_of_planes_workspace[plane_index].mask
+                    == sub_grid_7x7.mask
+                ).all()
+
+            assert np.shares_memory(
+                traced_grids_of_planes_workspace[2], workspace_grids
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+            )
+
+            traced_grids_of_planes_workspace_new = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=grid_workspace
+            )
+
+            assert np.shares_memory(
+                traced_grids_of_planes_workspace_new[2],
+                traced_grids_of_planes_workspace[2],
+            )
+            assert (
+                grid_workspace.traced_grids_workspace.traced_grids_from_grid_and_total_planes(
+                    grid=grid_workspace, total_planes=3
+                )
+                is workspace_grids
+            )
+
+        def test__grid_with_interpolator__every_plane_interpolated_in_its_frame_within_tolerance(
+            self
+        ):
+
+            mask = al.mask.circular(
+                shape_2d=(60, 60), pixel_scales=0.05, sub_size=2, radius=1.4
+            )
+
+            grid = al.masked.grid.from_mask(mask=mask)
+
+            grid_interpolate = al.masked.grid.from_mask(
+                mask=mask
+            ).new_grid_with_interpolator(pixel_scale_interpolation_grid=0.1)
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.01, 0.01), axis_ratio=0.8, einstein_radius=1.0
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass=al.mp.SphericalIsothermal(centre=(0.2, -0.1), einstein_radius=0.3),
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            assert tracer.deflections_interpolator_from_grid(grid=grid) is None
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=grid)
+            traced_grids_interpolate = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_interpolate
+            )
+
+            errors = np.hypot(
+                *(
+                    np.asarray(traced_grids_interpolate[2])
+                    - np.asarray(traced_grids[2])
+                ).T
+            )
+
+            assert (
+                0.0 < np.max(errors) < 5.0 * tracer.deflections_interpolation_tolerance
+            )
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2580,6 +2872,110 @@ class TestAbstractTracerLensing:
 
             assert (grid_at_redshift == sub_grid_7x7.geometry.unmasked_grid).all()
 
+        def test__vector_of_redshifts__matches_single_redshifts_and_tracer_is_unchanged(
+            self, sub_grid_7x7
+        ):
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(
+                    centre=(0.0, 0.0), einstein_radius=1.0
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=0.75,
+                mass_profile=al.mp.SphericalIsothermal(
+                    centre=(0.1, 0.0), einstein_radius=2.0
+                ),
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            redshifts = [0.3, 0.5, 0.6, 0.75, 1.2, 1.9, 2.0]
+
+            grids_at_redshifts = tracer.grids_at_redshifts_from_grid_and_redshifts(
+                grid=sub_grid_7x7, redshifts=redshifts
+            )
+
+            assert tracer.plane_redshifts == [0.5, 0.75, 2.0]
+
+            for redshift, grid_at_redshift in zip(redshifts, grids_at_redshifts):
+
+                planes = [al.Plane(redshift=redshift)] + list(tracer.planes)
+
+                tracer_with_plane = al.Tracer(
+                    planes=sorted(
+                        {plane.redshift: plane for plane in planes}.values(),
+                        key=lambda plane: plane.redshift,
+                    ),
+                    cosmology=tracer.cosmology,
+                )
+
+                plane_index = tracer_with_plane.plane_redshifts.index(redshift)
+
+                assert grid_at_redshift == pytest.approx(
+                    tracer_with_plane.traced_grids_of_planes_from_grid(
+                        grid=sub_grid_7x7
+                    )[plane_index],
+                    1.0e-8,
+                )
+
+        def test__redshift_beyond_last_plane__traced_with_plane_inserted_at_redshift(
+            self, sub_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass_profile=al.mp.SphericalIsothermal(
+                    centre=(0.1, 0.0), einstein_radius=0.5
+                ),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            grid_at_redshift = tracer.grid_at_redshift_from_grid_and_redshift(
+                grid=sub_grid_7x7, redshift=1.5
+            )
+
+            tracer_with_plane = al.Tracer(
+                planes=tracer.planes + [al.Plane(redshift=1.5, galaxies=[])],
+                cosmology=tracer.cosmology,
+            )
+
+            assert grid_at_redshift == pytest.approx(
+                tracer_with_plane.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[
+                    -1
+                ],
+                1.0e-8,
+            )
+            assert tracer.plane_redshifts == [0.5, 1.0]
+
+        def test__grids_returned_are_writeable_copies(self, sub_grid_7x7):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(redshift=1.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            grids_at_redshifts = tracer.grids_at_redshifts_from_grid_and_redshifts(
+                grid=sub_grid_7x7, redshifts=[0.5, 0.7, 1.0]
+            )
+
+            source_plane_grid = tracer.memoized_traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )[1]
+
+            for grid_at_redshift in grids_at_redshifts:
+                assert grid_at_redshift.flags.writeable
+                assert not np.shares_memory(grid_at_redshift, source_plane_grid)
+
     class TestMultipleImages:
         def test__simple_isothermal_case_positions_are_correct(self):
 
@@ -2600,15 +2996,47 @@ class TestAbstractTracerLensing:
                 grid=grid, source_plane_coordinate=(0.0, 0.0)
             )
 
-            assert coordinates[0][0] == pytest.approx((1.025, -0.025), 1.0e-4)
-            assert coordinates[0][1] == pytest.approx((0.025, -0.975), 1.0e-4)
-            assert coordinates[0][2] == pytest.approx((0.025, 0.975), 1.0e-4)
-            assert coordinates[0][3] == pytest.approx((-1.025, -0.025), 1.0e-4)
-            assert coordinates.scaled[0][0] == pytest.approx((1.025, -0.025), 1.0e-4)
-            assert coordinates.scaled[0][1] == pytest.approx((0.025, -0.975), 1.0e-4)
-            assert coordinates.scaled[0][2] == pytest.approx((0.025, 0.975), 1.0e-4)
-            assert coordinates.scaled[0][3] == pytest.approx((-1.025, -0.025), 1.0e-4)
-            assert coordinates.pixels == [[(29, 49), (49, 30), (49, 69), (70, 49)]]
+            assert len(coordinates[0]) == 4
+            assert coordinates[0][0] == pytest.approx((1.026861, -0.006488), abs=1.0e-4)
+            assert coordinates[0][1] == pytest.approx((0.007087, -0.953312), abs=1.0e-4)
+            assert coordinates[0][2] == pytest.approx((0.006998, 0.953313), abs=1.0e-4)
+            assert coordinates[0][3] == pytest.approx(
+                (-1.026862, -0.006395), abs=1.0e-4
+            )
+            assert coordinates.scaled[0][0] == pytest.approx(
+                (1.026861, -0.006488), abs=1.0e-4
+            )
+
+        def test__positions_trace_to_source_plane_coordinate_within_precision(self):
+
+            grid = al.grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.001, 0.001), einstein_radius=1.0, axis_ratio=0.8
+                ),
+            )
+
+            g1 = al.Galaxy(redshift=1.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            coordinates = tracer.image_plane_multiple_image_positions(
+                grid=grid,
+                source_plane_coordinate=(0.05, 0.03),
+                pixel_scale_precision=1.0e-4,
+            )
+
+            assert len(coordinates[0]) == 4
+
+            traced_positions = tracer.traced_grids_of_planes_from_grid(
+                grid=al.grid_irregular.manual_1d(grid=np.asarray(coordinates[0]))
+            )[-1]
+
+            assert np.asarray(traced_positions) == pytest.approx(
+                np.array([[0.05, 0.03]] * 4), abs=1.0e-4
+            )
 
         def test__multiple_image_coordinate_of_light_profile_centres_of_source_plane(
             self
@@ -2633,7 +3061,17 @@ class TestAbstractTracerLensing:
                 grid=grid, source_plane_coordinate=(0.0, 0.0)
             )
 
-            assert coordinates_manual.pixels == [[(4, 24), (45, 24)]]
+            assert np.asarray(coordinates_manual[0]) == pytest.approx(
+                np.array(
+                    [
+                        [1.015299, 0.0],
+                        [0.0, -0.980267],
+                        [0.0, 0.980267],
+                        [-1.015299, 0.0],
+                    ]
+                ),
+                abs=1.0e-4,
+            )
             assert (
                 coordinates_manual.scaled
                 == tracer.image_plane_multiple_image_positions_of_galaxies(grid=grid)[0]
@@ -2918,6 +3356,156 @@ class TestAbstractTracerData:
             assert (blurred_images[0].in_2d == blurred_image_0.in_2d).all()
             assert (blurred_images[1].in_2d == blurred_image_1.in_2d).all()
 
+        def test__grid_and_blurring_grid_traced_and_evaluated_fused__same_as_separately(
+            self, sub_grid_7x7, blurring_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(
+                redshift=2.0, light_profile=al.lp.EllipticalSersic(intensity=3.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            traced_grids, traced_blurring_grids = tracer.memoized_traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            tracer_separate = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            for plane_index in range(3):
+                assert traced_grids[plane_index] == pytest.approx(
+                    tracer_separate.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[
+                        plane_index
+                    ],
+                    1.0e-8,
+                )
+                assert traced_blurring_grids[plane_index] == pytest.approx(
+                    tracer_separate.traced_grids_of_planes_from_grid(
+                        grid=blurring_grid_7x7
+                    )[plane_index],
+                    1.0e-8,
+                )
+                assert (traced_grids[plane_index].mask == sub_grid_7x7.mask).all()
+
+            assert (
+                tracer.memoized_traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[2]
+                is traced_grids[2]
+            )
+
+            traced_grids_copies, _ = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            assert traced_grids_copies[2].flags.writeable
+            assert traced_grids_copies[2] is not traced_grids[2]
+
+            profile_images, blurring_images = tracer.profile_images_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            profile_images_separate = tracer_separate.profile_images_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            blurring_images_separate = tracer_separate.profile_images_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            for plane_index in range(3):
+                assert profile_images[plane_index].in_1d == pytest.approx(
+                    profile_images_separate[plane_index].in_1d, 1.0e-8
+                )
+                assert blurring_images[plane_index].in_1d == pytest.approx(
+                    blurring_images_separate[plane_index].in_1d, 1.0e-8
+                )
+                assert profile_images[plane_index].in_2d_binned == pytest.approx(
+                    profile_images_separate[plane_index].in_2d_binned, 1.0e-8
+                )
+
+        def test__fixed_galaxy_blurred_images_cache__cached_once_light_repeats__same_blurred_image(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            cache = ray_tracing.FixedGalaxyBlurredImagesCache(
+                grid=sub_grid_7x7,
+                blurring_grid=blurring_grid_7x7,
+                convolver=convolver_7x7,
+            )
+
+            def blurred_images_from_source_intensity(intensity):
+
+                g0 = al.Galaxy(
+                    redshift=0.5,
+                    light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                    mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                )
+                g1 = al.Galaxy(
+                    redshift=1.0,
+                    light_profile=al.lp.EllipticalSersic(intensity=intensity),
+                )
+
+                tracer = al.Tracer.from_galaxies(
+                    galaxies=[g0, g1], cosmology=cosmo.Planck15
+                )
+                tracer.fixed_galaxy_blurred_images_cache = cache
+
+                tracer_no_cache = al.Tracer.from_galaxies(
+                    galaxies=[g0, g1], cosmology=cosmo.Planck15
+                )
+
+                return [
+                    tracer.blurred_profile_image_from_grid_and_convolver(
+                        grid=sub_grid_7x7,
+                        convolver=convolver_7x7,
+                        blurring_grid=blurring_grid_7x7,
+                    ),
+                    tracer_no_cache.blurred_profile_image_from_grid_and_convolver(
+                        grid=sub_grid_7x7,
+                        convolver=convolver_7x7,
+                        blurring_grid=blurring_grid_7x7,
+                    ),
+                ]
+
+            blurred_image, blurred_image_no_cache = blurred_images_from_source_intensity(
+                intensity=2.0
+            )
+
+            assert len(cache.blurred_images) == 0
+            assert blurred_image.in_1d == pytest.approx(
+                blurred_image_no_cache.in_1d, 1.0e-8
+            )
+
+            blurred_image, blurred_image_no_cache = blurred_images_from_source_intensity(
+                intensity=3.0
+            )
+
+            assert len(cache.blurred_images) == 1
+            assert blurred_image.in_1d == pytest.approx(
+                blurred_image_no_cache.in_1d, 1.0e-8
+            )
+
+            blurred_image, blurred_image_no_cache = blurred_images_from_source_intensity(
+                intensity=4.0
+            )
+
+            assert len(cache.blurred_images) == 1
+            assert blurred_image.in_1d == pytest.approx(
+                blurred_image_no_cache.in_1d, 1.0e-8
+            )
+
         def test__galaxy_blurred_image_dict_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
         ):
@@ -4134,3 +4722,210 @@ class TestTacerFixedSlices:
                 np.array([-2.5355, -2.5355]), 1e-4
             )
             assert traced_grids[3][1] == pytest.approx(np.array([2.0, 0.0]), 1e-4)
+
+
+class TestTracerTemplate:
+    def test__tracer_from_galaxies__planes_match_tracer_from_galaxies(self):
+
+        galaxies = [
+            al.Galaxy(redshift=1.0),
+            al.Galaxy(redshift=0.5),
+            al.Galaxy(redshift=2.0),
+            al.Galaxy(redshift=0.5),
+        ]
+
+        template = al.TracerTemplate.from_galaxies(galaxies=galaxies)
+
+        assert template.plane_redshifts == [0.5, 1.0, 2.0]
+        assert template.plane_indexes == [1, 0, 2, 0]
+
+        new_galaxies = [
+            al.Galaxy(redshift=1.0),
+            al.Galaxy(redshift=0.5),
+            al.Galaxy(redshift=2.0),
+            al.Galaxy(redshift=0.5),
+        ]
+
+        tracer = template.tracer_from_galaxies(galaxies=new_galaxies)
+        tracer_from_galaxies = al.Tracer.from_galaxies(galaxies=new_galaxies)
+
+        assert tracer.plane_redshifts == tracer_from_galaxies.plane_redshifts
+
+        for plane, plane_from_galaxies in zip(
+            tracer.planes, tracer_from_galaxies.planes
+        ):
+            assert plane.galaxies == plane_from_galaxies.galaxies
+
+    def test__galaxies_do_not_match_template__falls_back_to_tracer_from_galaxies(self):
+
+        template = al.TracerTemplate.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.5)]
+
+        assert template.matches_galaxies(galaxies=galaxies) is False
+
+        tracer = template.tracer_from_galaxies(galaxies=galaxies)
+
+        assert tracer.plane_redshifts == [0.5, 1.5]
+
+        tracer = template.tracer_from_galaxies(galaxies=galaxies[:1])
+
+        assert tracer.plane_redshifts == [0.5]
+
+
+class TestTracerBatch:
+    def test__tracers_with_different_plane_redshifts__raises_exception(self):
+
+        tracer_0 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+        tracer_1 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)]
+        )
+
+        with pytest.raises(exc.TracerBatchException):
+            al.TracerBatch(tracers=[tracer_0, tracer_1])
+
+        with pytest.raises(exc.TracerBatchException):
+            al.TracerBatch(tracers=[])
+
+    def test__traced_grids_of_planes__same_as_each_tracer(self, sub_grid_7x7):
+
+        galaxies_of_tracers = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.1), einstein_radius=0.5 * einstein_radius
+                    ),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+            for einstein_radius in [0.5, 1.0, 1.5]
+        ]
+
+        tracer_batch = al.TracerBatch.from_galaxies_of_tracers(
+            galaxies_of_tracers=galaxies_of_tracers, cosmology=cosmo.Planck15
+        )
+
+        assert tracer_batch.batch_size == 3
+        assert tracer_batch.total_planes == 3
+
+        traced_grids = tracer_batch.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+        assert traced_grids.shape == (3, 3, sub_grid_7x7.shape[0], 2)
+
+        for batch_index, tracer in enumerate(tracer_batch.tracers):
+            for plane_index, traced_grid in enumerate(
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            ):
+                assert traced_grids[batch_index, plane_index] == pytest.approx(
+                    np.asarray(traced_grid), 1.0e-8
+                )
+
+    def test__blurred_profile_images__same_as_each_tracer(
+        self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+    ):
+
+        galaxies_of_tracers = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=intensity),
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    light=al.lp.EllipticalExponential(intensity=2.0 * intensity),
+                ),
+            ]
+            for intensity in [0.1, 0.2]
+        ]
+
+        tracer_batch = al.TracerBatch.from_galaxies_of_tracers(
+            galaxies_of_tracers=galaxies_of_tracers, cosmology=cosmo.Planck15
+        )
+
+        blurred_images = tracer_batch.blurred_profile_images_from_grid_and_convolver(
+            grid=sub_grid_7x7, convolver=convolver_7x7, blurring_grid=blurring_grid_7x7
+        )
+
+        assert blurred_images.shape == (2, 9)
+
+        for batch_index, tracer in enumerate(tracer_batch.tracers):
+
+            blurred_image = tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert blurred_images[batch_index] == pytest.approx(
+                blurred_image.in_1d_binned, 1.0e-8
+            )
+
+    def test__profiles_with_and_without_kernels__evaluated_for_batch_and_same_as_each_tracer(
+        self, sub_grid_7x7
+    ):
+
+        galaxies_of_tracers = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalGaussian(
+                        axis_ratio=0.7, phi=30.0, intensity=intensity, sigma=0.5
+                    ),
+                    core_light=al.lp.EllipticalCoreSersic(intensity=intensity),
+                    mass=al.mp.EllipticalIsothermal(
+                        axis_ratio=0.6, phi=45.0, einstein_radius=intensity
+                    ),
+                    nfw=al.mp.SphericalNFW(centre=(0.3, -0.2), kappa_s=0.1),
+                    shear=al.mp.ExternalShear(magnitude=0.05, phi=20.0),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    light=al.lp.EllipticalSersic(
+                        centre=(0.1, 0.0), intensity=2.0 * intensity
+                    ),
+                ),
+            ]
+            for intensity in [0.5, 1.0, 1.5]
+        ]
+
+        tracer_batch = al.TracerBatch.from_galaxies_of_tracers(
+            galaxies_of_tracers=galaxies_of_tracers, cosmology=cosmo.Planck15
+        )
+
+        compiled_profiles, other_profiles_of_batch = tracer_batch.compiled_plane_batch_from_plane_index(
+            plane_index=0
+        ).compiled_and_other_profiles_of_batch_from_profiles_and_kernels(
+            profiles_of_batch=tracer_batch.compiled_plane_batch_from_plane_index(
+                plane_index=0
+            ).mass_profiles_of_batch,
+            kernels=compiled_plane.deflections_kernels,
+        )
+
+        assert compiled_profiles[0][1].centres.shape == (3, 1, 2)
+        assert [len(profiles) for profiles in other_profiles_of_batch] == [2, 2, 2]
+
+        traced_grids = tracer_batch.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+        profile_images = tracer_batch.profile_images_from_grid(grid=sub_grid_7x7)
+
+        for batch_index, tracer in enumerate(tracer_batch.tracers):
+
+            for plane_index, traced_grid in enumerate(
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            ):
+                assert traced_grids[batch_index, plane_index] == pytest.approx(
+                    np.asarray(traced_grid), 1.0e-8
+                )
+
+            assert profile_images[batch_index] == pytest.approx(
+                np.asarray(tracer.profile_image_from_grid(grid=sub_grid_7x7)), 1.0e-8
+            )
@@ -1,5 +1,8 @@
+from collections import OrderedDict
+
 import numpy as np
 import pytest
+from astropy import cosmology as cosmo
 
 import autolens as al
 from autolens import exc
@@ -289,6 +292,152 @@ class TestPlaneRedshifts:
             )
 
 
+class TestScalingFactors:
+    def test__scaling_factors_of_planes__upper_triangle_matches_cosmology_util(self):
+
+        scaling_factors = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors[0, 1] == pytest.approx(
+            al.util.cosmology.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=0.5,
+                redshift_1=1.0,
+                redshift_final=2.0,
+                cosmology=cosmo.Planck15,
+            ),
+            1.0e-8,
+        )
+        assert scaling_factors[0, 2] == pytest.approx(1.0, 1.0e-4)
+        assert scaling_factors[1, 2] == pytest.approx(1.0, 1.0e-4)
+        assert (np.tril(scaling_factors) == 0.0).all()
+
+    def test__same_redshifts_and_cosmology__cached_matrix_is_shared_and_read_only(self):
+
+        scaling_factors_0 = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        scaling_factors_1 = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors_0 is scaling_factors_1
+        assert scaling_factors_0.flags.writeable is False
+
+        scaling_factors_2 = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], cosmology=cosmo.WMAP7
+        )
+
+        assert scaling_factors_2 is not scaling_factors_0
+
+    def test__scaling_factors_to_redshift__planes_below_redshift_match_cosmology_util_others_zero(
+        self
+    ):
+
+        scaling_factors = al.util.lens.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], redshift=0.75, cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors[0] == pytest.approx(
+            al.util.cosmology.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=0.5,
+                redshift_1=0.75,
+                redshift_final=2.0,
+                cosmology=cosmo.Planck15,
+            ),
+            1.0e-8,
+        )
+        assert (scaling_factors[1:] == 0.0).all()
+
+        assert (
+            al.util.lens.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+                plane_redshifts=[0.5, 1.0, 2.0], redshift=0.75, cosmology=cosmo.Planck15
+            )
+            is scaling_factors
+        )
+
+    def test__scaling_factors_caches__least_recently_used_discarded_above_cache_size(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(al.util.lens, "scaling_factors_cache_size", 2)
+        monkeypatch.setattr(al.util.lens, "scaling_factors_cache", OrderedDict())
+        monkeypatch.setattr(
+            al.util.lens, "scaling_factors_to_redshift_cache", OrderedDict()
+        )
+
+        scaling_factors = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0], cosmology=cosmo.Planck15
+        )
+
+        for source_redshift in [2.0, 3.0]:
+            al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+                plane_redshifts=[0.5, source_redshift], cosmology=cosmo.Planck15
+            )
+
+            al.util.lens.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+                plane_redshifts=[0.5, 1.0, 2.0],
+                redshift=source_redshift - 1.25,
+                cosmology=cosmo.Planck15,
+            )
+
+        al.util.lens.scaling_factors_to_redshift_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 2.0], redshift=1.5, cosmology=cosmo.Planck15
+        )
+
+        assert len(al.util.lens.scaling_factors_cache) == 2
+        assert len(al.util.lens.scaling_factors_to_redshift_cache) == 2
+        assert (
+            al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+                plane_redshifts=[0.5, 1.0], cosmology=cosmo.Planck15
+            )
+            is not scaling_factors
+        )
+
+
+class TestMassProfilesKey:
+    def test__identical_mass_profiles_give_equal_keys__different_parameters_or_redshifts_do_not(
+        self
+    ):
+        def planes_from_einstein_radius_and_redshift(einstein_radius, redshift):
+
+            lens_galaxy = al.Galaxy(
+                redshift=redshift,
+                light=al.lp.SphericalSersic(intensity=1.0),
+                mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            )
+            source_galaxy = al.Galaxy(
+                redshift=1.0, light=al.lp.SphericalSersic(intensity=2.0)
+            )
+
+            return [
+                al.Plane(galaxies=[lens_galaxy], redshift=redshift),
+                al.Plane(galaxies=[source_galaxy], redshift=1.0),
+            ]
+
+        key = al.util.lens.mass_profiles_key_from_planes(
+            planes=planes_from_einstein_radius_and_redshift(
+                einstein_radius=1.0, redshift=0.5
+            )
+        )
+
+        assert key == al.util.lens.mass_profiles_key_from_planes(
+            planes=planes_from_einstein_radius_and_redshift(
+                einstein_radius=1.0, redshift=0.5
+            )
+        )
+        assert key != al.util.lens.mass_profiles_key_from_planes(
+            planes=planes_from_einstein_radius_and_redshift(
+                einstein_radius=1.1, redshift=0.5
+            )
+        )
+        assert key != al.util.lens.mass_profiles_key_from_planes(
+            planes=planes_from_einstein_radius_and_redshift(
+                einstein_radius=1.0, redshift=0.6
+            )
+        )
+
+
 class TestGalaxyOrdering:
     def test__3_galaxies_reordered_in_ascending_redshift__planes_match_galaxy_redshifts(
         self
@@ -1,5 +1,6 @@
 from autoarray.operators import convolver, transformer
 import autolens as al
+from autolens.lens import ray_tracing
 import numpy as np
 
 
@@ -140,6 +141,7 @@ class TestMaskedImaging:
             positions=[1],
             positions_threshold=2,
             preload_sparse_grids_of_planes=3,
+            ray_tracing_uses_workspace=True,
         )
 
         masked_imaging_new = masked_imaging_7x7.binned_from_bin_up_factor(
@@ -149,6 +151,8 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions == [1]
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
+        assert masked_imaging_new.ray_tracing_uses_workspace == True
+        assert masked_imaging_new.grid.traced_grids_workspace is not None
 
         masked_imaging_new = masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
             signal_to_noise_limit=0.25
@@ -157,6 +161,30 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions == [1]
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
+        assert masked_imaging_new.ray_tracing_uses_workspace == True
+        assert masked_imaging_new.grid.traced_grids_workspace is not None
+
+    def test__ray_tracing_uses_workspace__workspace_attached_to_grid_and_blurring_grid(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.ray_tracing_uses_workspace == False
+        assert not hasattr(masked_imaging_7x7.grid, "traced_grids_workspace")
+
+        masked_imaging_7x7 = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, ray_tracing_uses_workspace=True
+        )
+
+        assert isinstance(
+            masked_imaging_7x7.grid.traced_grids_workspace,
+            ray_tracing.TracedGridsWorkspace,
+        )
+        assert isinstance(
+            masked_imaging_7x7.blurring_grid.traced_grids_workspace,
+            ray_tracing.TracedGridsWorkspace,
+        )
 
 
 class TestMaskedInterferometer:
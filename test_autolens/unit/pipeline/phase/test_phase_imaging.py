@@ -7,7 +7,9 @@ from astropy import cosmology as cosmo
 
 import autofit as af
 import autolens as al
+from autolens import exc
 from autolens.fit.fit import ImagingFit
+from autolens.pipeline.phase.dataset import likelihood_cache as lc
 from test_autolens.mock import mock_pipeline
 
 pytestmark = pytest.mark.filterwarnings(
@@ -339,3 +341,441 @@ class TestPhase:
         )
 
         assert fit.likelihood == fit_figure_of_merit
+
+    def test__fit_batch__figures_of_merit_match_fit_of_each_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        lens_galaxy = al.GalaxyModel(
+            redshift=0.5, light=al.lp.EllipticalSersic, mass=al.mp.SphericalIsothermal
+        )
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            cosmology=cosmo.Planck15,
+            sub_size=2,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        # A unit value of 0.5 traces a blurring pixel onto the source's centre, where its image depends on the
+        # direction of a traced coordinate of size ~1e-16 and agrees only to numerical precision.
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.3, 0.4, 0.7]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        assert figures_of_merit.shape == (3,)
+        assert figures_of_merit == pytest.approx(
+            [float(analysis.fit(instance=instance)) for instance in instances], 1.0e-8
+        )
+
+    def test__fit_batch__interpolated_deflections__figures_of_merit_match_fit_of_each_instance(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+        # Every deflection angle is interpolated, so that fitting with exact deflection angles would differ.
+        monkeypatch.setattr(al.Tracer, "deflections_interpolation_tolerance", None)
+
+        lens_galaxy = al.GalaxyModel(
+            redshift=0.5, light=al.lp.EllipticalSersic, mass=al.mp.EllipticalIsothermal
+        )
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            sub_size=2,
+            phase_name="test_phase",
+        )
+
+        phase_imaging_7x7.meta_imaging_fit.pixel_scale_interpolation_grid = 0.3
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.masked_imaging.grid.interpolator is not None
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.3, 0.5, 0.7]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        assert figures_of_merit == pytest.approx(
+            [float(analysis.fit(instance=instance)) for instance in instances], 1.0e-8
+        )
+
+    def test__tracers_with_identical_mass_profiles__share_traced_grids_cache(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        tracer_0 = analysis.tracer_for_instance(instance=instance)
+        traced_grids_0 = tracer_0.memoized_traced_grids_of_planes_from_grid(
+            grid=analysis.masked_imaging.grid
+        )
+
+        instance.galaxies.source.light.intensity = 2.0
+
+        tracer_1 = analysis.tracer_for_instance(instance=instance)
+        traced_grids_1 = tracer_1.memoized_traced_grids_of_planes_from_grid(
+            grid=analysis.masked_imaging.grid
+        )
+
+        assert tracer_1.traced_grids_cache is tracer_0.traced_grids_cache
+        assert traced_grids_1[1] is traced_grids_0[1]
+        assert not traced_grids_1[1].flags.writeable
+
+        instance.galaxies.lens.mass.einstein_radius = 3.0
+
+        tracer_2 = analysis.tracer_for_instance(instance=instance)
+
+        assert tracer_2.traced_grids_cache is not tracer_0.traced_grids_cache
+        assert len(analysis.traced_grids_caches) == 2
+
+    def test__rejection_cascade__low_resolution_likelihood_rejects_hopeless_models(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            low_resolution_bin_up_factor=2,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        rejection_cascade = analysis.rejection_cascade
+
+        assert rejection_cascade.low_resolution_masked_imaging.mask.pixel_scales == (
+            2.0,
+            2.0,
+        )
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        figure_of_merit = analysis.fit(instance=instance)
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+        fit = al.fit(masked_dataset=analysis.masked_imaging, tracer=tracer)
+
+        assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+        assert rejection_cascade.maximum_figure_of_merit == figure_of_merit
+
+        rejection_cascade.maximum_figure_of_merit = 1.0e8
+
+        with pytest.raises(exc.LikelihoodBoundException):
+            analysis.fit(instance=instance)
+
+        assert rejection_cascade.total_models == 2
+        assert rejection_cascade.total_evaluated["low_resolution_likelihood"] == 2
+        assert rejection_cascade.total_accepted["low_resolution_likelihood"] == 1
+        assert rejection_cascade.total_evaluated["positions"] == 0
+
+        rejection_cascade.output_counters()
+
+        file_rejection_cascade_info = "{}/{}".format(
+            phase_imaging_7x7.optimizer.paths.phase_output_path,
+            "rejection_cascade.info",
+        )
+
+        with open(file_rejection_cascade_info, "r") as rejection_cascade_info:
+            assert rejection_cascade_info.readline() == "Models = 2 \n"
+            assert rejection_cascade_info.readline() == "positions = 0 accepted of 0 \n"
+
+    def test__rejection_cascade__default_without_low_resolution_stage__figure_of_merit_independent_of_maximum(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        rejection_cascade = analysis.rejection_cascade
+
+        assert rejection_cascade.low_resolution_masked_imaging is None
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        figure_of_merit = analysis.fit(instance=instance)
+
+        rejection_cascade.maximum_figure_of_merit = 1.0e8
+
+        assert analysis.fit(instance=instance) == figure_of_merit
+        assert rejection_cascade.total_evaluated["low_resolution_likelihood"] == 0
+
+    def test__rejection_cascade__accepted_best_fit_model_never_rejected_at_default_margin(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            low_resolution_bin_up_factor=2,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        rejection_cascade = analysis.rejection_cascade
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.3, 0.5, 0.7]
+        ]
+
+        figures_of_merit = []
+
+        for instance in instances:
+            try:
+                figures_of_merit.append(analysis.fit(instance=instance))
+            except exc.LikelihoodBoundException:
+                figures_of_merit.append(-np.inf)
+
+        best_fit_instance = instances[int(np.argmax(figures_of_merit))]
+
+        assert rejection_cascade.maximum_figure_of_merit == max(figures_of_merit)
+
+        figure_of_merit_estimate = rejection_cascade.figure_of_merit_estimate_from_tracer(
+            tracer=analysis.tracer_for_instance(instance=best_fit_instance)
+        )
+
+        assert (
+            figure_of_merit_estimate
+            >= rejection_cascade.maximum_figure_of_merit
+            - rejection_cascade.low_resolution_likelihood_margin
+        )
+        assert analysis.fit(instance=best_fit_instance) == max(figures_of_merit)
+
+    def test__likelihood_cache__identical_instances_reuse_figure_of_merit(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            uses_likelihood_cache=True,
+            phase_name="test_phase_likelihood_cache",
+        )
+
+        file_likelihood_cache = "{}/{}".format(
+            phase_imaging_7x7.optimizer.paths.phase_output_path, "likelihood_cache.json"
+        )
+
+        if os.path.exists(file_likelihood_cache):
+            os.remove(file_likelihood_cache)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.5, 0.5, 0.7]
+        ]
+
+        figures_of_merit = [analysis.fit(instance=instance) for instance in instances]
+
+        assert figures_of_merit[0] == figures_of_merit[1]
+        assert figures_of_merit[0] != figures_of_merit[2]
+
+        tracer = analysis.tracer_for_instance(instance=instances[2])
+        fit = al.fit(masked_dataset=analysis.masked_imaging, tracer=tracer)
+
+        assert figures_of_merit[2] == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        likelihood_cache = analysis.likelihood_cache
+
+        assert likelihood_cache.hits == 1
+        assert likelihood_cache.misses == 2
+        assert likelihood_cache.hit_rate == pytest.approx(1.0 / 3.0, 1.0e-8)
+
+        analysis.output_likelihood_cache(during_analysis=True)
+
+        assert not os.path.exists(file_likelihood_cache)
+
+        analysis.output_likelihood_cache(during_analysis=False)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert len(analysis.likelihood_cache.figures_of_merit) == 2
+        assert analysis.fit(instance=instances[2]) == figures_of_merit[2]
+        assert analysis.likelihood_cache.hits == 1
+        assert analysis.likelihood_cache.misses == 0
+
+        class MockLikelihoodCache(lc.LikelihoodCache):
+            cache_size = 1
+
+        likelihood_cache = MockLikelihoodCache(
+            output_path=phase_imaging_7x7.optimizer.paths.phase_output_path
+        )
+
+        assert list(likelihood_cache.figures_of_merit) == [
+            "{}_{}".format(
+                analysis.likelihood_cache_state_key,
+                lc.parameters_key_from_instance(instance=instances[2]),
+            )
+        ]
+
+    def test__likelihood_cache__hyper_images_changed__figure_of_merit_not_reused(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            uses_likelihood_cache=True,
+            phase_name="test_phase_likelihood_cache_state",
+        )
+
+        file_likelihood_cache = "{}/{}".format(
+            phase_imaging_7x7.optimizer.paths.phase_output_path, "likelihood_cache.json"
+        )
+
+        if os.path.exists(file_likelihood_cache):
+            os.remove(file_likelihood_cache)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        analysis.fit(instance=instance)
+        analysis.output_likelihood_cache(during_analysis=False)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        hyper_image = np.ones(analysis.masked_imaging.image.shape)
+
+        analysis.hyper_model_image = hyper_image
+        analysis.hyper_galaxy_image_path_dict = {("galaxies", "source"): hyper_image}
+
+        analysis.fit(instance=instance)
+
+        assert analysis.likelihood_cache.hits == 0
+        assert analysis.likelihood_cache.misses == 1
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        analysis.fit(instance=instance)
+
+        assert analysis.likelihood_cache.hits == 1
+        assert analysis.likelihood_cache.misses == 0
+
+    def test__likelihood_cache__hits_update_rejection_cascade_maximum(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            uses_likelihood_cache=True,
+            phase_name="test_phase_likelihood_cache_maximum",
+        )
+
+        file_likelihood_cache = "{}/{}".format(
+            phase_imaging_7x7.optimizer.paths.phase_output_path, "likelihood_cache.json"
+        )
+
+        if os.path.exists(file_likelihood_cache):
+            os.remove(file_likelihood_cache)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        figure_of_merit = analysis.fit(instance=instance)
+        analysis.output_likelihood_cache(during_analysis=False)
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.rejection_cascade.maximum_figure_of_merit == -np.inf
+
+        assert analysis.fit(instance=instance) == figure_of_merit
+        assert analysis.likelihood_cache.hits == 1
+        assert analysis.rejection_cascade.maximum_figure_of_merit == figure_of_merit
+
+    def test__threads__tracers_use_threaded_executor_and_fit_unchanged(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+        source_galaxy = al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            cosmology=cosmo.Planck15,
+            threads=4,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+
+        assert analysis.executor.threads == 4
+        assert tracer.executor is analysis.executor
+        assert all(plane.executor is analysis.executor for plane in tracer.planes)
+
+        serial_tracer = al.Tracer.from_galaxies(galaxies=instance.galaxies)
+
+        assert tracer.profile_image_from_grid(
+            grid=analysis.masked_imaging.grid
+        ) == pytest.approx(
+            serial_tracer.profile_image_from_grid(grid=analysis.masked_imaging.grid),
+            1.0e-8,
+        )